@@ -65,10 +65,17 @@ class PipelineOrchestrator:
         """
         self.firestore = firestore_service or FirestoreService()
         self.a2a = a2a_client or A2AClient()
+        # Only close the A2A client if this orchestrator created it
+        self._owns_a2a = a2a_client is None
         
         self._start_time: Optional[float] = None
         self._total_tokens = 0
     
+    async def aclose(self) -> None:
+        """Close the A2A client if this orchestrator created it."""
+        if self._owns_a2a:
+            await self.a2a.aclose()
+    
     @property
     def elapsed_ms(self) -> int:
         """Get elapsed time in milliseconds."""
@@ -562,7 +569,10 @@ async def run_deep_pipeline(
         PipelineResult with success/failure status.
     """
     orchestrator = PipelineOrchestrator()
-    return await orchestrator.run_pipeline(estimate_id, clarification_output)
+    try:
+        return await orchestrator.run_pipeline(estimate_id, clarification_output)
+    finally:
+        await orchestrator.aclose()
 
 
 
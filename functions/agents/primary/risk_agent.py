@@ -434,7 +434,7 @@ ${base_cost:,.0f}
 - P80 (Conservative): ${mc_result.percentiles.p80:,.0f}
 - P90 (Pessimistic): ${mc_result.percentiles.p90:,.0f}
 - Standard Deviation: ${mc_result.statistics.std_dev:,.0f}
-- Coefficient of Variation: {mc_result.get_coefficient_of_variation():.1%}
+- Coefficient of Variation: {mc_result.coefficient_of_variation:.1%}
 
 ## Overall Risk Level: {risk_level}
 
@@ -501,7 +501,7 @@ Please provide your analysis in the required JSON format."""
             confidence += 0.05
         
         # Reasonable CV = higher confidence
-        cv = mc_result.get_coefficient_of_variation()
+        cv = mc_result.coefficient_of_variation
         if 0.05 <= cv <= 0.20:
             confidence += 0.05
         
@@ -14,6 +14,7 @@ Examples:
 """
 
 import asyncio
+import math
 import sys
 
 from services.cost_data_service import get_location_factors, REQUIRED_TRADES
@@ -59,7 +60,7 @@ async def demo(zip_code: str):
     pc = result.permit_costs
     print(f"   Base percentage: {pc.base_percentage:.1%} of project value")
     print(f"   Minimum fee: {format_currency(pc.minimum)}")
-    if pc.maximum:
+    if not math.isinf(pc.maximum):
         print(f"   Maximum fee: {format_currency(pc.maximum)}")
     print(f"   Inspection fee: {format_currency(pc.inspection_fee)}")
 
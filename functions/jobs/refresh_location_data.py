@@ -1,7 +1,7 @@
 """
 Location Data Refresh Job for TrueCost.
 
-Scheduled job that updates Firestore /costData/locationFactors/ with fresh data
+Scheduled job that updates Firestore /costData_locationFactors/ with fresh data
 from BLS and Weather APIs.
 
 Architecture:
@@ -24,6 +24,7 @@ import structlog
 
 from services.bls_service import get_labor_rates_for_zip, BLSResponse
 from services.weather_service import get_weather_factors, WeatherFactors
+from services.cost_data_service import LOCATION_FACTORS_COLLECTION
 
 logger = structlog.get_logger(__name__)
 
@@ -160,7 +161,7 @@ async def _update_firestore_location(
         }
 
         # Update or create the document
-        doc_ref = db.collection("costData").document("locationFactors").collection(zip_code).document("data")
+        doc_ref = db.collection(LOCATION_FACTORS_COLLECTION).document(zip_code)
         doc_ref.set(doc_data, merge=True)
 
         logger.info(
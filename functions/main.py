@@ -258,6 +258,8 @@ async def _start_pipeline_async(
             "status": "failed",
             "error": str(e)
         }
+    finally:
+        await orchestrator.aclose()
 
 
 @https_fn.on_request(
@@ -7,7 +7,7 @@ three-tier pricing (P50/P80/P90) for Monte Carlo compatibility.
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from models.bill_of_quantities import TradeCategory
 
@@ -52,8 +52,12 @@ class CostRange(BaseModel):
     
     These will be replaced by actual Monte Carlo simulation
     results when Dev 4's service is integrated.
+    
+    Instances are immutable; arithmetic returns a new range.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     low: float = Field(..., ge=0, description="P50 estimate - median (50th percentile)")
     medium: float = Field(..., ge=0, description="P80 estimate - conservative (80th percentile)")
     high: float = Field(..., ge=0, description="P90 estimate - pessimistic (90th percentile)")
@@ -93,8 +97,8 @@ class CostRange(BaseModel):
 
     @classmethod
     def zero(cls) -> "CostRange":
-        """Create a zero cost range."""
-        return cls(low=0.0, medium=0.0, high=0.0)
+        """Return the shared zero cost range."""
+        return _ZERO_COST_RANGE
 
     def __add__(self, other: "CostRange") -> "CostRange":
         """Add two cost ranges."""
@@ -121,6 +125,10 @@ class CostRange(BaseModel):
         }
 
 
+# Safe to share because CostRange is frozen
+_ZERO_COST_RANGE = CostRange(low=0.0, medium=0.0, high=0.0)
+
+
 # =============================================================================
 # UNIT COST WITH RANGE
 # =============================================================================
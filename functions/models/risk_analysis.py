@@ -5,9 +5,10 @@ Monte Carlo simulation results and risk factor identification.
 """
 
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator, model_validator
 
 
 # =============================================================================
@@ -72,15 +73,18 @@ class RiskFactor(BaseModel):
         ..., ge=0, le=1, description="Probability of occurrence (0-1)"
     )
     cost_impact_low: float = Field(
-        ..., ge=0, description="Minimum cost impact if risk occurs ($)"
+        ..., ge=0, serialization_alias="costImpactLow",
+        description="Minimum cost impact if risk occurs ($)"
     )
     cost_impact_high: float = Field(
-        ..., description="Maximum cost impact if risk occurs ($)"
+        ..., serialization_alias="costImpactHigh",
+        description="Maximum cost impact if risk occurs ($)"
     )
     
     # Variance contribution (calculated by Monte Carlo)
     variance_contribution: float = Field(
-        default=0.0, ge=0, le=1, description="Percentage of total variance"
+        default=0.0, ge=0, le=1, serialization_alias="varianceContribution",
+        description="Percentage of total variance"
     )
     
     # Mitigation
@@ -104,6 +108,55 @@ class RiskFactor(BaseModel):
         return self.probability * avg_impact
 
 
+def load_risk_factors(
+    items: Iterable[Dict[str, Any]],
+    trusted: bool = False,
+) -> List[RiskFactor]:
+    """Build RiskFactor models from stored dicts.
+
+    Args:
+        items: Risk factor dicts keyed by field name.
+        trusted: True for payloads this service wrote itself (e.g. a prior
+            RiskAnalysis read back from Firestore). Skips field and
+            model validation; only the enums are coerced.
+
+    Returns:
+        List of RiskFactor in input order.
+    """
+    if not trusted:
+        return [RiskFactor.model_validate(item) for item in items]
+
+    return [
+        RiskFactor.model_construct(
+            **{
+                **item,
+                "category": RiskCategory(item["category"]),
+                "impact": RiskImpact(item["impact"]),
+            }
+        )
+        for item in items
+    ]
+
+
+def risk_factor_arrays(
+    risk_factors: Sequence[RiskFactor],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Split risk factors into parallel float64 arrays for simulation.
+
+    Args:
+        risk_factors: Risk factors in simulation order.
+
+    Returns:
+        Tuple of (probabilities, cost_impact_lows, cost_impact_highs),
+        each indexed like ``risk_factors``.
+    """
+    n = len(risk_factors)
+    probs = np.fromiter((r.probability for r in risk_factors), dtype=np.float64, count=n)
+    lows = np.fromiter((r.cost_impact_low for r in risk_factors), dtype=np.float64, count=n)
+    highs = np.fromiter((r.cost_impact_high for r in risk_factors), dtype=np.float64, count=n)
+    return probs, lows, highs
+
+
 # =============================================================================
 # MONTE CARLO RESULTS MODEL
 # =============================================================================
@@ -146,6 +199,8 @@ class MonteCarloResult(BaseModel):
     Contains percentile values, statistics, and top risk contributors.
     """
     
+    model_config = ConfigDict(frozen=True)
+    
     # Simulation parameters
     iterations: int = Field(..., ge=100, description="Number of iterations run")
     seed: Optional[int] = Field(None, description="Random seed for reproducibility")
@@ -176,17 +231,29 @@ class MonteCarloResult(BaseModel):
         default_factory=list, description="Risk IDs sorted by variance contribution"
     )
     
-    def get_range_spread(self) -> float:
-        """Calculate P90/P50 ratio."""
+    @computed_field
+    @property
+    def range_spread(self) -> float:
+        """P90/P50 ratio."""
         if self.percentiles.p50 <= 0:
             return 0.0
         return self.percentiles.p90 / self.percentiles.p50
     
-    def get_coefficient_of_variation(self) -> float:
-        """Calculate CV = std_dev / mean."""
+    @computed_field
+    @property
+    def coefficient_of_variation(self) -> float:
+        """CV = std_dev / mean."""
         if self.statistics.mean <= 0:
             return 0.0
         return self.statistics.std_dev / self.statistics.mean
+    
+    def get_range_spread(self) -> float:
+        """Calculate P90/P50 ratio."""
+        return self.range_spread
+    
+    def get_coefficient_of_variation(self) -> float:
+        """Calculate CV = std_dev / mean."""
+        return self.coefficient_of_variation
 
 
 # =============================================================================
@@ -251,6 +318,14 @@ class RiskAnalysisSummary(BaseModel):
     )
 
 
+# Per-risk fields emitted by RiskAnalysis.to_agent_output
+_TOP_RISK_FIELDS = {
+    "id", "name", "description", "category", "impact", "probability",
+    "cost_impact_low", "cost_impact_high", "variance_contribution", "mitigation",
+}
+_ALL_RISK_FIELDS = {"id", "name", "category", "impact", "probability"}
+
+
 class RiskAnalysis(BaseModel):
     """Complete risk analysis output from Risk Agent.
     
@@ -299,6 +374,16 @@ class RiskAnalysis(BaseModel):
     
     def to_agent_output(self) -> Dict[str, Any]:
         """Convert to dict format for agent output storage."""
+        # Dump both risk lists in one pydantic-core pass (enums -> values,
+        # camelCase via serialization aliases) instead of per-field access.
+        risks = self.model_dump(
+            mode="json",
+            by_alias=True,
+            include={
+                "top_risks": {"__all__": _TOP_RISK_FIELDS},
+                "risk_factors": {"__all__": _ALL_RISK_FIELDS},
+            },
+        )
         return {
             "estimateId": self.estimate_id,
             "baseCost": self.base_cost,
@@ -323,30 +408,10 @@ class RiskAnalysis(BaseModel):
                 "confidenceLevel": self.contingency.confidence_level,
             },
             "topRisks": [
-                {
-                    "id": risk.id,
-                    "item": risk.name,
-                    "description": risk.description,
-                    "category": risk.category.value,
-                    "impact": risk.impact.value,
-                    "probability": risk.probability,
-                    "costImpactLow": risk.cost_impact_low,
-                    "costImpactHigh": risk.cost_impact_high,
-                    "varianceContribution": risk.variance_contribution,
-                    "mitigation": risk.mitigation,
-                }
-                for risk in self.top_risks
-            ],
-            "allRisks": [
-                {
-                    "id": risk.id,
-                    "name": risk.name,
-                    "category": risk.category.value,
-                    "impact": risk.impact.value,
-                    "probability": risk.probability,
-                }
-                for risk in self.risk_factors
+                {"id": risk["id"], "item": risk.pop("name"), **risk}
+                for risk in risks["top_risks"]
             ],
+            "allRisks": risks["risk_factors"],
             "confidenceRange": {
                 "p50": self.monte_carlo.percentiles.p50,
                 "p80": self.monte_carlo.percentiles.p80,
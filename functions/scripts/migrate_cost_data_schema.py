@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+One-time Cost Data Schema Migration for TrueCost Estimation Database.
+
+Copies documents from the legacy nested layout
+(/costData/{kind}/{id}/data) into the flat top-level collections
+(/costData_{kind}/{id}) read by the cost data service.
+
+Usage:
+    python migrate_cost_data_schema.py              # Copy legacy docs
+    python migrate_cost_data_schema.py --dry-run    # Count without writing
+    python migrate_cost_data_schema.py --delete     # Copy, then remove legacy docs
+
+References:
+- Story 4.4: Cost Data Seeding & Maintenance
+"""
+
+import argparse
+import sys
+
+from seed_cost_data import (
+    LABOR_RATES_COLLECTION,
+    LOCATION_FACTORS_COLLECTION,
+    MATERIALS_COLLECTION,
+    get_firestore_client,
+)
+
+# Legacy /costData/{document} -> flat collection
+LEGACY_TO_FLAT = (
+    ('materials', MATERIALS_COLLECTION),
+    ('laborRates', LABOR_RATES_COLLECTION),
+    ('locationFactors', LOCATION_FACTORS_COLLECTION),
+)
+
+# Firestore caps a write batch at 500 operations
+BATCH_SIZE = 500
+
+
+def migrate_kind(db, legacy_doc: str, flat_collection: str,
+                 dry_run: bool = False, delete: bool = False) -> int:
+    """Copy every /costData/{legacy_doc}/{id}/data document to /{flat_collection}/{id}."""
+    count = 0
+    batch = db.batch()
+    pending = 0
+
+    for sub in db.collection('costData').document(legacy_doc).collections():
+        legacy_ref = sub.document('data')
+        snapshot = legacy_ref.get()
+        if not snapshot.exists:
+            continue
+        count += 1
+        if dry_run:
+            continue
+
+        batch.set(db.collection(flat_collection).document(sub.id), snapshot.to_dict())
+        pending += 1
+        if delete:
+            batch.delete(legacy_ref)
+            pending += 1
+
+        if pending >= BATCH_SIZE - 1:
+            batch.commit()
+            batch = db.batch()
+            pending = 0
+
+    if pending:
+        batch.commit()
+
+    return count
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Migrate cost data to flat Firestore collections'
+    )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Count legacy documents without writing'
+    )
+    parser.add_argument(
+        '--delete',
+        action='store_true',
+        help='Delete legacy documents after copying'
+    )
+    args = parser.parse_args()
+
+    db = get_firestore_client()
+    if not db:
+        print("  Error: Could not connect to Firestore")
+        return 1
+
+    for legacy_doc, flat_collection in LEGACY_TO_FLAT:
+        count = migrate_kind(db, legacy_doc, flat_collection,
+                             dry_run=args.dry_run, delete=args.delete)
+        verb = 'Would migrate' if args.dry_run else 'Migrated'
+        print(f"  {verb} {count} docs: /costData/{legacy_doc}/ -> /{flat_collection}/")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
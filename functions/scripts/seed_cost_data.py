@@ -22,21 +22,35 @@ import time
 from pathlib import Path
 from typing import Dict, List, Optional
 
-# Optional tqdm for progress bars - graceful fallback
-try:
-    from tqdm import tqdm
-    HAS_TQDM = True
-except ImportError:
-    HAS_TQDM = False
-    def tqdm(iterable, **kwargs):
-        """Simple fallback for tqdm."""
-        desc = kwargs.get('desc', '')
-        total = kwargs.get('total', len(iterable) if hasattr(iterable, '__len__') else None)
-        for i, item in enumerate(iterable):
-            if total:
-                print(f"\r  {desc}: {i+1}/{total}", end='', flush=True)
-            yield item
-        print()  # newline after progress
+# Flat top-level collections, one document per item
+MATERIALS_COLLECTION = 'costData_materials'
+LABOR_RATES_COLLECTION = 'costData_laborRates'
+LOCATION_FACTORS_COLLECTION = 'costData_locationFactors'
+
+
+def _fallback_tqdm(iterable, **kwargs):
+    """Simple fallback for tqdm."""
+    desc = kwargs.get('desc', '')
+    total = kwargs.get('total', len(iterable) if hasattr(iterable, '__len__') else None)
+    for i, item in enumerate(iterable):
+        if total:
+            print(f"\r  {desc}: {i+1}/{total}", end='', flush=True)
+        yield item
+    print()  # newline after progress
+
+
+def tqdm(iterable, **kwargs):
+    """
+    Wrap an iterable in a progress bar.
+
+    tqdm is imported on first use so --help and --dry-run never pay for it;
+    falls back to a simple counter when tqdm is not installed.
+    """
+    try:
+        from tqdm import tqdm as _tqdm
+    except ImportError:
+        _tqdm = _fallback_tqdm
+    return _tqdm(iterable, **kwargs)
 
 
 def get_firestore_client():
@@ -123,9 +137,9 @@ def print_summary(stats: Dict):
     print()
     print("  Seeding Complete!")
     print("  -----------------")
-    print(f"  Materials:  {stats['materials']} documents in /costData/materials/")
-    print(f"  Labor:      {stats['labor_rates']} documents in /costData/laborRates/")
-    print(f"  Locations:  {stats['locations']} documents in /costData/locationFactors/")
+    print(f"  Materials:  {stats['materials']} documents in /costData_materials/")
+    print(f"  Labor:      {stats['labor_rates']} documents in /costData_laborRates/")
+    print(f"  Locations:  {stats['locations']} documents in /costData_locationFactors/")
     print()
     total = stats['materials'] + stats['labor_rates'] + stats['locations']
     print(f"  Total: {total} documents written")
@@ -141,7 +155,7 @@ def seed_materials(db, materials: List[Dict], dry_run: bool = False) -> int:
         doc_data = {k: v for k, v in material.items() if k != 'item_code'}
 
         if not dry_run:
-            db.collection('costData').document('materials').collection(item_code).document('data').set(doc_data)
+            db.collection(MATERIALS_COLLECTION).document(item_code).set(doc_data)
         count += 1
 
     return count
@@ -161,7 +175,7 @@ def seed_labor_rates(db, rates: List[Dict], dry_run: bool = False) -> int:
         }
 
         if not dry_run:
-            db.collection('costData').document('laborRates').collection(rate_id).document('data').set(doc_data)
+            db.collection(LABOR_RATES_COLLECTION).document(rate_id).set(doc_data)
         count += 1
 
     return count
@@ -184,12 +198,18 @@ def seed_locations(db, locations: List[Dict], dry_run: bool = False) -> int:
         }
 
         if not dry_run:
-            db.collection('costData').document('locationFactors').collection(zip_code).document('data').set(doc_data)
+            db.collection(LOCATION_FACTORS_COLLECTION).document(zip_code).set(doc_data)
         count += 1
 
     return count
 
 
+def _count_documents(collection_ref) -> int:
+    """Count documents server-side with a single count() aggregation."""
+    result = collection_ref.count().get()
+    return int(result[0][0].value)
+
+
 def verify_data(db) -> Dict:
     """Verify existing data in Firestore."""
     stats = {
@@ -201,33 +221,17 @@ def verify_data(db) -> Dict:
     print("  Verifying existing data...")
     print()
 
-    # Count materials
-    materials_ref = db.collection('costData').document('materials')
-    try:
-        # Get all subcollections
-        collections = materials_ref.collections()
-        for coll in collections:
-            stats['materials'] += 1
-    except Exception as e:
-        print(f"  Warning: Could not count materials: {e}")
-
-    # Count labor rates
-    labor_ref = db.collection('costData').document('laborRates')
-    try:
-        collections = labor_ref.collections()
-        for coll in collections:
-            stats['labor_rates'] += 1
-    except Exception as e:
-        print(f"  Warning: Could not count labor rates: {e}")
-
-    # Count locations
-    locations_ref = db.collection('costData').document('locationFactors')
-    try:
-        collections = locations_ref.collections()
-        for coll in collections:
-            stats['locations'] += 1
-    except Exception as e:
-        print(f"  Warning: Could not count locations: {e}")
+    targets = (
+        ('materials', MATERIALS_COLLECTION),
+        ('labor_rates', LABOR_RATES_COLLECTION),
+        ('locations', LOCATION_FACTORS_COLLECTION),
+    )
+    for stat_key, collection_name in targets:
+        try:
+            stats[stat_key] = _count_documents(db.collection(collection_name))
+        except Exception as e:
+            label = stat_key.replace('_', ' ')
+            print(f"  Warning: Could not count {label}: {e}")
 
     return stats
 
@@ -270,9 +274,9 @@ def main():
         print("  DRY RUN MODE - No data will be written")
         print()
         print("  Would seed:")
-        print(f"    - {len(data['materials'])} materials to /costData/materials/")
-        print(f"    - {len(data['labor_rates'])} labor rates to /costData/laborRates/")
-        print(f"    - {len(data['location_factors'])} locations to /costData/locationFactors/")
+        print(f"    - {len(data['materials'])} materials to /costData_materials/")
+        print(f"    - {len(data['labor_rates'])} labor rates to /costData_laborRates/")
+        print(f"    - {len(data['location_factors'])} locations to /costData_locationFactors/")
         print()
         print("=" * 60)
         return 0
@@ -7,21 +7,35 @@ material counts, CSI division coverage, labor rates, location factors,
 and BoQ coverage.
 
 Usage:
-    python verify_cost_data.py
+    python verify_cost_data.py              # Full report
+    python verify_cost_data.py --fast-fail  # Stop at first materials failure (CI)
 
 References:
 - Story 4.4: Cost Data Seeding & Maintenance
 - docs/sprint-artifacts/tech-spec-epic-4.md
 """
 
+import argparse
 import json
+import os
 import sys
+from array import array
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Set, Tuple
+
+import numpy as np
+
+# Fast JSON parsing - graceful fallback to stdlib json
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
 
 
 # Required CSI divisions for MVP
-REQUIRED_CSI_DIVISIONS = ['03', '04', '05', '06', '07', '08', '09', '10', '22', '23', '26', '31', '32']
+REQUIRED_CSI_DIVISIONS = ('03', '04', '05', '06', '07', '08', '09', '10', '22', '23', '26', '31', '32')
+REQUIRED_CSI_DIVISIONS_SET = frozenset(REQUIRED_CSI_DIVISIONS)
 
 # CSI division names
 CSI_DIVISION_NAMES = {
@@ -43,13 +57,18 @@ CSI_DIVISION_NAMES = {
 }
 
 # Required trades
-REQUIRED_TRADES = [
+REQUIRED_TRADES = (
     'electrician', 'plumber', 'carpenter', 'hvac_tech',
     'roofer', 'painter', 'tile_setter', 'general_labor'
-]
+)
 
 # Required regions
-REQUIRED_REGIONS = ['northeast', 'midwest', 'south', 'west']
+REQUIRED_REGIONS = ('northeast', 'midwest', 'south', 'west')
+
+# Every required (trade, region) combination, built once per process
+REQUIRED_TRADE_REGION_PAIRS = frozenset(
+    (t, r) for t in REQUIRED_TRADES for r in REQUIRED_REGIONS
+)
 
 # Required major metros with their zip codes
 REQUIRED_METROS = {
@@ -62,55 +81,43 @@ REQUIRED_METROS = {
     '98101': 'Seattle',
     '30301': 'Atlanta'
 }
+REQUIRED_METROS_SET = frozenset(REQUIRED_METROS)
+REQUIRED_METROS_BY_NAME = tuple(sorted(REQUIRED_METROS.items(), key=lambda x: x[1]))
 
 # Required RSMeans schema fields for materials
-REQUIRED_MATERIAL_FIELDS = [
+REQUIRED_MATERIAL_FIELDS = (
     'item_code', 'description', 'unit', 'unit_cost', 'labor_hours',
     'crew', 'crew_daily_output', 'productivity_factor',
     'cost_low', 'cost_likely', 'cost_high', 'csi_division', 'subdivision'
-]
+)
+REQUIRED_MATERIAL_FIELDS_SET = frozenset(REQUIRED_MATERIAL_FIELDS)
 
 
-def load_json_data(data_dir: Path) -> Dict:
-    """Load all JSON data files from the data directory."""
-    data = {}
+def _iter_items(path: Path, key: str) -> Iterator[Dict]:
+    """
+    Yield the items of the list stored under ``key`` in a JSON data file.
 
-    materials_path = data_dir / 'materials.json'
-    if materials_path.exists():
-        with open(materials_path) as f:
-            data['materials'] = json.load(f)['materials']
-    else:
-        data['materials'] = []
+    Streams items with ijson (C yajl2 backend when available) so only one
+    item is alive at a time. Without ijson the whole file is parsed with
+    orjson, or stdlib json as a last resort. Missing files yield nothing.
+    """
+    if not path.exists():
+        return
 
-    labor_path = data_dir / 'labor_rates.json'
-    if labor_path.exists():
-        with open(labor_path) as f:
-            data['labor_rates'] = json.load(f)['labor_rates']
-    else:
-        data['labor_rates'] = []
+    try:
+        import ijson
+    except ImportError:
+        with open(path, 'rb') as f:
+            yield from _loads(f.read())[key]
+        return
 
-    location_path = data_dir / 'location_factors.json'
-    if location_path.exists():
-        with open(location_path) as f:
-            data['location_factors'] = json.load(f)['location_factors']
-    else:
-        data['location_factors'] = []
-
-    kitchen_path = data_dir / 'sample_boq_kitchen.json'
-    if kitchen_path.exists():
-        with open(kitchen_path) as f:
-            data['boq_kitchen'] = json.load(f)['line_items']
-    else:
-        data['boq_kitchen'] = []
+    with open(path, 'rb') as f:
+        yield from ijson.items(f, f'{key}.item', use_float=True)
 
-    bathroom_path = data_dir / 'sample_boq_bathroom.json'
-    if bathroom_path.exists():
-        with open(bathroom_path) as f:
-            data['boq_bathroom'] = json.load(f)['line_items']
-    else:
-        data['boq_bathroom'] = []
 
-    return data
+def _load_items(path: Path, key: str) -> List[Dict]:
+    """Load the list stored under ``key`` in a JSON data file."""
+    return list(_iter_items(path, key))
 
 
 def print_header():
@@ -121,81 +128,142 @@ def print_header():
     print()
 
 
-def verify_materials(materials: List[Dict]) -> Tuple[bool, Dict]:
-    """Verify materials data meets all criteria."""
-    results = {
-        'count': len(materials),
-        'by_division': {},
-        'schema_complete': 0,
-        'schema_errors': [],
-        'monte_carlo_valid': 0,
-        'monte_carlo_errors': []
-    }
-
-    # Count by CSI division
-    for material in materials:
-        div = material.get('csi_division', 'unknown')
-        if div not in results['by_division']:
-            results['by_division'][div] = 0
-        results['by_division'][div] += 1
-
-        # Check schema completeness
-        missing_fields = [f for f in REQUIRED_MATERIAL_FIELDS if f not in material]
-        if not missing_fields:
-            results['schema_complete'] += 1
+class MaterialAccumulator:
+    """
+    Single-pass materials verifier.
+
+    ``feed`` takes one material at a time (division count, schema check,
+    item code) and keeps only the three cost floats, so callers can stream
+    a catalog without holding the material dicts. ``finalize`` runs the
+    Monte Carlo check over the cost buffers and returns (passed, results).
+    With fast_fail, ``feed`` also checks each row's cost range so the stream
+    can stop at the first bad row.
+    """
+
+    def __init__(self, fast_fail: bool = False):
+        self.fast_fail = fast_fail
+        self.by_division: Counter = Counter()
+        self.item_codes: List[str] = []
+        self.schema_complete = 0
+        self.schema_errors: List[Dict] = []
+        self.monte_carlo_errors: List[Dict] = []
+        self._cost_low = array('d')
+        self._cost_likely = array('d')
+        self._cost_high = array('d')
+
+    @property
+    def failed(self) -> bool:
+        """True once a fast-fail check has tripped and feeding can stop."""
+        return self.fast_fail and bool(self.schema_errors or self.monte_carlo_errors)
+
+    def feed(self, material: Dict) -> None:
+        """Account for one material."""
+        item_code = material.get('item_code', 'unknown')
+        self.by_division[material.get('csi_division', 'unknown')] += 1
+        self.item_codes.append(item_code)
+
+        if REQUIRED_MATERIAL_FIELDS_SET <= material.keys():
+            self.schema_complete += 1
         else:
-            results['schema_errors'].append({
-                'item_code': material.get('item_code', 'unknown'),
-                'missing': missing_fields
+            self.schema_errors.append({
+                'item_code': item_code,
+                'missing': [f for f in REQUIRED_MATERIAL_FIELDS if f not in material]
             })
 
-        # Check Monte Carlo validity (cost_low <= cost_likely <= cost_high)
-        cost_low = material.get('cost_low', 0)
-        cost_likely = material.get('cost_likely', 0)
-        cost_high = material.get('cost_high', 0)
-        if cost_low <= cost_likely <= cost_high:
-            results['monte_carlo_valid'] += 1
-        else:
+        low = material.get('cost_low', 0)
+        likely = material.get('cost_likely', 0)
+        high = material.get('cost_high', 0)
+        self._cost_low.append(low)
+        self._cost_likely.append(likely)
+        self._cost_high.append(high)
+
+        if self.fast_fail and not low <= likely <= high:
+            self.monte_carlo_errors.append({
+                'item_code': item_code,
+                'low': low,
+                'likely': likely,
+                'high': high
+            })
+
+    def finalize(self) -> Tuple[bool, Dict]:
+        """Run the remaining whole-catalog checks and build the results dict."""
+        results = {
+            'count': len(self.item_codes),
+            'item_codes': frozenset(self.item_codes),
+            'by_division': dict(self.by_division),
+            'schema_complete': self.schema_complete,
+            'schema_errors': self.schema_errors,
+            'monte_carlo_valid': 0,
+            'monte_carlo_errors': list(self.monte_carlo_errors)
+        }
+
+        results['sorted_divisions'] = sorted(results['by_division'])
+
+        # A fast-fail stop means only part of the catalog was read, so the
+        # count/division verdict would be meaningless: report just the error
+        # that stopped the stream
+        if self.failed:
+            results['missing_divisions'] = []
+            return False, results
+
+        # Check all required divisions present
+        missing_divisions = [d for d in REQUIRED_CSI_DIVISIONS if d not in results['by_division']]
+        results['missing_divisions'] = missing_divisions
+        if self.fast_fail and (results['count'] < 100 or missing_divisions):
+            return False, results
+
+        # Check Monte Carlo validity (cost_low <= cost_likely <= cost_high), vectorized
+        cost_low = np.frombuffer(self._cost_low, dtype=np.float64)
+        cost_likely = np.frombuffer(self._cost_likely, dtype=np.float64)
+        cost_high = np.frombuffer(self._cost_high, dtype=np.float64)
+        valid = (cost_low <= cost_likely) & (cost_likely <= cost_high)
+        results['monte_carlo_valid'] = int(valid.sum())
+        invalid = np.flatnonzero(~valid).tolist()
+        for i in invalid[:1] if self.fast_fail else invalid:
             results['monte_carlo_errors'].append({
-                'item_code': material.get('item_code', 'unknown'),
-                'low': cost_low,
-                'likely': cost_likely,
-                'high': cost_high
+                'item_code': self.item_codes[i],
+                'low': self._cost_low[i],
+                'likely': self._cost_likely[i],
+                'high': self._cost_high[i]
             })
 
-    # Check all required divisions present
-    missing_divisions = [d for d in REQUIRED_CSI_DIVISIONS if d not in results['by_division']]
-    results['missing_divisions'] = missing_divisions
+        passed = (
+            results['count'] >= 100 and
+            len(missing_divisions) == 0 and
+            results['schema_complete'] == results['count'] and
+            results['monte_carlo_valid'] == results['count']
+        )
 
-    passed = (
-        results['count'] >= 100 and
-        len(missing_divisions) == 0 and
-        results['schema_complete'] == results['count'] and
-        results['monte_carlo_valid'] == results['count']
-    )
+        return passed, results
 
-    return passed, results
+
+def verify_materials(materials: Iterable[Dict], fast_fail: bool = False) -> Tuple[bool, Dict]:
+    """
+    Verify materials data meets all criteria.
+
+    With fast_fail, stops at the first failing check instead of collecting
+    every error (results then only hold the errors found so far).
+    """
+    acc = MaterialAccumulator(fast_fail=fast_fail)
+    for material in materials:
+        acc.feed(material)
+        if acc.failed:
+            break
+    return acc.finalize()
 
 
 def verify_labor_rates(rates: List[Dict]) -> Tuple[bool, Dict]:
     """Verify labor rates data meets all criteria."""
+    pairs = {(rate.get('trade', ''), rate.get('region', '')) for rate in rates}
     results = {
         'count': len(rates),
-        'trades': set(),
-        'regions': set(),
-        'trade_region_pairs': set()
+        'trades': {trade for trade, _ in pairs},
+        'regions': {region for _, region in pairs},
+        'trade_region_pairs': pairs
     }
 
-    for rate in rates:
-        trade = rate.get('trade', '')
-        region = rate.get('region', '')
-        results['trades'].add(trade)
-        results['regions'].add(region)
-        results['trade_region_pairs'].add((trade, region))
-
     # Check all required trade-region combinations
-    expected_pairs = {(t, r) for t in REQUIRED_TRADES for r in REQUIRED_REGIONS}
-    missing_pairs = expected_pairs - results['trade_region_pairs']
+    missing_pairs = REQUIRED_TRADE_REGION_PAIRS - results['trade_region_pairs']
     results['missing_pairs'] = list(missing_pairs)
 
     passed = len(missing_pairs) == 0 and results['count'] >= 32
@@ -203,33 +271,26 @@ def verify_labor_rates(rates: List[Dict]) -> Tuple[bool, Dict]:
     return passed, results
 
 
-def verify_locations(locations: List[Dict]) -> Tuple[bool, Dict]:
-    """Verify location factors data meets all criteria."""
+def verify_locations(locations: Iterable[Dict]) -> Tuple[bool, Dict]:
+    """Verify location factors data meets all criteria in a single pass."""
     results = {
-        'count': len(locations),
+        'count': 0,
         'by_region': {},
         'zip_codes': set(),
-        'metros_found': {},
-        'metros_missing': []
     }
 
     for location in locations:
-        region = location.get('region_code', 'unknown')
         zip_code = location.get('zip_code', '')
-
-        if region not in results['by_region']:
-            results['by_region'][region] = []
-        results['by_region'][region].append(zip_code)
+        results['count'] += 1
         results['zip_codes'].add(zip_code)
+        results['by_region'].setdefault(location.get('region_code', 'unknown'), []).append(zip_code)
 
-        # Check if this is a required metro
-        if zip_code in REQUIRED_METROS:
-            results['metros_found'][zip_code] = REQUIRED_METROS[zip_code]
+    results['sorted_regions'] = sorted(results['by_region'])
 
-    # Find missing metros
-    for zip_code, name in REQUIRED_METROS.items():
-        if zip_code not in results['zip_codes']:
-            results['metros_missing'].append((zip_code, name))
+    # Required metros present / missing
+    zip_codes = results['zip_codes']
+    results['metros_found'] = {z: REQUIRED_METROS[z] for z in REQUIRED_METROS_SET & zip_codes}
+    results['metros_missing'] = [(z, REQUIRED_METROS[z]) for z in sorted(REQUIRED_METROS_SET - zip_codes)]
 
     passed = (
         results['count'] >= 50 and
@@ -239,17 +300,16 @@ def verify_locations(locations: List[Dict]) -> Tuple[bool, Dict]:
     return passed, results
 
 
-def verify_boq_coverage(boq_items: List[Dict], materials: List[Dict], name: str) -> Tuple[bool, Dict]:
-    """Verify BoQ can be fully costed from materials."""
-    material_codes = {m['item_code'] for m in materials}
-
+def verify_boq_coverage(boq_items: Iterable[Dict], material_codes: FrozenSet[str], name: str) -> Tuple[bool, Dict]:
+    """Verify BoQ can be fully costed from the given material item codes."""
     results = {
-        'total_items': len(boq_items),
+        'total_items': 0,
         'found': 0,
         'missing': []
     }
 
     for item in boq_items:
+        results['total_items'] += 1
         item_code = item.get('item_code', '')
         if item_code in material_codes:
             results['found'] += 1
@@ -266,10 +326,10 @@ def print_materials_report(results: Dict):
     """Print materials verification report."""
     print("  Materials by CSI Division:")
     print("  --------------------------")
-    for div in sorted(results['by_division'].keys()):
+    for div in results['sorted_divisions']:
         count = results['by_division'][div]
         name = CSI_DIVISION_NAMES.get(div, 'Unknown')
-        marker = "  " if div in REQUIRED_CSI_DIVISIONS else "* "
+        marker = "  " if div in REQUIRED_CSI_DIVISIONS_SET else "* "
         print(f"  {marker}Division {div} ({name}): {count:>3} items")
     print("  --------------------------")
     print(f"    Total: {results['count']} materials")
@@ -282,7 +342,7 @@ def print_locations_report(results: Dict):
     """Print locations verification report."""
     print("  Locations by Region:")
     print("  --------------------")
-    for region in sorted(results['by_region'].keys()):
+    for region in results['sorted_regions']:
         count = len(results['by_region'][region])
         print(f"    {region.capitalize()}: {count} zip codes")
     print("  --------------------")
@@ -290,7 +350,7 @@ def print_locations_report(results: Dict):
     print()
 
     print("  Major Metros Covered:")
-    for zip_code, name in sorted(REQUIRED_METROS.items(), key=lambda x: x[1]):
+    for zip_code, name in REQUIRED_METROS_BY_NAME:
         found = zip_code in results['metros_found']
         marker = "[x]" if found else "[ ]"
         print(f"    {marker} {name} ({zip_code})")
@@ -310,22 +370,41 @@ def print_boq_report(kitchen_results: Dict, bathroom_results: Dict):
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Verify construction cost data files'
+    )
+    parser.add_argument(
+        '--fast-fail',
+        action='store_true',
+        default=os.environ.get('CI_FAST_FAIL') == '1',
+        help='Stop at the first materials failure (default on when CI_FAST_FAIL=1)'
+    )
+    args = parser.parse_args()
+
     data_dir = Path(__file__).parent.parent / 'data'
 
     print_header()
 
-    # Load data
-    data = load_json_data(data_dir)
-
     all_passed = True
 
-    # Verify materials
-    mat_passed, mat_results = verify_materials(data['materials'])
+    # Verify materials, streaming the catalog straight into the accumulator
+    mat_passed, mat_results = verify_materials(
+        _iter_items(data_dir / 'materials.json', 'materials'), fast_fail=args.fast_fail
+    )
+    if args.fast_fail and not mat_passed:
+        print("  VERIFICATION FAILED (fast-fail: materials)")
+        for error in mat_results['schema_errors'] + mat_results['monte_carlo_errors']:
+            print(f"    {error}")
+        if mat_results['missing_divisions']:
+            print(f"    MISSING DIVISIONS: {mat_results['missing_divisions']}")
+        return 1
     print_materials_report(mat_results)
     all_passed = all_passed and mat_passed
 
     # Verify labor rates
-    labor_passed, labor_results = verify_labor_rates(data['labor_rates'])
+    labor_passed, labor_results = verify_labor_rates(
+        _load_items(data_dir / 'labor_rates.json', 'labor_rates')
+    )
     print(f"  Labor Rates: {labor_results['count']} rates")
     print(f"    Trades: {len(labor_results['trades'])}/8")
     print(f"    Regions: {len(labor_results['regions'])}/4")
@@ -335,16 +414,19 @@ def main():
     all_passed = all_passed and labor_passed
 
     # Verify locations
-    loc_passed, loc_results = verify_locations(data['location_factors'])
+    loc_passed, loc_results = verify_locations(
+        _iter_items(data_dir / 'location_factors.json', 'location_factors')
+    )
     print_locations_report(loc_results)
     all_passed = all_passed and loc_passed
 
     # Verify BoQ coverage
+    material_codes = mat_results['item_codes']
     kitchen_passed, kitchen_results = verify_boq_coverage(
-        data['boq_kitchen'], data['materials'], 'Kitchen'
+        _iter_items(data_dir / 'sample_boq_kitchen.json', 'line_items'), material_codes, 'Kitchen'
     )
     bathroom_passed, bathroom_results = verify_boq_coverage(
-        data['boq_bathroom'], data['materials'], 'Bathroom'
+        _iter_items(data_dir / 'sample_boq_bathroom.json', 'line_items'), material_codes, 'Bathroom'
     )
     print_boq_report(kitchen_results, bathroom_results)
     all_passed = all_passed and kitchen_passed and bathroom_passed
@@ -5,78 +5,117 @@ This package contains service implementations:
 - LLMService: LangChain/OpenAI wrapper
 - A2AClient: Agent-to-Agent protocol client
 - CostDataService: Location-based cost data (mock)
+- Location, Monte Carlo, PDF, BLS and weather data services
+
+Every re-export is resolved lazily (PEP 562): each submodule is imported on
+first attribute access, so a function that only needs one service does not
+pay for numpy, httpx, weasyprint, etc.
 """
 
-from services.firestore_service import FirestoreService
-from services.llm_service import LLMService
-from services.a2a_client import A2AClient
-from services.cost_data_service import CostDataService
+import importlib
+
+# Exported name -> (submodule, attribute in that submodule)
+_LAZY_EXPORTS = {
+    # Core services
+    "FirestoreService": ("firestore_service", "FirestoreService"),
+    "LLMService": ("llm_service", "LLMService"),
+    "A2AClient": ("a2a_client", "A2AClient"),
+    "CostDataService": ("cost_data_service", "CostDataService"),
+    "lookup_cost_codes_by_keyword": ("cost_data_service", "lookup_cost_codes_by_keyword"),
+    "lookup_cost_codes_by_division": ("cost_data_service", "lookup_cost_codes_by_division"),
+    "lookup_cost_codes_by_prefix": ("cost_data_service", "lookup_cost_codes_by_prefix"),
+    # Location Intelligence / Cost Data Service
+    "LocationFactors": ("cost_data_service", "LocationFactors"),
+    "PermitCosts": ("cost_data_service", "PermitCosts"),
+    "WeatherFactors": ("cost_data_service", "WeatherFactors"),
+    "LaborRate": ("cost_data_service", "LaborRate"),
+    "MaterialCost": ("cost_data_service", "MaterialCost"),
+    "ItemNotFoundError": ("cost_data_service", "ItemNotFoundError"),
+    "get_location_factors": ("cost_data_service", "get_location_factors"),
+    "get_location_factors_many": ("cost_data_service", "get_location_factors_many"),
+    "warm_location_cache": ("cost_data_service", "warm_location_cache"),
+    "get_material_cost": ("cost_data_service", "get_material_cost"),
+    "get_labor_rate": ("cost_data_service", "get_labor_rate"),
+    "get_labor_rates_bulk": ("cost_data_service", "get_labor_rates_bulk"),
+    "search_materials": ("cost_data_service", "search_materials"),
+    "material_indices": ("cost_data_service", "material_indices"),
+    "materials_by_indices": ("cost_data_service", "materials_by_indices"),
+    "material_indices_where": ("cost_data_service", "material_indices_where"),
+    # Monte Carlo Service
+    "LineItemInput": ("monte_carlo", "LineItemInput"),
+    "RiskFactor": ("monte_carlo", "RiskFactor"),
+    "HistogramBin": ("monte_carlo", "HistogramBin"),
+    "MonteCarloResult": ("monte_carlo", "MonteCarloResult"),
+    "run_simulation": ("monte_carlo", "run_simulation"),
+    "create_line_item": ("monte_carlo", "create_line_item"),
+    # PDF Generator Service
+    "PDFGenerationRequest": ("pdf_generator", "PDFGenerationRequest"),
+    "PDFGenerationResult": ("pdf_generator", "PDFGenerationResult"),
+    "generate_pdf": ("pdf_generator", "generate_pdf"),
+    "generate_pdf_local": ("pdf_generator", "generate_pdf_local"),
+    "get_available_sections": ("pdf_generator", "get_available_sections"),
+    "validate_sections": ("pdf_generator", "validate_sections"),
+    # Story 4.5: Real Data Integration
+    "BLSLaborRate": ("bls_service", "BLSLaborRate"),
+    "BLSResponse": ("bls_service", "BLSResponse"),
+    "SOC_CODE_MAP": ("bls_service", "SOC_CODE_MAP"),
+    "MSA_CODE_MAP": ("bls_service", "MSA_CODE_MAP"),
+    "get_labor_rates_for_zip": ("bls_service", "get_labor_rates_for_zip"),
+    "get_single_trade_rate": ("bls_service", "get_single_trade_rate"),
+    "get_all_trades": ("bls_service", "get_all_trades"),
+    "get_soc_code": ("bls_service", "get_soc_code"),
+    "get_msa_for_zip": ("bls_service", "get_msa_for_zip"),
+    "OpenMeteoWeatherFactors": ("weather_service", "WeatherFactors"),
+    "get_weather_factors_from_api": ("weather_service", "get_weather_factors"),
+    "compare_weather_factors": ("weather_service", "compare_weather_factors"),
+    "calculate_winter_slowdown": ("weather_service", "calculate_winter_slowdown"),
+    "calculate_summer_premium": ("weather_service", "calculate_summer_premium"),
+    "identify_rainy_months": ("weather_service", "identify_rainy_months"),
+}
+
+
+def __getattr__(name):
+    """Import the submodule behind a lazy export on first access."""
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
 
-__all__ = ["FirestoreService", "LLMService", "A2AClient", "CostDataService"]
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
-# TrueCost Services
-from .cost_data_service import (
-    LocationFactors,
-    PermitCosts,
-    WeatherFactors,
-    LaborRate,
-    MaterialCost,
-    ItemNotFoundError,
-    get_location_factors,
-    get_material_cost,
-    get_labor_rate,
-    search_materials,
-)
-from .monte_carlo import (
-    LineItemInput,
-    RiskFactor,
-    HistogramBin,
-    MonteCarloResult,
-    run_simulation,
-    create_line_item,
-)
-from .pdf_generator import (
-    PDFGenerationRequest,
-    PDFGenerationResult,
-    generate_pdf,
-    generate_pdf_local,
-    get_available_sections,
-    validate_sections,
-)
-# Story 4.5: Real Data Integration
-from .bls_service import (
-    BLSLaborRate,
-    BLSResponse,
-    SOC_CODE_MAP,
-    MSA_CODE_MAP,
-    get_labor_rates_for_zip,
-    get_single_trade_rate,
-    get_all_trades,
-    get_soc_code,
-    get_msa_for_zip,
-)
-from .weather_service import (
-    WeatherFactors as OpenMeteoWeatherFactors,
-    get_weather_factors as get_weather_factors_from_api,
-    compare_weather_factors,
-    calculate_winter_slowdown,
-    calculate_summer_premium,
-    identify_rainy_months,
-)
 
 __all__ = [
+    # Core services
+    "FirestoreService",
+    "LLMService",
+    "A2AClient",
+    "CostDataService",
+    "lookup_cost_codes_by_keyword",
+    "lookup_cost_codes_by_division",
+    "lookup_cost_codes_by_prefix",
     # Location Intelligence Service
     "LocationFactors",
     "PermitCosts",
     "WeatherFactors",
     "LaborRate",
     "get_location_factors",
+    "get_location_factors_many",
+    "warm_location_cache",
     # Cost Data Service (Story 4.2)
     "MaterialCost",
     "ItemNotFoundError",
     "get_material_cost",
     "get_labor_rate",
+    "get_labor_rates_bulk",
     "search_materials",
+    "material_indices",
+    "materials_by_indices",
+    "material_indices_where",
     # Monte Carlo Service (Story 4.2)
     "LineItemInput",
     "RiskFactor",
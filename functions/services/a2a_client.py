@@ -4,12 +4,14 @@ Implements the Agent2Agent (A2A) protocol for inter-agent communication
 using JSON-RPC 2.0 message format.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
 from uuid import uuid4
 import asyncio
 import importlib
+import itertools
 import structlog
 import httpx
+import orjson
 
 # NOTE: `config/__init__.py` re-exports a `settings` attribute (a Settings instance),
 # which can shadow the `config.settings` *module* in some import patterns.
@@ -19,6 +21,9 @@ from config.errors import A2AError, ErrorCode
 
 logger = structlog.get_logger()
 
+# JSON-RPC requests are serialized with orjson and sent as raw content
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class A2AClient:
     """Client for A2A protocol communication between agents.
@@ -41,10 +46,69 @@ class A2AClient:
 
         self.base_url = base_url or default_base_url
         self.timeout = timeout or default_timeout
+        
+        # Request IDs: random per-client prefix + monotonic counter
+        self._id_prefix = uuid4().hex[:8]
+        self._id_counter = itertools.count()
+        
+        # Pooled HTTP client, created lazily and bound to one event loop
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client for the running event loop.
+        
+        Reusing one client keeps connections to base_url alive across
+        calls instead of paying a new TCP/TLS handshake per request. A new
+        client is created if the previous one was closed or belongs to a
+        different event loop (e.g. a later asyncio.run()).
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._release_stale_client()
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=float(self.timeout),
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            )
+            self._client_loop = loop
+        return self._client
+    
+    def _release_stale_client(self) -> None:
+        """Close or abandon a pooled client bound to another event loop.
+        
+        The old client's connections belong to the loop that opened them,
+        so it can only be closed on that loop. If the loop is still running
+        (in another thread) the close is scheduled there; once the loop is
+        closed its transports are already gone and the client can only be
+        dropped so it does not pin the dead loop.
+        """
+        old_client, old_loop = self._client, self._client_loop
+        self._client = None
+        self._client_loop = None
+        if old_client is None or old_client.is_closed or old_loop is None:
+            return
+        if old_loop.is_running() and not old_loop.is_closed():
+            asyncio.run_coroutine_threadsafe(old_client.aclose(), old_loop)
+        else:
+            logger.debug("a2a_client_abandoned", base_url=self.base_url)
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+    
+    async def __aenter__(self) -> "A2AClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
     
     def _create_request_id(self) -> str:
-        """Generate unique request ID."""
-        return str(uuid4())
+        """Generate a request ID unique within this client."""
+        return f"{self._id_prefix}-{next(self._id_counter)}"
     
     def _build_a2a_request(
         self,
@@ -112,41 +176,30 @@ class A2AClient:
         
         endpoint = f"{self.base_url}/a2a_{target_agent}"
         
-        logger.info(
-            "a2a_send_task",
-            target_agent=target_agent,
-            request_id=request_id,
-            thread_id=thread_id,
-            endpoint=endpoint
-        )
+        # Bind the fields shared by every event for this request once
+        log = logger.bind(target_agent=target_agent, request_id=request_id)
+        log.info("a2a_send_task", thread_id=thread_id, endpoint=endpoint)
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    endpoint,
-                    json=payload,
-                    timeout=float(self.timeout)
-                )
-                
-                response.raise_for_status()
-                result = response.json()
-                
-                logger.info(
-                    "a2a_task_response",
-                    target_agent=target_agent,
-                    request_id=request_id,
-                    status=result.get("result", {}).get("status", "unknown")
-                )
-                
-                return result
+            response = await self._get_client().post(
+                endpoint,
+                content=orjson.dumps(payload),
+                headers=_JSON_HEADERS,
+                timeout=float(self.timeout)
+            )
+            
+            response.raise_for_status()
+            result = orjson.loads(response.content)
+            
+            log.info(
+                "a2a_task_response",
+                status=result.get("result", {}).get("status", "unknown")
+            )
+            
+            return result
                 
         except httpx.TimeoutException:
-            logger.error(
-                "a2a_timeout",
-                target_agent=target_agent,
-                request_id=request_id,
-                timeout=self.timeout
-            )
+            log.error("a2a_timeout", timeout=self.timeout)
             raise A2AError(
                 code=ErrorCode.A2A_TIMEOUT,
                 message=f"A2A request to {target_agent} timed out after {self.timeout}s",
@@ -155,12 +208,7 @@ class A2AClient:
             )
             
         except httpx.ConnectError as e:
-            logger.error(
-                "a2a_connection_error",
-                target_agent=target_agent,
-                request_id=request_id,
-                error=str(e)
-            )
+            log.error("a2a_connection_error", error=str(e))
             raise A2AError(
                 code=ErrorCode.A2A_CONNECTION_ERROR,
                 message=f"Failed to connect to {target_agent}",
@@ -169,10 +217,8 @@ class A2AClient:
             )
             
         except httpx.HTTPStatusError as e:
-            logger.error(
+            log.error(
                 "a2a_http_error",
-                target_agent=target_agent,
-                request_id=request_id,
                 status_code=e.response.status_code,
                 error=str(e)
             )
@@ -187,12 +233,7 @@ class A2AClient:
             )
             
         except Exception as e:
-            logger.error(
-                "a2a_error",
-                target_agent=target_agent,
-                request_id=request_id,
-                error=str(e)
-            )
+            log.error("a2a_error", error=str(e))
             raise A2AError(
                 code=ErrorCode.A2A_CONNECTION_ERROR,
                 message=f"A2A communication error: {str(e)}",
@@ -200,6 +241,30 @@ class A2AClient:
                 details={"request_id": request_id, "error": str(e)}
             )
     
+    async def send_tasks_bulk(
+        self,
+        calls: Sequence[Tuple[str, Dict[str, Any], Optional[str]]]
+    ) -> List[Union[Dict[str, Any], A2AError]]:
+        """Send several A2A tasks concurrently over the pooled client.
+        
+        Wall-clock time is that of the slowest call rather than the sum.
+        
+        Args:
+            calls: (target_agent, message, thread_id) tuples.
+            
+        Returns:
+            One entry per call, in order: the JSON-RPC response, or the
+            A2AError raised for that call (one failure does not cancel
+            the others).
+        """
+        return await asyncio.gather(
+            *(
+                self.send_task(target_agent, message, thread_id)
+                for target_agent, message, thread_id in calls
+            ),
+            return_exceptions=True
+        )
+    
     async def get_task_status(
         self,
         target_agent: str,
@@ -225,14 +290,14 @@ class A2AClient:
         endpoint = f"{self.base_url}/a2a_{target_agent}"
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    endpoint,
-                    json=payload,
-                    timeout=30.0  # Shorter timeout for status checks
-                )
-                response.raise_for_status()
-                return response.json()
+            response = await self._get_client().post(
+                endpoint,
+                content=orjson.dumps(payload),
+                headers=_JSON_HEADERS,
+                timeout=30.0  # Shorter timeout for status checks
+            )
+            response.raise_for_status()
+            return orjson.loads(response.content)
                 
         except Exception as e:
             logger.error(
@@ -253,15 +318,19 @@ class A2AClient:
         target_agent: str,
         task_id: str,
         poll_interval: float = 2.0,
-        max_wait: Optional[int] = None
+        max_wait: Optional[int] = None,
+        backoff: float = 1.5,
+        max_poll_interval: float = 10.0
     ) -> Dict[str, Any]:
-        """Poll for task completion.
+        """Poll for task completion with exponential backoff.
         
         Args:
             target_agent: Name of the target agent.
             task_id: Task ID to wait for.
-            poll_interval: Seconds between polls.
+            poll_interval: Seconds before the second poll.
             max_wait: Maximum wait time in seconds (default from settings).
+            backoff: Multiplier applied to the interval after each poll.
+            max_poll_interval: Upper bound on the interval between polls.
             
         Returns:
             Final task response.
@@ -270,10 +339,21 @@ class A2AClient:
             A2AError: If task fails or times out.
         """
         max_wait = max_wait or self.timeout
-        elapsed = 0.0
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        deadline = start + max_wait
+        interval = poll_interval
         
-        while elapsed < max_wait:
-            response = await self.get_task_status(target_agent, task_id)
+        # max_wait is a wall-clock bound: time spent inside get_task_status
+        # counts against it, and an in-flight poll is cut off at the deadline.
+        while (remaining := deadline - loop.time()) > 0:
+            try:
+                response = await asyncio.wait_for(
+                    self.get_task_status(target_agent, task_id),
+                    timeout=remaining
+                )
+            except asyncio.TimeoutError:
+                break
             result = response.get("result", {})
             status = result.get("status")
             
@@ -287,14 +367,17 @@ class A2AClient:
                     details={"task_id": task_id, "result": result}
                 )
             
-            await asyncio.sleep(poll_interval)
-            elapsed += poll_interval
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(interval, remaining))
+            interval = min(interval * backoff, max_poll_interval)
         
         raise A2AError(
             code=ErrorCode.A2A_TIMEOUT,
             message=f"Task {task_id} did not complete within {max_wait}s",
             target_agent=target_agent,
-            details={"task_id": task_id, "elapsed": elapsed}
+            details={"task_id": task_id, "elapsed": round(loop.time() - start, 3)}
         )
     
     @staticmethod
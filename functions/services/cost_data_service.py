@@ -8,8 +8,10 @@ PR #6 Addition: Material cost and labor rate lookups with P50/P80/P90 ranges.
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple, Any
-import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Any
+import sys
 import structlog
 
 from models.cost_estimate import CostRange, CostConfidenceLevel
@@ -63,13 +65,109 @@ STATE_REGIONS: Dict[str, Region] = {
 }
 
 # States with predominantly union labor markets
-UNION_STATES = {"NY", "NJ", "IL", "CA", "WA", "MA", "CT", "PA", "OH", "MI"}
+UNION_STATES = frozenset({"NY", "NJ", "IL", "CA", "WA", "MA", "CT", "PA", "OH", "MI"})
 
 # High cost states (location factor > 1.1)
-HIGH_COST_STATES = {"NY", "CA", "MA", "CT", "WA", "NJ", "HI", "AK"}
+HIGH_COST_STATES = frozenset({"NY", "CA", "MA", "CT", "WA", "NJ", "HI", "AK"})
 
 # Low cost states (location factor < 0.95)
-LOW_COST_STATES = {"MS", "AR", "AL", "WV", "KY", "OK", "TN", "SC"}
+LOW_COST_STATES = frozenset({"MS", "AR", "AL", "WV", "KY", "OK", "TN", "SC"})
+
+# Per-state union/high-cost/low-cost bits, so one lookup answers all three
+_STATE_UNION = 1
+_STATE_HIGH_COST = 2
+_STATE_LOW_COST = 4
+_STATE_FLAGS: Dict[str, int] = {
+    state: (
+        (_STATE_UNION if state in UNION_STATES else 0)
+        | (_STATE_HIGH_COST if state in HIGH_COST_STATES else 0)
+        | (_STATE_LOW_COST if state in LOW_COST_STATES else 0)
+    )
+    for state in UNION_STATES | HIGH_COST_STATES | LOW_COST_STATES
+}
+
+# National defaults that regional estimates are scaled from. Built once and
+# only read here; get_default_location_factors() returns a fresh instance
+# for callers that may modify it.
+_DEFAULT_LOCATION_FACTORS = get_default_location_factors()
+
+# Default (field, value) pairs scaled by the location factor in regional
+# estimates, read once instead of through two attribute loads per field
+_DEFAULT_LABOR_RATE_ITEMS: Tuple[Tuple[str, float], ...] = tuple(
+    _DEFAULT_LOCATION_FACTORS.labor_rates.model_dump().items()
+)
+_DEFAULT_SCALED_PERMIT_ITEMS: Tuple[Tuple[str, float], ...] = tuple(
+    (name, getattr(_DEFAULT_LOCATION_FACTORS.permit_costs, name))
+    for name in (
+        "building_permit_base",
+        "electrical_permit",
+        "plumbing_permit",
+        "mechanical_permit",
+        "plan_review_fee",
+    )
+)
+
+# Simplified 3-digit ZIP prefix ranges -> state, as (first, last, state),
+# sorted and non-overlapping. This is an approximation - a real
+# implementation would use a complete database. Prefixes between ranges
+# map to "XX".
+ZIP_PREFIX_STATE_RANGES: Tuple[Tuple[int, int, str], ...] = (
+    (100, 149, "NY"),
+    (150, 196, "PA"),
+    (197, 199, "DE"),
+    (200, 205, "DC"),
+    (206, 219, "MD"),
+    (220, 246, "VA"),
+    (247, 268, "WV"),
+    (270, 289, "NC"),
+    (290, 299, "SC"),
+    (300, 319, "GA"),
+    (320, 339, "FL"),
+    (350, 369, "AL"),
+    (370, 385, "TN"),
+    (386, 397, "MS"),
+    (400, 427, "KY"),
+    (430, 458, "OH"),
+    (460, 479, "IN"),
+    (480, 499, "MI"),
+    (500, 528, "IA"),
+    (530, 549, "WI"),
+    (550, 567, "MN"),
+    (570, 577, "SD"),
+    (580, 588, "ND"),
+    (590, 599, "MT"),
+    (600, 629, "IL"),
+    (630, 658, "MO"),
+    (660, 679, "KS"),
+    (680, 693, "NE"),
+    (700, 714, "LA"),
+    (716, 729, "AR"),
+    (730, 749, "OK"),
+    (750, 799, "TX"),
+    (800, 816, "CO"),
+    (820, 831, "WY"),
+    (832, 838, "ID"),
+    (840, 847, "UT"),
+    (850, 865, "AZ"),
+    (870, 884, "NM"),
+    (889, 898, "NV"),
+    (900, 961, "CA"),
+    (967, 968, "HI"),
+    (970, 979, "OR"),
+    (980, 994, "WA"),
+    (995, 999, "AK"),
+)
+
+
+def _zip_prefix_state_table() -> Tuple[str, ...]:
+    """State for every 3-digit ZIP prefix 000-999, indexed by prefix."""
+    table = ["XX"] * 1000
+    for first, last, state in ZIP_PREFIX_STATE_RANGES:
+        table[first:last + 1] = [state] * (last - first + 1)
+    return tuple(table)
+
+
+_PREFIX_TO_STATE = _zip_prefix_state_table()
 
 # National average labor rates by trade (P50 values)
 NATIONAL_AVERAGE_LABOR_RATES: Dict[TradeCategory, float] = {
@@ -93,6 +191,55 @@ NATIONAL_AVERAGE_LABOR_RATES: Dict[TradeCategory, float] = {
 }
 
 
+# Typical weather factors per region; shared, never mutated
+_REGIONAL_WEATHER: Dict[Region, LocationWeatherFactors] = {
+    Region.NORTHEAST: LocationWeatherFactors(
+        winter_impact=WinterImpact.SEVERE,
+        seasonal_adjustment=1.08,
+        seasonal_reason=SeasonalAdjustmentReason.WINTER_WEATHER,
+        frost_line_depth_inches=42
+    ),
+    Region.SOUTHEAST: LocationWeatherFactors(
+        winter_impact=WinterImpact.MINIMAL,
+        seasonal_adjustment=1.02,
+        seasonal_reason=SeasonalAdjustmentReason.HURRICANE_SEASON
+    ),
+    Region.MIDWEST: LocationWeatherFactors(
+        winter_impact=WinterImpact.SEVERE,
+        seasonal_adjustment=1.08,
+        seasonal_reason=SeasonalAdjustmentReason.WINTER_WEATHER,
+        frost_line_depth_inches=48
+    ),
+    Region.SOUTH: LocationWeatherFactors(
+        winter_impact=WinterImpact.NONE,
+        seasonal_adjustment=1.03,
+        seasonal_reason=SeasonalAdjustmentReason.SUMMER_HEAT
+    ),
+    Region.SOUTHWEST: LocationWeatherFactors(
+        winter_impact=WinterImpact.NONE,
+        seasonal_adjustment=1.05,
+        seasonal_reason=SeasonalAdjustmentReason.SUMMER_HEAT,
+        extreme_heat_days=120
+    ),
+    Region.MOUNTAIN: LocationWeatherFactors(
+        winter_impact=WinterImpact.MODERATE,
+        seasonal_adjustment=1.05,
+        seasonal_reason=SeasonalAdjustmentReason.WINTER_WEATHER,
+        frost_line_depth_inches=36
+    ),
+    Region.PACIFIC: LocationWeatherFactors(
+        winter_impact=WinterImpact.MINIMAL,
+        seasonal_adjustment=1.0,
+        seasonal_reason=SeasonalAdjustmentReason.NONE
+    ),
+    Region.NATIONAL: LocationWeatherFactors(
+        winter_impact=WinterImpact.MODERATE,
+        seasonal_adjustment=1.0,
+        seasonal_reason=SeasonalAdjustmentReason.NONE
+    )
+}
+
+
 # =============================================================================
 # MOCK LOCATION DATA - MAJOR METROS
 # =============================================================================
@@ -406,22 +553,18 @@ def _create_phoenix_factors() -> LocationLocationFactors:
     )
 
 
-# Initialize mock data
-MOCK_LOCATIONS["80202"] = _create_denver_factors()
-MOCK_LOCATIONS["80203"] = _create_denver_factors()  # Near Denver
-MOCK_LOCATIONS["80204"] = _create_denver_factors()  # Near Denver
-MOCK_LOCATIONS["10001"] = _create_nyc_factors()
-MOCK_LOCATIONS["10002"] = _create_nyc_factors()  # Near NYC
-MOCK_LOCATIONS["10003"] = _create_nyc_factors()  # Near NYC
-MOCK_LOCATIONS["77001"] = _create_houston_factors()
-MOCK_LOCATIONS["77002"] = _create_houston_factors()  # Near Houston
-MOCK_LOCATIONS["77003"] = _create_houston_factors()  # Near Houston
-MOCK_LOCATIONS["90001"] = _create_la_factors()
-MOCK_LOCATIONS["90002"] = _create_la_factors()  # Near LA
-MOCK_LOCATIONS["60601"] = _create_chicago_factors()
-MOCK_LOCATIONS["60602"] = _create_chicago_factors()  # Near Chicago
-MOCK_LOCATIONS["85001"] = _create_phoenix_factors()
-MOCK_LOCATIONS["85002"] = _create_phoenix_factors()  # Near Phoenix
+# Initialize mock data. Nearby ZIPs share their metro's instance instead of
+# building an identical copy per alias.
+for _create, _zip_codes in (
+    (_create_denver_factors, ("80202", "80203", "80204")),
+    (_create_nyc_factors, ("10001", "10002", "10003")),
+    (_create_houston_factors, ("77001", "77002", "77003")),
+    (_create_la_factors, ("90001", "90002")),
+    (_create_chicago_factors, ("60601", "60602")),
+    (_create_phoenix_factors, ("85001", "85002")),
+):
+    MOCK_LOCATIONS.update(dict.fromkeys(_zip_codes, _create()))
+del _create, _zip_codes
 
 
 # =============================================================================
@@ -429,6 +572,98 @@ MOCK_LOCATIONS["85002"] = _create_phoenix_factors()  # Near Phoenix
 # =============================================================================
 
 
+# TradeCategory -> (LaborRates field, multiplier) for location-specific rates
+_TRADE_LABOR_RATE_FIELDS: Dict[TradeCategory, Tuple[str, float]] = {
+    TradeCategory.ELECTRICIAN: ("electrician", 1.0),
+    TradeCategory.PLUMBER: ("plumber", 1.0),
+    TradeCategory.CARPENTER: ("carpenter", 1.0),
+    TradeCategory.HVAC: ("hvac", 1.0),
+    TradeCategory.GENERAL_LABOR: ("general_labor", 1.0),
+    TradeCategory.PAINTER: ("painter", 1.0),
+    TradeCategory.TILE_SETTER: ("tile_setter", 1.0),
+    TradeCategory.ROOFER: ("roofer", 1.0),
+    TradeCategory.CONCRETE_FINISHER: ("concrete_finisher", 1.0),
+    TradeCategory.DRYWALL_INSTALLER: ("drywall_installer", 1.0),
+    # Map additional trades to closest match
+    TradeCategory.CABINET_INSTALLER: ("carpenter", 1.0),
+    TradeCategory.COUNTERTOP_INSTALLER: ("carpenter", 1.0),
+    TradeCategory.FLOORING_INSTALLER: ("tile_setter", 1.0),
+    TradeCategory.APPLIANCE_INSTALLER: ("general_labor", 1.0),
+    TradeCategory.DEMOLITION: ("general_labor", 1.0),
+    TradeCategory.MASON: ("concrete_finisher", 1.0),
+    TradeCategory.WELDER: ("carpenter", 1.2),  # Premium
+}
+
+# P50 (material, labor hours, equipment, trade) defaults by CSI division
+_DIVISION_MATERIAL_DEFAULTS: Mapping[str, Tuple[float, float, float, TradeCategory]] = MappingProxyType({
+    "01": (50.0, 0.5, 0.0, TradeCategory.GENERAL_LABOR),
+    "02": (5.0, 0.25, 5.0, TradeCategory.DEMOLITION),
+    "03": (8.0, 0.3, 2.0, TradeCategory.CONCRETE_FINISHER),
+    "04": (12.0, 0.4, 0.0, TradeCategory.MASON),
+    "05": (25.0, 0.5, 5.0, TradeCategory.WELDER),
+    "06": (45.0, 0.5, 0.0, TradeCategory.CARPENTER),
+    "07": (8.0, 0.3, 0.0, TradeCategory.ROOFER),
+    "08": (150.0, 1.0, 0.0, TradeCategory.CARPENTER),
+    "09": (3.0, 0.15, 0.0, TradeCategory.PAINTER),
+    "10": (50.0, 0.5, 0.0, TradeCategory.GENERAL_LABOR),
+    "11": (800.0, 2.0, 0.0, TradeCategory.APPLIANCE_INSTALLER),
+    "12": (200.0, 1.5, 0.0, TradeCategory.CABINET_INSTALLER),
+    "13": (100.0, 1.0, 0.0, TradeCategory.GENERAL_LABOR),
+    "14": (500.0, 4.0, 50.0, TradeCategory.GENERAL_LABOR),
+    "21": (50.0, 1.0, 0.0, TradeCategory.PLUMBER),
+    "22": (75.0, 1.5, 0.0, TradeCategory.PLUMBER),
+    "23": (100.0, 2.0, 0.0, TradeCategory.HVAC),
+    "25": (150.0, 2.0, 0.0, TradeCategory.ELECTRICIAN),
+    "26": (50.0, 0.75, 0.0, TradeCategory.ELECTRICIAN),
+    "27": (75.0, 1.0, 0.0, TradeCategory.ELECTRICIAN),
+    "28": (200.0, 2.0, 0.0, TradeCategory.ELECTRICIAN),
+    "31": (5.0, 0.1, 10.0, TradeCategory.GENERAL_LABOR),
+    "32": (10.0, 0.2, 5.0, TradeCategory.GENERAL_LABOR),
+    "33": (100.0, 2.0, 20.0, TradeCategory.PLUMBER),
+})
+_FALLBACK_MATERIAL_DEFAULTS = (50.0, 0.5, 0.0, TradeCategory.GENERAL_LABOR)
+
+# (trade, material cost, labor hours) defaults for generic cost codes by division
+_DIVISION_COST_CODE_DEFAULTS: Mapping[str, Tuple[str, float, float]] = MappingProxyType({
+    "01": ("general_labor", 50.0, 0.5),
+    "02": ("demolition", 5.0, 0.25),
+    "03": ("concrete_finisher", 8.0, 0.3),
+    "04": ("mason", 12.0, 0.4),
+    "05": ("welder", 25.0, 0.5),
+    "06": ("carpenter", 45.0, 0.5),
+    "07": ("roofer", 8.0, 0.3),
+    "08": ("carpenter", 150.0, 1.0),
+    "09": ("painter", 3.0, 0.15),
+    "10": ("general_labor", 50.0, 0.5),
+    "11": ("appliance_installer", 800.0, 2.0),
+    "12": ("cabinet_installer", 200.0, 1.5),
+    "13": ("general_labor", 100.0, 1.0),
+    "14": ("general_labor", 500.0, 4.0),
+    "21": ("plumber", 50.0, 1.0),
+    "22": ("plumber", 75.0, 1.5),
+    "23": ("hvac", 100.0, 2.0),
+    "25": ("electrician", 150.0, 2.0),
+    "26": ("electrician", 50.0, 0.75),
+    "27": ("electrician", 75.0, 1.0),
+    "28": ("electrician", 200.0, 2.0),
+    "31": ("general_labor", 5.0, 0.1),
+    "32": ("general_labor", 10.0, 0.2),
+    "33": ("plumber", 100.0, 2.0),
+})
+_FALLBACK_COST_CODE_DEFAULTS = ("general_labor", 50.0, 0.5)
+
+
+@lru_cache(maxsize=128)
+def _generic_cost_code_labels(division_code: str) -> Tuple[str, str]:
+    """Return the (cost_code, description) pair of a division's generic code."""
+    return f"GEN-{division_code}-001", f"General {division_code} work item"
+
+
+# Per-instance location factors cache: bounded, and entries refresh hourly
+COST_DATA_CACHE_MAXSIZE = 1024
+COST_DATA_CACHE_TTL_SECONDS = 60 * 60
+
+
 class CostDataService:
     """Service for retrieving location-based cost data.
     
@@ -438,7 +673,10 @@ class CostDataService:
     
     def __init__(self):
         """Initialize CostDataService."""
-        self._cache: Dict[str, LocationLocationFactors] = {}
+        self._cache = LocationCache(
+            maxsize=COST_DATA_CACHE_MAXSIZE,
+            ttl_seconds=COST_DATA_CACHE_TTL_SECONDS
+        )
         logger.info("cost_data_service_initialized", mock=True)
     
     async def get_location_factors(self, zip_code: str) -> LocationLocationFactors:
@@ -450,37 +688,39 @@ class CostDataService:
         Returns:
             LocationFactors for the ZIP code.
         """
-        # Normalize ZIP code
-        zip_code = zip_code.strip()[:5]
+        # Normalize ZIP code (already-clean 5-digit input skips strip/slice),
+        # interned so cache and MOCK_LOCATIONS hits compare by identity
+        if len(zip_code) != 5 or not zip_code.isdigit():
+            zip_code = zip_code.strip()[:5]
+        zip_code = sys.intern(zip_code)
         
         # Check cache first
-        if zip_code in self._cache:
+        factors = self._cache.get(zip_code)
+        if factors is not None:
             logger.debug("location_factors_cache_hit", zip_code=zip_code)
-            return self._cache[zip_code]
+            return factors
         
-        # Check mock data
-        if zip_code in MOCK_LOCATIONS:
-            factors = MOCK_LOCATIONS[zip_code]
-            self._cache[zip_code] = factors
+        # Check mock data, else generate regional defaults for unknown ZIP
+        factors = MOCK_LOCATIONS.get(zip_code)
+        if factors is not None:
             logger.info(
                 "location_factors_found",
                 zip_code=zip_code,
                 city=factors.city,
                 state=factors.state
             )
-            return factors
-        
-        # Generate regional defaults for unknown ZIP
-        factors = self._generate_regional_factors(zip_code)
-        self._cache[zip_code] = factors
-        
-        logger.info(
-            "location_factors_generated",
-            zip_code=zip_code,
-            region=factors.region.value,
-            confidence=factors.confidence
-        )
+        else:
+            factors = self._generate_regional_factors(zip_code)
+            logger.info(
+                "location_factors_generated",
+                zip_code=zip_code,
+                region=factors.region.value,
+                confidence=factors.confidence
+            )
         
+        # Nothing above awaits, so concurrent callers cannot interleave
+        # between the cache miss and this write
+        self._cache.set(zip_code, factors)
         return factors
     
     def _generate_regional_factors(self, zip_code: str) -> LocationLocationFactors:
@@ -497,9 +737,10 @@ class CostDataService:
         # ZIP prefix to state mapping (simplified)
         state = self._estimate_state_from_zip(zip_code)
         region = STATE_REGIONS.get(state, Region.NATIONAL)
-        is_union = state in UNION_STATES
-        is_high_cost = state in HIGH_COST_STATES
-        is_low_cost = state in LOW_COST_STATES
+        flags = _STATE_FLAGS.get(state, 0)
+        is_union = bool(flags & _STATE_UNION)
+        is_high_cost = bool(flags & _STATE_HIGH_COST)
+        is_low_cost = bool(flags & _STATE_LOW_COST)
         
         # Calculate location factor
         if is_high_cost:
@@ -510,7 +751,7 @@ class CostDataService:
             location_factor = 1.0
         
         # Get default and adjust
-        defaults = get_default_location_factors()
+        defaults = _DEFAULT_LOCATION_FACTORS
         
         # Adjust labor rates based on cost level
         labor_multiplier = location_factor
@@ -520,25 +761,13 @@ class CostDataService:
             city="Unknown",
             state=state,
             region=region,
-            labor_rates=LocationLaborRates(
-                electrician=defaults.labor_rates.electrician * labor_multiplier,
-                plumber=defaults.labor_rates.plumber * labor_multiplier,
-                carpenter=defaults.labor_rates.carpenter * labor_multiplier,
-                hvac=defaults.labor_rates.hvac * labor_multiplier,
-                general_labor=defaults.labor_rates.general_labor * labor_multiplier,
-                painter=defaults.labor_rates.painter * labor_multiplier,
-                tile_setter=defaults.labor_rates.tile_setter * labor_multiplier,
-                roofer=defaults.labor_rates.roofer * labor_multiplier,
-                concrete_finisher=defaults.labor_rates.concrete_finisher * labor_multiplier,
-                drywall_installer=defaults.labor_rates.drywall_installer * labor_multiplier
-            ),
+            labor_rates=LocationLaborRates(**{
+                trade: rate * labor_multiplier
+                for trade, rate in _DEFAULT_LABOR_RATE_ITEMS
+            }),
             permit_costs=LocationPermitCosts(
-                building_permit_base=defaults.permit_costs.building_permit_base * location_factor,
+                **{fee: cost * location_factor for fee, cost in _DEFAULT_SCALED_PERMIT_ITEMS},
                 building_permit_percentage=defaults.permit_costs.building_permit_percentage,
-                electrical_permit=defaults.permit_costs.electrical_permit * location_factor,
-                plumbing_permit=defaults.permit_costs.plumbing_permit * location_factor,
-                mechanical_permit=defaults.permit_costs.mechanical_permit * location_factor,
-                plan_review_fee=defaults.permit_costs.plan_review_fee * location_factor,
                 impact_fees=0.0,
                 inspection_fees=defaults.permit_costs.inspection_fees
             ),
@@ -568,100 +797,11 @@ class CostDataService:
             return "XX"
         
         prefix = zip_code[:3]
-        prefix_int = int(prefix) if prefix.isdigit() else 0
-        
-        # Simplified ZIP prefix to state mapping
-        # This is an approximation - real implementation would use a complete database
-        if 100 <= prefix_int <= 149:
-            return "NY"
-        elif 150 <= prefix_int <= 196:
-            return "PA"
-        elif 197 <= prefix_int <= 199:
-            return "DE"
-        elif 200 <= prefix_int <= 205:
-            return "DC"
-        elif 206 <= prefix_int <= 219:
-            return "MD"
-        elif 220 <= prefix_int <= 246:
-            return "VA"
-        elif 247 <= prefix_int <= 268:
-            return "WV"
-        elif 270 <= prefix_int <= 289:
-            return "NC"
-        elif 290 <= prefix_int <= 299:
-            return "SC"
-        elif 300 <= prefix_int <= 319:
-            return "GA"
-        elif 320 <= prefix_int <= 339:
-            return "FL"
-        elif 350 <= prefix_int <= 369:
-            return "AL"
-        elif 370 <= prefix_int <= 385:
-            return "TN"
-        elif 386 <= prefix_int <= 397:
-            return "MS"
-        elif 400 <= prefix_int <= 427:
-            return "KY"
-        elif 430 <= prefix_int <= 458:
-            return "OH"
-        elif 460 <= prefix_int <= 479:
-            return "IN"
-        elif 480 <= prefix_int <= 499:
-            return "MI"
-        elif 500 <= prefix_int <= 528:
-            return "IA"
-        elif 530 <= prefix_int <= 549:
-            return "WI"
-        elif 550 <= prefix_int <= 567:
-            return "MN"
-        elif 570 <= prefix_int <= 577:
-            return "SD"
-        elif 580 <= prefix_int <= 588:
-            return "ND"
-        elif 590 <= prefix_int <= 599:
-            return "MT"
-        elif 600 <= prefix_int <= 629:
-            return "IL"
-        elif 630 <= prefix_int <= 658:
-            return "MO"
-        elif 660 <= prefix_int <= 679:
-            return "KS"
-        elif 680 <= prefix_int <= 693:
-            return "NE"
-        elif 700 <= prefix_int <= 714:
-            return "LA"
-        elif 716 <= prefix_int <= 729:
-            return "AR"
-        elif 730 <= prefix_int <= 749:
-            return "OK"
-        elif 750 <= prefix_int <= 799:
-            return "TX"
-        elif 800 <= prefix_int <= 816:
-            return "CO"
-        elif 820 <= prefix_int <= 831:
-            return "WY"
-        elif 832 <= prefix_int <= 838:
-            return "ID"
-        elif 840 <= prefix_int <= 847:
-            return "UT"
-        elif 850 <= prefix_int <= 865:
-            return "AZ"
-        elif 870 <= prefix_int <= 884:
-            return "NM"
-        elif 889 <= prefix_int <= 898:
-            return "NV"
-        elif 900 <= prefix_int <= 961:
-            return "CA"
-        elif 967 <= prefix_int <= 968:
-            return "HI"
-        elif 970 <= prefix_int <= 979:
-            return "OR"
-        elif 980 <= prefix_int <= 994:
-            return "WA"
-        elif 995 <= prefix_int <= 999:
-            return "AK"
-        else:
-            return "XX"
+        # isascii() too: "²" and other Unicode digits pass isdigit() but int()
+        # rejects them
+        if prefix.isascii() and prefix.isdigit():
+            return _PREFIX_TO_STATE[int(prefix)]
+        return "XX"
     
     def _get_regional_weather(self, region: Region) -> LocationWeatherFactors:
         """Get typical weather factors for a region.
@@ -672,54 +812,7 @@ class CostDataService:
         Returns:
             WeatherFactors for the region.
         """
-        regional_weather = {
-            Region.NORTHEAST: LocationWeatherFactors(
-                winter_impact=WinterImpact.SEVERE,
-                seasonal_adjustment=1.08,
-                seasonal_reason=SeasonalAdjustmentReason.WINTER_WEATHER,
-                frost_line_depth_inches=42
-            ),
-            Region.SOUTHEAST: LocationWeatherFactors(
-                winter_impact=WinterImpact.MINIMAL,
-                seasonal_adjustment=1.02,
-                seasonal_reason=SeasonalAdjustmentReason.HURRICANE_SEASON
-            ),
-            Region.MIDWEST: LocationWeatherFactors(
-                winter_impact=WinterImpact.SEVERE,
-                seasonal_adjustment=1.08,
-                seasonal_reason=SeasonalAdjustmentReason.WINTER_WEATHER,
-                frost_line_depth_inches=48
-            ),
-            Region.SOUTH: LocationWeatherFactors(
-                winter_impact=WinterImpact.NONE,
-                seasonal_adjustment=1.03,
-                seasonal_reason=SeasonalAdjustmentReason.SUMMER_HEAT
-            ),
-            Region.SOUTHWEST: LocationWeatherFactors(
-                winter_impact=WinterImpact.NONE,
-                seasonal_adjustment=1.05,
-                seasonal_reason=SeasonalAdjustmentReason.SUMMER_HEAT,
-                extreme_heat_days=120
-            ),
-            Region.MOUNTAIN: LocationWeatherFactors(
-                winter_impact=WinterImpact.MODERATE,
-                seasonal_adjustment=1.05,
-                seasonal_reason=SeasonalAdjustmentReason.WINTER_WEATHER,
-                frost_line_depth_inches=36
-            ),
-            Region.PACIFIC: LocationWeatherFactors(
-                winter_impact=WinterImpact.MINIMAL,
-                seasonal_adjustment=1.0,
-                seasonal_reason=SeasonalAdjustmentReason.NONE
-            ),
-            Region.NATIONAL: LocationWeatherFactors(
-                winter_impact=WinterImpact.MODERATE,
-                seasonal_adjustment=1.0,
-                seasonal_reason=SeasonalAdjustmentReason.NONE
-            )
-        }
-        
-        return regional_weather.get(region, regional_weather[Region.NATIONAL])
+        return _REGIONAL_WEATHER.get(region, _REGIONAL_WEATHER[Region.NATIONAL])
     
     def clear_cache(self) -> None:
         """Clear the location factors cache."""
@@ -750,6 +843,14 @@ class CostDataService:
             Dict with unit_cost (CostRange), labor_hours, equipment_cost (CostRange),
             primary_trade, unit, and confidence.
         """
+        return self._get_material_cost_sync(cost_code, item_description)
+    
+    def _get_material_cost_sync(
+        self,
+        cost_code: str,
+        item_description: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Synchronous body of get_material_cost(); the mock lookup does no I/O."""
         logger.debug(
             "get_material_cost",
             cost_code=cost_code,
@@ -757,9 +858,9 @@ class CostDataService:
         )
         
         # Try exact cost code match first
-        for code_data in MOCK_COST_CODES:
-            if code_data["code"] == cost_code:
-                return self._build_material_cost_result(code_data)
+        code_data = _CODES_BY_CODE.get(cost_code)
+        if code_data is not None:
+            return self._build_material_cost_result(code_data)
         
         # Try fuzzy match on item description if provided
         if item_description:
@@ -767,7 +868,7 @@ class CostDataService:
             best_match = None
             best_score = 0.0
             
-            for code_data in MOCK_COST_CODES:
+            for code_data in _keyword_candidates(desc_lower):
                 score = self._calculate_fuzzy_score(desc_lower, code_data)
                 if score > best_score:
                     best_score = score
@@ -796,6 +897,14 @@ class CostDataService:
         """
         base_material = code_data["material_cost_per_unit"]
         base_equipment = code_data.get("equipment_cost_per_unit", 0.0)
+        if "_primary_trade_enum" in code_data:
+            primary_trade = code_data["_primary_trade_enum"]
+            secondary_trades = list(code_data["_secondary_trade_enums"])
+        else:
+            primary_trade = TradeCategory(code_data["primary_trade"])
+            secondary_trades = [
+                TradeCategory(t) for t in code_data.get("secondary_trades", [])
+            ]
         
         # Apply variance multipliers for P80 and P90
         # P80 = 15% higher, P90 = 25% higher (typical construction variance)
@@ -806,10 +915,8 @@ class CostDataService:
             "unit_cost": CostRange.from_base_cost(base_material),
             "labor_hours_per_unit": code_data["labor_hours_per_unit"],
             "equipment_cost": CostRange.from_base_cost(base_equipment) if base_equipment > 0 else CostRange.zero(),
-            "primary_trade": TradeCategory(code_data["primary_trade"]),
-            "secondary_trades": [
-                TradeCategory(t) for t in code_data.get("secondary_trades", [])
-            ],
+            "primary_trade": primary_trade,
+            "secondary_trades": secondary_trades,
             "confidence": CostConfidenceLevel.HIGH if confidence >= 0.85 else CostConfidenceLevel.MEDIUM,
             "confidence_score": confidence
         }
@@ -823,47 +930,18 @@ class CostDataService:
         Returns:
             Default material cost with CostRange values.
         """
-        # Default costs by division (P50 base values)
-        defaults = {
-            "01": {"material": 50.0, "labor": 0.5, "equipment": 0.0, "trade": TradeCategory.GENERAL_LABOR},
-            "02": {"material": 5.0, "labor": 0.25, "equipment": 5.0, "trade": TradeCategory.DEMOLITION},
-            "03": {"material": 8.0, "labor": 0.3, "equipment": 2.0, "trade": TradeCategory.CONCRETE_FINISHER},
-            "04": {"material": 12.0, "labor": 0.4, "equipment": 0.0, "trade": TradeCategory.MASON},
-            "05": {"material": 25.0, "labor": 0.5, "equipment": 5.0, "trade": TradeCategory.WELDER},
-            "06": {"material": 45.0, "labor": 0.5, "equipment": 0.0, "trade": TradeCategory.CARPENTER},
-            "07": {"material": 8.0, "labor": 0.3, "equipment": 0.0, "trade": TradeCategory.ROOFER},
-            "08": {"material": 150.0, "labor": 1.0, "equipment": 0.0, "trade": TradeCategory.CARPENTER},
-            "09": {"material": 3.0, "labor": 0.15, "equipment": 0.0, "trade": TradeCategory.PAINTER},
-            "10": {"material": 50.0, "labor": 0.5, "equipment": 0.0, "trade": TradeCategory.GENERAL_LABOR},
-            "11": {"material": 800.0, "labor": 2.0, "equipment": 0.0, "trade": TradeCategory.APPLIANCE_INSTALLER},
-            "12": {"material": 200.0, "labor": 1.5, "equipment": 0.0, "trade": TradeCategory.CABINET_INSTALLER},
-            "13": {"material": 100.0, "labor": 1.0, "equipment": 0.0, "trade": TradeCategory.GENERAL_LABOR},
-            "14": {"material": 500.0, "labor": 4.0, "equipment": 50.0, "trade": TradeCategory.GENERAL_LABOR},
-            "21": {"material": 50.0, "labor": 1.0, "equipment": 0.0, "trade": TradeCategory.PLUMBER},
-            "22": {"material": 75.0, "labor": 1.5, "equipment": 0.0, "trade": TradeCategory.PLUMBER},
-            "23": {"material": 100.0, "labor": 2.0, "equipment": 0.0, "trade": TradeCategory.HVAC},
-            "25": {"material": 150.0, "labor": 2.0, "equipment": 0.0, "trade": TradeCategory.ELECTRICIAN},
-            "26": {"material": 50.0, "labor": 0.75, "equipment": 0.0, "trade": TradeCategory.ELECTRICIAN},
-            "27": {"material": 75.0, "labor": 1.0, "equipment": 0.0, "trade": TradeCategory.ELECTRICIAN},
-            "28": {"material": 200.0, "labor": 2.0, "equipment": 0.0, "trade": TradeCategory.ELECTRICIAN},
-            "31": {"material": 5.0, "labor": 0.1, "equipment": 10.0, "trade": TradeCategory.GENERAL_LABOR},
-            "32": {"material": 10.0, "labor": 0.2, "equipment": 5.0, "trade": TradeCategory.GENERAL_LABOR},
-            "33": {"material": 100.0, "labor": 2.0, "equipment": 20.0, "trade": TradeCategory.PLUMBER},
-        }
-        
-        div_defaults = defaults.get(
-            division,
-            {"material": 50.0, "labor": 0.5, "equipment": 0.0, "trade": TradeCategory.GENERAL_LABOR}
+        material, labor, equipment, trade = _DIVISION_MATERIAL_DEFAULTS.get(
+            division, _FALLBACK_MATERIAL_DEFAULTS
         )
         
         return {
             "cost_code": f"GEN-{division}-001",
             "description": f"General Division {division} item",
             "unit": "EA",
-            "unit_cost": CostRange.from_base_cost(div_defaults["material"]),
-            "labor_hours_per_unit": div_defaults["labor"],
-            "equipment_cost": CostRange.from_base_cost(div_defaults["equipment"]) if div_defaults["equipment"] > 0 else CostRange.zero(),
-            "primary_trade": div_defaults["trade"],
+            "unit_cost": CostRange.from_base_cost(material),
+            "labor_hours_per_unit": labor,
+            "equipment_cost": CostRange.from_base_cost(equipment) if equipment > 0 else CostRange.zero(),
+            "primary_trade": trade,
             "secondary_trades": [],
             "confidence": CostConfidenceLevel.LOW,
             "confidence_score": 0.50
@@ -945,28 +1023,11 @@ class CostDataService:
         Returns:
             Hourly rate for the trade, or None if not found.
         """
-        trade_mapping = {
-            TradeCategory.ELECTRICIAN: location.labor_rates.electrician,
-            TradeCategory.PLUMBER: location.labor_rates.plumber,
-            TradeCategory.CARPENTER: location.labor_rates.carpenter,
-            TradeCategory.HVAC: location.labor_rates.hvac,
-            TradeCategory.GENERAL_LABOR: location.labor_rates.general_labor,
-            TradeCategory.PAINTER: location.labor_rates.painter,
-            TradeCategory.TILE_SETTER: location.labor_rates.tile_setter,
-            TradeCategory.ROOFER: location.labor_rates.roofer,
-            TradeCategory.CONCRETE_FINISHER: location.labor_rates.concrete_finisher,
-            TradeCategory.DRYWALL_INSTALLER: location.labor_rates.drywall_installer,
-            # Map additional trades to closest match
-            TradeCategory.CABINET_INSTALLER: location.labor_rates.carpenter,
-            TradeCategory.COUNTERTOP_INSTALLER: location.labor_rates.carpenter,
-            TradeCategory.FLOORING_INSTALLER: location.labor_rates.tile_setter,
-            TradeCategory.APPLIANCE_INSTALLER: location.labor_rates.general_labor,
-            TradeCategory.DEMOLITION: location.labor_rates.general_labor,
-            TradeCategory.MASON: location.labor_rates.concrete_finisher,
-            TradeCategory.WELDER: location.labor_rates.carpenter * 1.2,  # Premium
-        }
-        
-        return trade_mapping.get(trade)
+        spec = _TRADE_LABOR_RATE_FIELDS.get(trade)
+        if spec is None:
+            return None
+        field_name, multiplier = spec
+        return getattr(location.labor_rates, field_name) * multiplier
 
     async def get_equipment_cost(
         self,
@@ -982,39 +1043,21 @@ class CostDataService:
         Returns:
             Dict with daily_rate (CostRange), total_cost (CostRange), and confidence.
         """
+        return self._get_equipment_cost_sync(equipment_type, duration_days)
+    
+    def _get_equipment_cost_sync(
+        self,
+        equipment_type: str,
+        duration_days: int = 1
+    ) -> Dict[str, Any]:
+        """Synchronous body of get_equipment_cost(); the mock lookup does no I/O."""
         logger.debug(
             "get_equipment_cost",
             equipment_type=equipment_type,
             duration_days=duration_days
         )
         
-        # Mock equipment rates (P50 base)
-        equipment_rates = {
-            "dumpster_10yd": 450.0,
-            "dumpster_20yd": 550.0,
-            "dumpster_30yd": 650.0,
-            "scaffold": 75.0,
-            "lift": 250.0,
-            "compressor": 85.0,
-            "generator": 125.0,
-            "saw_table": 45.0,
-            "saw_miter": 35.0,
-            "drill_hammer": 55.0,
-        }
-        
-        # Normalize equipment type
-        equipment_key = equipment_type.lower().replace(" ", "_").replace("-", "_")
-        
-        # Find best match
-        base_rate = None
-        for key, rate in equipment_rates.items():
-            if key in equipment_key or equipment_key in key:
-                base_rate = rate
-                break
-        
-        if base_rate is None:
-            base_rate = 100.0  # Default
-        
+        base_rate = _resolve_equipment_rate(equipment_type)
         daily_rate = CostRange.from_base_cost(base_rate, p80_multiplier=1.10, p90_multiplier=1.18)
         total_cost = daily_rate * duration_days
         
@@ -1047,6 +1090,15 @@ class CostDataService:
             Dict with cost_code, description, material_cost_per_unit,
             labor_hours_per_unit, primary_trade, and confidence.
         """
+        return self._get_cost_code_sync(item_description, division_code, subdivision_code)
+    
+    def _get_cost_code_sync(
+        self,
+        item_description: str,
+        division_code: str,
+        subdivision_code: Optional[str] = None
+    ) -> Dict[str, any]:
+        """Synchronous body of get_cost_code(); the mock lookup does no I/O."""
         logger.debug(
             "cost_code_lookup",
             item=item_description[:50],
@@ -1060,12 +1112,15 @@ class CostDataService:
         # Try subdivision code match first
         if subdivision_code:
             normalized_sub = subdivision_code.replace(" ", "")
-            for code_data in MOCK_COST_CODES:
-                if code_data.get("subdivision", "").replace(" ", "") == normalized_sub:
-                    return self._build_cost_code_result(code_data, 0.95)
+            code_data = _CODES_BY_SUBDIV.get(normalized_sub)
+            if code_data is not None:
+                return self._build_cost_code_result(code_data, 0.95)
+        
+        # Only codes sharing a keyword with the description can score above 0
+        candidates = _keyword_candidates(desc_lower)
         
         # Try fuzzy keyword matching within division
-        division_codes = [c for c in MOCK_COST_CODES if c["division"] == division_code]
+        division_codes = [c for c in candidates if c["division"] == division_code]
         
         best_match = None
         best_score = 0.0
@@ -1078,7 +1133,7 @@ class CostDataService:
         
         # If no good match in division, try global search
         if best_score < 0.3:
-            for code_data in MOCK_COST_CODES:
+            for code_data in candidates:
                 score = self._calculate_fuzzy_score(desc_lower, code_data)
                 if score > best_score:
                     best_score = score
@@ -1104,16 +1159,13 @@ class CostDataService:
         Returns:
             Match score from 0.0 to 1.0.
         """
-        keywords = code_data.get("keywords", [])
+        keywords = code_data.get("_kw_lower")
+        if keywords is None:
+            keywords = [k.lower() for k in code_data.get("keywords", [])]
         if not keywords:
             return 0.0
         
-        matches = 0
-        for keyword in keywords:
-            if keyword.lower() in description:
-                matches += 1
-        
-        return matches / len(keywords) if keywords else 0.0
+        return sum(1 for keyword in keywords if keyword in description) / len(keywords)
     
     def _build_cost_code_result(
         self,
@@ -1157,47 +1209,19 @@ class CostDataService:
         Returns:
             Default cost code for the division.
         """
-        # Default values by division
-        defaults = {
-            "01": {"trade": "general_labor", "material": 50.0, "labor": 0.5},
-            "02": {"trade": "demolition", "material": 5.0, "labor": 0.25},
-            "03": {"trade": "concrete_finisher", "material": 8.0, "labor": 0.3},
-            "04": {"trade": "mason", "material": 12.0, "labor": 0.4},
-            "05": {"trade": "welder", "material": 25.0, "labor": 0.5},
-            "06": {"trade": "carpenter", "material": 45.0, "labor": 0.5},
-            "07": {"trade": "roofer", "material": 8.0, "labor": 0.3},
-            "08": {"trade": "carpenter", "material": 150.0, "labor": 1.0},
-            "09": {"trade": "painter", "material": 3.0, "labor": 0.15},
-            "10": {"trade": "general_labor", "material": 50.0, "labor": 0.5},
-            "11": {"trade": "appliance_installer", "material": 800.0, "labor": 2.0},
-            "12": {"trade": "cabinet_installer", "material": 200.0, "labor": 1.5},
-            "13": {"trade": "general_labor", "material": 100.0, "labor": 1.0},
-            "14": {"trade": "general_labor", "material": 500.0, "labor": 4.0},
-            "21": {"trade": "plumber", "material": 50.0, "labor": 1.0},
-            "22": {"trade": "plumber", "material": 75.0, "labor": 1.5},
-            "23": {"trade": "hvac", "material": 100.0, "labor": 2.0},
-            "25": {"trade": "electrician", "material": 150.0, "labor": 2.0},
-            "26": {"trade": "electrician", "material": 50.0, "labor": 0.75},
-            "27": {"trade": "electrician", "material": 75.0, "labor": 1.0},
-            "28": {"trade": "electrician", "material": 200.0, "labor": 2.0},
-            "31": {"trade": "general_labor", "material": 5.0, "labor": 0.1},
-            "32": {"trade": "general_labor", "material": 10.0, "labor": 0.2},
-            "33": {"trade": "plumber", "material": 100.0, "labor": 2.0},
-        }
-        
-        div_defaults = defaults.get(
-            division_code,
-            {"trade": "general_labor", "material": 50.0, "labor": 0.5}
+        trade, material, labor = _DIVISION_COST_CODE_DEFAULTS.get(
+            division_code, _FALLBACK_COST_CODE_DEFAULTS
         )
+        cost_code, description = _generic_cost_code_labels(division_code)
         
         return {
-            "cost_code": f"GEN-{division_code}-001",
+            "cost_code": cost_code,
             "subdivision": None,
-            "description": f"General {division_code} work item",
-            "material_cost_per_unit": div_defaults["material"],
-            "labor_hours_per_unit": div_defaults["labor"],
+            "description": description,
+            "material_cost_per_unit": material,
+            "labor_hours_per_unit": labor,
             "equipment_cost_per_unit": 0.0,
-            "primary_trade": div_defaults["trade"],
+            "primary_trade": trade,
             "secondary_trades": [],
             "unit": "EA",
             "source": "inferred",
@@ -1752,6 +1776,182 @@ MOCK_COST_CODES: List[Dict[str, any]] = [
     },
 ]
 
+# Lookup indexes over MOCK_COST_CODES, built once at import. Where several
+# entries share a key the first one wins, matching the order of a linear scan.
+_CODES_BY_CODE: Dict[str, Dict[str, Any]] = {}
+_CODES_BY_SUBDIV: Dict[str, Dict[str, Any]] = {}
+# Lowercased keyword -> indexes of the MOCK_COST_CODES entries that list it
+_KEYWORD_TO_CODES: Dict[str, List[int]] = {}
+# Whole keywords and their single words -> entry indexes, for exact lookups
+_TERM_TO_CODES: Dict[str, List[int]] = {}
+# CSI division -> entry indexes
+_DIVISION_TO_CODES: Dict[str, List[int]] = {}
+for _index, _code_data in enumerate(MOCK_COST_CODES):
+    # Lowercased once here so _calculate_fuzzy_score only does substring checks
+    _code_data["_kw_lower"] = tuple(k.lower() for k in _code_data.get("keywords", ()))
+    # Trade enums resolved once for _build_material_cost_result
+    _code_data["_primary_trade_enum"] = TradeCategory(_code_data["primary_trade"])
+    _code_data["_secondary_trade_enums"] = tuple(
+        TradeCategory(t) for t in _code_data.get("secondary_trades", ())
+    )
+    _CODES_BY_CODE.setdefault(_code_data["code"], _code_data)
+    if _code_data.get("subdivision"):
+        _CODES_BY_SUBDIV.setdefault(_code_data["subdivision"].replace(" ", ""), _code_data)
+    _DIVISION_TO_CODES.setdefault(_code_data["division"], []).append(_index)
+    for _keyword in _code_data["_kw_lower"]:
+        _KEYWORD_TO_CODES.setdefault(_keyword, []).append(_index)
+        for _term in (_keyword, *_keyword.split()):
+            _indexes = _TERM_TO_CODES.setdefault(_term, [])
+            if not _indexes or _indexes[-1] != _index:
+                _indexes.append(_index)
+del _index, _code_data, _keyword, _term, _indexes
+
+
+class _KeywordTrieNode:
+    """Node of the keyword prefix trie over _TERM_TO_CODES."""
+    
+    __slots__ = ("children", "indexes")
+    
+    def __init__(self) -> None:
+        self.children: Dict[str, _KeywordTrieNode] = {}
+        # Entries with a term under this node; a set while building, then a
+        # sorted tuple so a prefix lookup needs no subtree walk
+        self.indexes: Any = set()
+
+
+def _build_keyword_trie(terms: Dict[str, List[int]]) -> _KeywordTrieNode:
+    """Build a character trie over terms, each node holding its subtree's entries."""
+    root = _KeywordTrieNode()
+    for term, indexes in terms.items():
+        node = root
+        for char in term:
+            node = node.children.setdefault(char, _KeywordTrieNode())
+            node.indexes.update(indexes)
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        node.indexes = tuple(sorted(node.indexes))
+        stack.extend(node.children.values())
+    return root
+
+
+_KEYWORD_TRIE = _build_keyword_trie(_TERM_TO_CODES)
+
+
+def lookup_cost_codes_by_prefix(prefix: str) -> List[Dict[str, Any]]:
+    """Return the mock cost codes with a keyword or word starting with prefix.
+    
+    For autocomplete over partial input: "cabi" finds every cabinet code.
+    Runs in O(len(prefix)) plus the size of the result.
+    
+    Args:
+        prefix: Partial keyword, case-insensitive. Blank input matches nothing.
+        
+    Returns:
+        Matching cost code entries in MOCK_COST_CODES order.
+    """
+    # Only leading blanks are dropped: "floor " should not also match "flooring"
+    prefix = prefix.lstrip().lower()
+    if not prefix:
+        return []
+    node = _KEYWORD_TRIE
+    for char in prefix:
+        node = node.children.get(char)
+        if node is None:
+            return []
+    return [MOCK_COST_CODES[i] for i in node.indexes]
+
+
+def lookup_cost_codes_by_keyword(keyword: str) -> List[Dict[str, Any]]:
+    """Return the mock cost codes listing a keyword, or a word of one.
+    
+    Exact, case-insensitive match: "cabinet" finds entries with the keyword
+    "base cabinet" but "cab" finds nothing. Use get_cost_code() for fuzzy
+    matching of free-text descriptions.
+    
+    Args:
+        keyword: Keyword or single word (e.g., 'vanity', 'floor protection').
+        
+    Returns:
+        Matching cost code entries in MOCK_COST_CODES order.
+    """
+    return [MOCK_COST_CODES[i] for i in _TERM_TO_CODES.get(keyword.strip().lower(), ())]
+
+
+def lookup_cost_codes_by_division(division_code: str) -> List[Dict[str, Any]]:
+    """Return the mock cost codes in a CSI division.
+    
+    Args:
+        division_code: 2-digit CSI division code (e.g., '06').
+        
+    Returns:
+        Cost code entries in MOCK_COST_CODES order.
+    """
+    return [MOCK_COST_CODES[i] for i in _DIVISION_TO_CODES.get(division_code, ())]
+
+
+def _keyword_candidates(description: str) -> List[Dict[str, Any]]:
+    """Return the mock cost codes with a keyword found in description.
+    
+    Keywords are matched as substrings (so "tile" still hits "tiles"), each
+    distinct keyword checked once. Codes come back in MOCK_COST_CODES order so
+    fuzzy-match ties resolve as they would over the full list.
+    
+    Args:
+        description: Normalized item description (lowercase).
+        
+    Returns:
+        Candidate cost code entries.
+    """
+    indexes = set()
+    for keyword, code_indexes in _KEYWORD_TO_CODES.items():
+        if keyword in description:
+            indexes.update(code_indexes)
+    return [MOCK_COST_CODES[i] for i in sorted(indexes)]
+
+
+# =============================================================================
+# MOCK EQUIPMENT RATES
+# =============================================================================
+
+# Mock equipment rental rates per day (P50 base)
+_EQUIPMENT_RATES: Dict[str, float] = {
+    "dumpster_10yd": 450.0,
+    "dumpster_20yd": 550.0,
+    "dumpster_30yd": 650.0,
+    "scaffold": 75.0,
+    "lift": 250.0,
+    "compressor": 85.0,
+    "generator": 125.0,
+    "saw_table": 45.0,
+    "saw_miter": 35.0,
+    "drill_hammer": 55.0,
+}
+
+_DEFAULT_EQUIPMENT_RATE = 100.0
+
+# Spaces and hyphens in equipment descriptions both become underscores
+_EQUIPMENT_KEY_TRANS = str.maketrans(" -", "__")
+
+
+@lru_cache(maxsize=512)
+def _resolve_equipment_rate(equipment_type: str) -> float:
+    """Resolve an equipment description to its daily base rate.
+    
+    Args:
+        equipment_type: Type of equipment (e.g., 'dumpster', 'Scaffold').
+        
+    Returns:
+        Daily P50 rate of the first matching entry, or the default rate.
+    """
+    # Normalize equipment type
+    equipment_key = equipment_type.lower().translate(_EQUIPMENT_KEY_TRANS)
+    
+    for key, rate in _EQUIPMENT_RATES.items():
+        if key in equipment_key or equipment_key in key:
+            return rate
+    return _DEFAULT_EQUIPMENT_RATE
+
 """
 Location Intelligence Service for TrueCost.
 
@@ -1759,9 +1959,9 @@ Provides zip-code-based cost factors including labor rates, union status,
 permit costs, and weather/seasonal factors for construction estimation.
 
 Architecture:
-- Firestore collection: /costData/locationFactors/{zipCode}
+- Firestore collection: /costData_locationFactors/{zipCode}
 - Falls back to regional defaults when specific zip not found
-- In-memory LRU cache with 24-hour TTL for performance
+- In-memory FIFO cache with 24-hour TTL for performance
 - Uses structlog for structured logging
 
 References:
@@ -1769,61 +1969,113 @@ References:
 - docs/architecture.md (ADR-005: Firestore for cost data)
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
+import importlib.util
+import logging
+import math
+import operator
+import sys
+import threading
 import time
-import re
 import asyncio
 
+import numpy as np
 import structlog
 
 # Configure structlog logger
 logger = structlog.get_logger(__name__)
 
+# Stdlib logger for the LocationCache and cache-hit hot paths: %-style args
+# are only formatted when the level is enabled, with no structlog event dict
+# per call
+_stdlog = logging.getLogger(__name__)
+
 
 # =============================================================================
 # Data Models (Task 1)
 # =============================================================================
 
 
-@dataclass
-class PermitCosts:
+class PermitCosts(NamedTuple):
     """
-    Permit cost structure for a location.
+    Permit cost structure for a location (immutable).
 
     Attributes:
         base_percentage: Percentage of project value (e.g., 0.02 for 2%)
         minimum: Minimum permit fee in dollars
-        maximum: Maximum permit fee cap (None if no cap)
+        maximum: Maximum permit fee cap (math.inf if no cap, so a cap check
+            is always ``fee > maximum``; map inf to null when serializing)
         inspection_fee: Inspection fee in dollars
     """
 
     base_percentage: float
     minimum: float
-    maximum: Optional[float]
+    maximum: float
     inspection_fee: float
 
 
-@dataclass
-class WeatherFactors:
+class WeatherFactors(NamedTuple):
     """
-    Weather and seasonal factors affecting construction productivity.
+    Weather and seasonal factors affecting construction productivity (immutable).
 
     Attributes:
         winter_slowdown: Productivity multiplier for winter (e.g., 1.15 = 15% slower)
         summer_premium: Premium multiplier for summer work (e.g., 1.0 = no premium)
-        rainy_season_months: List of month numbers (1-12) with elevated rain
+        rainy_season_mask: Rainy months as a bitmask, bit m-1 set for month m
+            (build with rainy_season_mask(months))
         outdoor_work_adjustment: General outdoor work adjustment factor
     """
 
     winter_slowdown: float
     summer_premium: float
-    rainy_season_months: List[int]
+    rainy_season_mask: int
     outdoor_work_adjustment: float
 
+    @property
+    def rainy_season_months(self) -> List[int]:
+        """Month numbers (1-12) with elevated rain, ascending."""
+        mask = self.rainy_season_mask
+        return [m for m in range(1, 13) if mask >> (m - 1) & 1]
+
+    def is_rainy(self, month: int) -> bool:
+        """True if month (1-12) is in the rainy season."""
+        return bool(self.rainy_season_mask & (1 << (month - 1)))
+
+
+def rainy_season_mask(months: List[int]) -> int:
+    """Pack month numbers (1-12) into a WeatherFactors.rainy_season_mask."""
+    mask = 0
+    for month in months:
+        mask |= 1 << (month - 1)
+    return mask
+
+
+def _make_permit_fee(
+    base_percentage: float, minimum: float, maximum: float, inspection_fee: float
+) -> Callable[[float], float]:
+    """
+    Build a permit fee function with the permit terms bound as closure locals.
+
+    The fee is ``project_value * base_percentage`` clamped to
+    [minimum, maximum], plus the inspection fee.
+    """
+
+    def permit_fee(project_value: float) -> float:
+        fee = project_value * base_percentage
+        if fee < minimum:
+            fee = minimum
+        elif fee > maximum:
+            fee = maximum
+        return fee + inspection_fee
 
-@dataclass
+    return permit_fee
+
+
+@dataclass(frozen=True, slots=True)
 class LaborRate:
     """
     Labor rate for an individual trade.
@@ -1841,7 +2093,7 @@ class LaborRate:
     total_rate: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MaterialCost:
     """
     Material cost data following RSMeans schema.
@@ -1877,7 +2129,7 @@ class MaterialCost:
     subdivision: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LocationFactors:
     """
     Complete location-specific cost factors for construction estimation.
@@ -1887,26 +2139,52 @@ class LocationFactors:
         region_code: Region identifier ("west", "midwest", "south", "northeast")
         city: City name
         state: State abbreviation
-        labor_rates: Dict mapping trade name to hourly rate
+        labor_rates: Mapping of trade name to hourly rate (read-only for
+            the built-in location data; copy before modifying)
         is_union: Whether this is a union market
         union_premium: Multiplier for union labor (e.g., 1.25)
-        permit_costs: PermitCosts dataclass instance
-        weather_factors: WeatherFactors dataclass instance
+        permit_costs: PermitCosts instance
+        weather_factors: WeatherFactors instance
         is_default: True if using regional fallback data
         data_source: Where data came from ("firestore", "cache", "default")
+        labor_rates_array: Read-only float64 array of labor_rates in
+            REQUIRED_TRADES order (NaN for a missing trade), for vectorized
+            cost math such as ``(rates * hours).sum()``
+        permit_fee: Callable mapping project value to the total permit fee
+            (percentage clamped to minimum/maximum, plus inspection fee)
     """
 
     zip_code: str
     region_code: str
     city: str
     state: str
-    labor_rates: Dict[str, float]
+    labor_rates: Mapping[str, float]
     is_union: bool
     union_premium: float
     permit_costs: PermitCosts
     weather_factors: WeatherFactors
     is_default: bool = False
     data_source: str = "firestore"
+    labor_rates_array: np.ndarray = field(init=False, repr=False, compare=False)
+    permit_fee: Callable[[float], float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen: derived fields are set once here, bypassing __setattr__
+        pc = self.permit_costs
+        object.__setattr__(
+            self,
+            "permit_fee",
+            _make_permit_fee(pc.base_percentage, pc.minimum, pc.maximum, pc.inspection_fee),
+        )
+
+        rates = self.labor_rates
+        array = np.fromiter(
+            (rates.get(trade, np.nan) for trade in REQUIRED_TRADES),
+            dtype=np.float64,
+            count=len(REQUIRED_TRADES),
+        )
+        array.flags.writeable = False
+        object.__setattr__(self, "labor_rates_array", array)
 
 
 # =============================================================================
@@ -1926,8 +2204,9 @@ class ItemNotFoundError(Exception):
 # Constants
 # =============================================================================
 
-# Required trades for labor rates (8 total per AC 4.1.1)
-REQUIRED_TRADES = [
+# Required trades for labor rates (8 total per AC 4.1.1); also the column
+# order of LocationFactors.labor_rates_array
+REQUIRED_TRADES: Tuple[str, ...] = (
     "electrician",
     "plumber",
     "carpenter",
@@ -1936,7 +2215,8 @@ REQUIRED_TRADES = [
     "painter",
     "tile_setter",
     "general_labor",
-]
+)
+_REQUIRED_TRADES_SET = frozenset(REQUIRED_TRADES)
 
 # Zip prefix to region mapping (per story dev notes)
 ZIP_PREFIX_TO_REGION = {
@@ -1952,9 +2232,20 @@ ZIP_PREFIX_TO_REGION = {
     "9": "west",
 }
 
+# ZIP_PREFIX_TO_REGION indexed by digit value, for validated zip codes
+_REGION_BY_DIGIT: Tuple[str, ...] = tuple(ZIP_PREFIX_TO_REGION[str(d)] for d in range(10))
+
 # Cache TTL in seconds (24 hours)
 CACHE_TTL_SECONDS = 24 * 60 * 60
 
+# Cache TTL for regional-default fallbacks (1 hour), so a zip added to
+# Firestore replaces its estimate well before the full TTL
+DEFAULT_FALLBACK_CACHE_TTL_SECONDS = 60 * 60
+
+# Flat Firestore collections, one document per item code / zip code
+MATERIALS_COLLECTION = "costData_materials"
+LOCATION_FACTORS_COLLECTION = "costData_locationFactors"
+
 # Regional default data for fallback (AC 4.1.5)
 REGIONAL_DEFAULTS: Dict[str, Dict] = {
     "northeast": {
@@ -2351,7 +2642,7 @@ LOCATION_DATA: Dict[str, Dict] = {
 # =============================================================================
 
 # Sample material cost data for development/testing
-# In production, this is retrieved from Firestore at /costData/materials/{itemCode}
+# In production, this is retrieved from Firestore at /costData_materials/{itemCode}
 MATERIAL_DATA: Dict[str, Dict] = {
     # Division 09 - Finishes
     "092900": {
@@ -2610,71 +2901,114 @@ MATERIAL_DATA: Dict[str, Dict] = {
 
 class LocationCache:
     """
-    In-memory LRU cache for location factors with TTL support.
+    In-memory FIFO cache for location factors with TTL support.
 
     Implements AC 4.1.6: Response time < 500ms for cached lookups.
-    Cache TTL is 24 hours per story requirements.
+    Cache TTL is 24 hours per story requirements; regional-default
+    fallbacks (is_default=True) expire sooner, after default_ttl_seconds.
+
+    Keys live in a fixed-size ring; once full, each new zip overwrites the
+    oldest insertion. Hits do not reorder entries (FIFO rather than LRU),
+    which keeps get() to a dict lookup plus the TTL check - acceptable for
+    a small zip cache with high temporal locality.
+
+    Expired entries are not returned by get() but keep their slot until it
+    is reused, so a refresh can compare the source document version via
+    get_stale() and keep the existing object if nothing changed.
     """
 
-    def __init__(self, maxsize: int = 128, ttl_seconds: int = CACHE_TTL_SECONDS):
-        self._cache: Dict[str, tuple] = {}  # {zip_code: (data, timestamp)}
+    def __init__(
+        self,
+        maxsize: int = 128,
+        ttl_seconds: int = CACHE_TTL_SECONDS,
+        default_ttl_seconds: Optional[int] = None,
+    ):
         self._maxsize = maxsize
         self._ttl = ttl_seconds
-        self._access_order: List[str] = []
+        self._default_ttl = (
+            min(ttl_seconds, DEFAULT_FALLBACK_CACHE_TTL_SECONDS)
+            if default_ttl_seconds is None
+            else default_ttl_seconds
+        )
+        self._data: Dict[str, Tuple[LocationFactors, float, object]] = {}  # {zip_code: (data, monotonic expiry, version)}
+        self._ring: List[Optional[str]] = [None] * maxsize  # insertion-ordered keys
+        self._pos: Dict[str, int] = {}  # {zip_code: ring slot}
+        self._head = 0  # next slot to fill / evict
 
     def get(self, zip_code: str) -> Optional[LocationFactors]:
         """Get cached location factors if present and not expired."""
-        if zip_code not in self._cache:
+        entry = self._data.get(zip_code)
+        if entry is None:
             return None
 
-        data, timestamp = self._cache[zip_code]
-        if time.time() - timestamp > self._ttl:
-            # Expired - remove and return None
-            self._remove(zip_code)
-            logger.info(
-                "cache_expired",
-                zip_code=zip_code,
-                age_seconds=time.time() - timestamp,
-            )
+        data, expires_at, _ = entry
+        if time.monotonic() > expires_at:
+            # Expired - kept for get_stale() until refreshed or evicted
+            _stdlog.debug("cache_expired zip_code=%s", zip_code)
             return None
 
-        # Update access order for LRU
-        self._access_order.remove(zip_code)
-        self._access_order.append(zip_code)
-
-        logger.info("cache_hit", zip_code=zip_code)
+        _stdlog.debug("cache_hit zip_code=%s", zip_code)
         return data
 
-    def set(self, zip_code: str, data: LocationFactors) -> None:
-        """Store location factors in cache."""
-        if len(self._cache) >= self._maxsize and zip_code not in self._cache:
-            # Evict least recently used
-            oldest = self._access_order.pop(0)
-            del self._cache[oldest]
-            logger.info("cache_evicted", evicted_zip=oldest)
+    def get_stale(self, zip_code: str) -> Optional[Tuple[LocationFactors, object]]:
+        """Get (data, version) for a zip even if expired, or None if absent."""
+        entry = self._data.get(zip_code)
+        if entry is None:
+            return None
+        return entry[0], entry[2]
 
-        self._cache[zip_code] = (data, time.time())
-        if zip_code in self._access_order:
-            self._access_order.remove(zip_code)
-        self._access_order.append(zip_code)
-        logger.info("cache_set", zip_code=zip_code)
+    def set(self, zip_code: str, data: LocationFactors, version: object = None) -> None:
+        """
+        Store location factors in cache.
+
+        Args:
+            zip_code: Zip code key
+            data: LocationFactors to cache
+            version: Optional source version (Firestore update_time) for
+                revalidation after expiry
+        """
+        # Keys are interned so cached zips share one string object with the
+        # interned LOCATION_DATA / source literals
+        zip_code = sys.intern(zip_code)
+        if zip_code not in self._data:
+            head = self._head
+            oldest = self._ring[head]
+            if oldest is not None:
+                # Evict the oldest insertion
+                self._remove(oldest)
+                _stdlog.debug("cache_evicted evicted_zip=%s", oldest)
+            self._ring[head] = zip_code
+            self._pos[zip_code] = head
+            self._head = (head + 1) % self._maxsize
+
+        # CostDataService caches models.location_factors instances, which
+        # have no is_default flag
+        ttl = self._default_ttl if getattr(data, "is_default", False) else self._ttl
+        self._data[zip_code] = (data, time.monotonic() + ttl, version)
+        _stdlog.debug("cache_set zip_code=%s ttl_seconds=%s", zip_code, ttl)
 
     def _remove(self, zip_code: str) -> None:
-        """Remove entry from cache."""
-        if zip_code in self._cache:
-            del self._cache[zip_code]
-        if zip_code in self._access_order:
-            self._access_order.remove(zip_code)
+        """Remove entry from cache, freeing its ring slot."""
+        del self._data[zip_code]
+        self._ring[self._pos.pop(zip_code)] = None
+
+    def __len__(self) -> int:
+        return len(self._data)
 
     def clear(self) -> None:
         """Clear all cache entries."""
-        self._cache.clear()
-        self._access_order.clear()
+        self._data.clear()
+        self._pos.clear()
+        self._ring = [None] * self._maxsize
+        self._head = 0
 
 
 # Global cache instance
 _location_cache = LocationCache()
 
+# zip code -> task resolving a cache miss, while one is in flight
+_location_inflight: Dict[str, "asyncio.Task[LocationFactors]"] = {}
+
 
 # =============================================================================
 # Helper Functions
@@ -2693,7 +3027,7 @@ def _validate_zip_code(zip_code: str) -> None:
     """
     if not isinstance(zip_code, str):
         raise ValueError(f"Zip code must be a string, got {type(zip_code).__name__}")
-    if not re.match(r"^\d{5}$", zip_code):
+    if len(zip_code) != 5 or not (zip_code.isascii() and zip_code.isdigit()):
         raise ValueError(
             f"Invalid zip code format: '{zip_code}'. Expected 5-digit US zip code."
         )
@@ -2704,13 +3038,18 @@ def _get_region_from_zip(zip_code: str) -> str:
     Map zip code prefix to region code.
 
     Args:
-        zip_code: 5-digit zip code
+        zip_code: 5-digit zip code (already validated)
 
     Returns:
         Region code: "northeast", "south", "midwest", or "west"
     """
-    prefix = zip_code[0]
-    return ZIP_PREFIX_TO_REGION.get(prefix, "west")
+    # A single tuple index; memoizing (lru_cache) measured no faster
+    return _REGION_BY_DIGIT[ord(zip_code[0]) - 48]
+
+
+def _permit_cap(maximum: Optional[float]) -> float:
+    """Stored permit cap: None / missing (no cap) becomes math.inf."""
+    return math.inf if maximum is None else maximum
 
 
 def _build_location_factors(
@@ -2722,6 +3061,9 @@ def _build_location_factors(
     """
     Build LocationFactors dataclass from raw data dict.
 
+    Missing fields fall back to defaults, so this is the builder for data
+    whose schema the module does not control (Firestore documents).
+
     Args:
         zip_code: The zip code
         data: Raw data dictionary
@@ -2733,25 +3075,34 @@ def _build_location_factors(
     """
     permit_data = data.get("permit_costs", {})
     weather_data = data.get("weather_factors", {})
+    labor_rates = data.get("labor_rates", {})
+
+    missing_trades = _REQUIRED_TRADES_SET - labor_rates.keys()
+    if missing_trades:
+        logger.warning(
+            "location_missing_trades",
+            zip_code=zip_code,
+            missing_trades=sorted(missing_trades),
+        )
 
     return LocationFactors(
         zip_code=zip_code,
         region_code=data.get("region_code", _get_region_from_zip(zip_code)),
         city=data.get("city", "Unknown"),
         state=data.get("state", ""),
-        labor_rates=data.get("labor_rates", {}),
+        labor_rates=labor_rates,
         is_union=data.get("is_union", False),
         union_premium=data.get("union_premium", 1.0),
         permit_costs=PermitCosts(
             base_percentage=permit_data.get("base_percentage", 0.02),
             minimum=permit_data.get("minimum", 100.0),
-            maximum=permit_data.get("maximum"),
+            maximum=_permit_cap(permit_data.get("maximum")),
             inspection_fee=permit_data.get("inspection_fee", 100.0),
         ),
         weather_factors=WeatherFactors(
             winter_slowdown=weather_data.get("winter_slowdown", 1.0),
             summer_premium=weather_data.get("summer_premium", 1.0),
-            rainy_season_months=weather_data.get("rainy_season_months", []),
+            rainy_season_mask=rainy_season_mask(weather_data.get("rainy_season_months", [])),
             outdoor_work_adjustment=weather_data.get("outdoor_work_adjustment", 1.0),
         ),
         is_default=is_default,
@@ -2759,6 +3110,69 @@ def _build_location_factors(
     )
 
 
+def _build_trusted_location_factors(
+    zip_code: str,
+    data: Dict,
+    is_default: bool = False,
+    data_source: str = "firestore",
+) -> LocationFactors:
+    """
+    Build LocationFactors from a dict with the complete LOCATION_DATA schema.
+
+    Unlike _build_location_factors this subscripts keys directly with no
+    defaults, so it is only for module-controlled data (LOCATION_DATA,
+    REGIONAL_DEFAULTS); a missing key raises KeyError. labor_rates is
+    exposed through a read-only proxy so callers cannot mutate the
+    module-level tables.
+    """
+    permit_data = data["permit_costs"]
+    weather_data = data["weather_factors"]
+
+    return LocationFactors(
+        zip_code=zip_code,
+        region_code=data["region_code"],
+        city=data["city"],
+        state=data["state"],
+        labor_rates=MappingProxyType(data["labor_rates"]),
+        is_union=data["is_union"],
+        union_premium=data["union_premium"],
+        permit_costs=PermitCosts(
+            base_percentage=permit_data["base_percentage"],
+            minimum=permit_data["minimum"],
+            maximum=_permit_cap(permit_data["maximum"]),
+            inspection_fee=permit_data["inspection_fee"],
+        ),
+        weather_factors=WeatherFactors(
+            winter_slowdown=weather_data["winter_slowdown"],
+            summer_premium=weather_data["summer_premium"],
+            rainy_season_mask=rainy_season_mask(weather_data["rainy_season_months"]),
+            outdoor_work_adjustment=weather_data["outdoor_work_adjustment"],
+        ),
+        is_default=is_default,
+        data_source=data_source,
+    )
+
+
+# LOCATION_DATA is static, so its LocationFactors are built once at import
+# and lookups are a dict get.
+_LOCATION_FACTORS_CACHE: Dict[str, LocationFactors] = {
+    zip_code: _build_trusted_location_factors(zip_code=zip_code, data=data)
+    for zip_code, data in LOCATION_DATA.items()
+}
+
+
+@lru_cache(maxsize=8)
+def _regional_default_template(region: str) -> LocationFactors:
+    """Build the fallback LocationFactors for a region once, on first use."""
+    data = REGIONAL_DEFAULTS.get(region, REGIONAL_DEFAULTS["west"])
+    return _build_trusted_location_factors(
+        zip_code="00000",
+        data={**data, "region_code": region},
+        is_default=True,
+        data_source="default",
+    )
+
+
 def _get_regional_default(zip_code: str) -> LocationFactors:
     """
     Get regional default data for fallback.
@@ -2769,16 +3183,8 @@ def _get_regional_default(zip_code: str) -> LocationFactors:
     Returns:
         LocationFactors with regional defaults and is_default=True
     """
-    region = _get_region_from_zip(zip_code)
-    regional_data = REGIONAL_DEFAULTS.get(region, REGIONAL_DEFAULTS["west"])
-    regional_data["region_code"] = region
-
-    return _build_location_factors(
-        zip_code=zip_code,
-        data=regional_data,
-        is_default=True,
-        data_source="default",
-    )
+    template = _regional_default_template(_get_region_from_zip(zip_code))
+    return replace(template, zip_code=zip_code)
 
 
 # =============================================================================
@@ -2786,7 +3192,59 @@ def _get_regional_default(zip_code: str) -> LocationFactors:
 # =============================================================================
 
 
-async def _lookup_firestore(zip_code: str) -> Optional[Dict]:
+# Firestore client shared by the location and material lookups, created on
+# first use (firebase_admin is imported lazily so tests and local
+# development run without it). Without firebase_admin the lookups serve
+# local data directly instead of hopping to a worker thread.
+_HAS_FIRESTORE = importlib.util.find_spec("firebase_admin") is not None
+_firestore_client = None
+_firestore_import_failed = not _HAS_FIRESTORE
+_firestore_client_lock = threading.Lock()
+
+# Blocking Firestore reads run on their own pool rather than the loop's
+# default executor, so they neither queue behind nor starve other
+# run_in_executor users. Threads are only started on first submit.
+FIRESTORE_MAX_WORKERS = 16
+_firestore_pool = ThreadPoolExecutor(
+    max_workers=FIRESTORE_MAX_WORKERS, thread_name_prefix="firestore"
+)
+
+
+def _get_firestore_client():
+    """
+    Return the shared Firestore client, creating it on first use.
+
+    Raises:
+        ImportError: If firebase_admin is not installed (remembered, so the
+            import is only attempted once)
+        Exception: If the client cannot be created yet (e.g. no Firebase app
+            initialized); the next call retries
+    """
+    global _firestore_client, _firestore_import_failed
+
+    client = _firestore_client
+    if client is not None:
+        return client
+    if _firestore_import_failed:
+        raise ImportError("firebase_admin is not installed")
+
+    with _firestore_client_lock:
+        if _firestore_client is None:
+            try:
+                from firebase_admin import firestore
+            except ImportError:
+                _firestore_import_failed = True
+                raise
+            _firestore_client = firestore.client()
+        return _firestore_client
+
+
+async def _run_in_firestore_pool(fn: Callable[[], object]):
+    """Run a blocking Firestore call on the dedicated pool and await it."""
+    return await asyncio.get_running_loop().run_in_executor(_firestore_pool, fn)
+
+
+async def _lookup_firestore(zip_code: str) -> Tuple[Optional[Dict], object]:
     """
     Look up location factors from Firestore.
 
@@ -2794,39 +3252,75 @@ async def _lookup_firestore(zip_code: str) -> Optional[Dict]:
         zip_code: Zip code to look up
 
     Returns:
-        Document data dict if found, None otherwise
+        (document data dict, document update_time) if found; data is None
+        if not found, and update_time is None for local data
 
     Note:
-        In production, this connects to Firestore at /costData/locationFactors/{zipCode}.
+        In production, this connects to Firestore at /costData_locationFactors/{zipCode}.
         For unit testing, this function can be mocked.
     """
-    try:
-        # Import firebase_admin here to allow graceful fallback in tests
-        from firebase_admin import firestore
-        import asyncio
+    if not _HAS_FIRESTORE:
+        return LOCATION_DATA.get(zip_code), None
 
-        db = firestore.client()
-        doc_ref = db.collection("costData").document("locationFactors").collection(zip_code).document("data")
-        loop = asyncio.get_event_loop()
-        doc = await loop.run_in_executor(None, doc_ref.get)
+    try:
+        db = _get_firestore_client()
+        doc_ref = db.collection(LOCATION_FACTORS_COLLECTION).document(zip_code)
+        doc = await _run_in_firestore_pool(doc_ref.get)
 
         if doc.exists:
-            return doc.to_dict()
-        return None
+            return doc.to_dict(), doc.update_time
+        return None, None
     except ImportError:
         # Firebase not available - use local data for development/testing
         logger.warning(
             "firestore_unavailable",
             message="firebase_admin not installed, using local data",
         )
-        return LOCATION_DATA.get(zip_code)
+        return LOCATION_DATA.get(zip_code), None
     except Exception as e:
         logger.error(
             "firestore_lookup_failed",
             zip_code=zip_code,
             error=str(e),
         )
-        return None
+        return None, None
+
+
+async def _lookup_firestore_many(zip_codes: List[str]) -> Dict[str, Optional[Dict]]:
+    """
+    Look up several location documents from Firestore in one round trip.
+
+    Args:
+        zip_codes: Distinct zip codes to look up
+
+    Returns:
+        Dict mapping each zip code to its document data, or None if not found
+    """
+    if not _HAS_FIRESTORE:
+        return {zip_code: LOCATION_DATA.get(zip_code) for zip_code in zip_codes}
+
+    try:
+        db = _get_firestore_client()
+        collection = db.collection(LOCATION_FACTORS_COLLECTION)
+        doc_refs = [collection.document(zip_code) for zip_code in zip_codes]
+        docs = await _run_in_firestore_pool(lambda: list(db.get_all(doc_refs)))
+
+        # get_all yields snapshots in arbitrary order
+        found = {doc.id: doc.to_dict() for doc in docs if doc.exists}
+        return {zip_code: found.get(zip_code) for zip_code in zip_codes}
+    except ImportError:
+        logger.warning(
+            "firestore_unavailable",
+            message="firebase_admin not installed, using local data",
+        )
+        return {zip_code: LOCATION_DATA.get(zip_code) for zip_code in zip_codes}
+    except Exception as e:
+        logger.error(
+            "firestore_lookup_failed",
+            zip_codes=zip_codes,
+            error=str(e),
+        )
+        return dict.fromkeys(zip_codes)
 
 
 # =============================================================================
@@ -2871,24 +3365,19 @@ async def get_location_factors(zip_code: str) -> LocationFactors:
     # Check cache first (Task 3)
     cached = _location_cache.get(zip_code)
     if cached is not None:
-        latency_ms = (time.perf_counter() - start_time) * 1000
-        logger.info(
-            "location_lookup",
-            zip_code=zip_code,
-            data_source="cache",
-            latency_ms=round(latency_ms, 2),
-        )
+        # Hot path: the stdlib level check skips all record building when
+        # INFO is off, unlike a structlog event dict
+        if _stdlog.isEnabledFor(logging.INFO):
+            _stdlog.info(
+                "location_lookup zip_code=%s data_source=cache latency_ms=%.2f",
+                zip_code,
+                (time.perf_counter() - start_time) * 1000,
+            )
         return cached
 
-    # Try local data first (for known metros)
-    local_data = LOCATION_DATA.get(zip_code)
-    if local_data:
-        result = _build_location_factors(
-            zip_code=zip_code,
-            data=local_data,
-            is_default=False,
-            data_source="firestore",  # Treat local data as if from Firestore
-        )
+    # Try local data first (for known metros); treated as if from Firestore
+    result = _LOCATION_FACTORS_CACHE.get(zip_code)
+    if result is not None:
         _location_cache.set(zip_code, result)
         latency_ms = (time.perf_counter() - start_time) * 1000
         logger.info(
@@ -2899,56 +3388,177 @@ async def get_location_factors(zip_code: str) -> LocationFactors:
         )
         return result
 
-    # Try Firestore lookup (Task 2.4)
-    firestore_data = await _lookup_firestore(zip_code)
+    # Concurrent misses for the same zip share one Firestore lookup. The
+    # lookup runs as its own task, shielded so a cancelled caller does not
+    # cancel it for the others; tasks are bound to their event loop, so a
+    # lookup in flight on another loop is not shared.
+    loop = asyncio.get_running_loop()
+    task = _location_inflight.get(zip_code)
+    if task is not None and task.get_loop() is loop:
+        logger.debug("location_lookup_coalesced", zip_code=zip_code)
+        return await asyncio.shield(task)
+
+    task = loop.create_task(_fetch_location_factors(zip_code, start_time))
+    _location_inflight[zip_code] = task
+
+    def _clear_inflight(done: asyncio.Task) -> None:
+        if _location_inflight.get(zip_code) is done:
+            del _location_inflight[zip_code]
+
+    task.add_done_callback(_clear_inflight)
+    return await asyncio.shield(task)
+
+
+async def _fetch_location_factors(zip_code: str, start_time: float) -> LocationFactors:
+    """
+    Resolve a cache miss from Firestore or regional defaults and cache it.
+
+    Runs once per zip for all concurrent callers of get_location_factors.
+    """
+    # Try Firestore lookup (Task 2.4). The built result is reused through
+    # _location_cache; documents are not memoized by content since their
+    # nested maps are unhashable and id()-based keys are reused after GC.
+    firestore_data, update_time = await _lookup_firestore(zip_code)
+    revalidated = False
     if firestore_data:
-        result = _build_location_factors(
-            zip_code=zip_code,
-            data=firestore_data,
-            is_default=False,
-            data_source="firestore",
-        )
-        _location_cache.set(zip_code, result)
-        latency_ms = (time.perf_counter() - start_time) * 1000
-        logger.info(
-            "location_lookup",
-            zip_code=zip_code,
-            data_source="firestore",
-            latency_ms=round(latency_ms, 2),
-        )
-        return result
+        # An expired entry built from the same document version is reused
+        stale = _location_cache.get_stale(zip_code)
+        if update_time is not None and stale is not None and stale[1] == update_time:
+            result = stale[0]
+            revalidated = True
+        else:
+            result = _build_location_factors(
+                zip_code=zip_code,
+                data=firestore_data,
+                is_default=False,
+                data_source="firestore",
+            )
+    else:
+        # Fallback to regional defaults (Task 2.5, 2.6, 2.7) - AC 4.1.5
+        result = _get_regional_default(zip_code)
+        update_time = None
+    _location_cache.set(zip_code, result, version=update_time)
 
-    # Fallback to regional defaults (Task 2.5, 2.6, 2.7) - AC 4.1.5
-    logger.info(
-        "location_fallback",
-        zip_code=zip_code,
-        region=_get_region_from_zip(zip_code),
-    )
-    result = _get_regional_default(zip_code)
-    _location_cache.set(zip_code, result)
+    # One event per lookup; data_source / is_default tell the branches apart
     latency_ms = (time.perf_counter() - start_time) * 1000
     logger.info(
         "location_lookup",
         zip_code=zip_code,
-        data_source="default",
+        data_source=result.data_source,
+        is_default=result.is_default,
+        region=result.region_code,
+        revalidated=revalidated,
         latency_ms=round(latency_ms, 2),
-        is_default=True,
     )
     return result
 
 
+async def get_location_factors_many(zip_codes: List[str]) -> Dict[str, LocationFactors]:
+    """
+    Retrieve location factors for several zip codes at once.
+
+    Cache and local hits are served directly; the remaining zips are fetched
+    from Firestore in a single batched read instead of one round trip each.
+
+    Args:
+        zip_codes: 5-digit US zip codes (duplicates are looked up once)
+
+    Returns:
+        Dict mapping each distinct zip code to its LocationFactors
+
+    Raises:
+        ValueError: If any zip_code format is invalid (not 5 digits)
+    """
+    start_time = time.perf_counter()
+
+    for zip_code in zip_codes:
+        _validate_zip_code(zip_code)
+
+    results: Dict[str, LocationFactors] = {}
+    misses: List[str] = []
+    cache_hits = 0
+    for zip_code in dict.fromkeys(zip_codes):
+        result = _location_cache.get(zip_code)
+        if result is not None:
+            cache_hits += 1
+        else:
+            result = _LOCATION_FACTORS_CACHE.get(zip_code)
+            if result is None:
+                misses.append(zip_code)
+                continue
+            _location_cache.set(zip_code, result)
+        results[zip_code] = result
+
+    defaults = 0
+    if misses:
+        firestore_data = await _lookup_firestore_many(misses)
+        for zip_code in misses:
+            data = firestore_data.get(zip_code)
+            if data:
+                result = _build_location_factors(
+                    zip_code=zip_code,
+                    data=data,
+                    is_default=False,
+                    data_source="firestore",
+                )
+            else:
+                result = _get_regional_default(zip_code)
+                defaults += 1
+            _location_cache.set(zip_code, result)
+            results[zip_code] = result
+
+    latency_ms = (time.perf_counter() - start_time) * 1000
+    logger.info(
+        "location_lookup_many",
+        count=len(results),
+        cache_hits=cache_hits,
+        firestore_misses=len(misses),
+        defaults=defaults,
+        latency_ms=round(latency_ms, 2),
+    )
+    return results
+
+
 # =============================================================================
 # Synchronous Wrapper (for non-async contexts)
 # =============================================================================
 
 
+# Event loop serving get_location_factors_sync, run forever on a daemon
+# thread so sync callers don't build and tear down a loop per call.
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_loop_lock = threading.Lock()
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop, starting its thread on first use."""
+    global _sync_loop
+
+    loop = _sync_loop
+    if loop is not None:
+        return loop
+
+    with _sync_loop_lock:
+        if _sync_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="location-sync-loop",
+                daemon=True,
+            ).start()
+            _sync_loop = loop
+        return _sync_loop
+
+
 def get_location_factors_sync(zip_code: str) -> LocationFactors:
     """
     Synchronous wrapper for get_location_factors.
 
-    For use in contexts where async is not available.
+    For use in contexts where async is not available. Lookups run on a
+    shared background event loop; must not be called from that loop.
     """
-    return asyncio.run(get_location_factors(zip_code))
+    future = asyncio.run_coroutine_threadsafe(get_location_factors(zip_code), _get_sync_loop())
+    return future.result()
 
 
 # =============================================================================
@@ -2956,6 +3566,32 @@ def get_location_factors_sync(zip_code: str) -> LocationFactors:
 # =============================================================================
 
 
+async def warm_location_cache(zip_codes: Optional[List[str]] = None) -> int:
+    """
+    Pre-populate the location cache, e.g. from a process startup hook.
+
+    Every zip in the bundled LOCATION_DATA is inserted from its prebuilt
+    LocationFactors. Any extra zip_codes are resolved through
+    get_location_factors_many, so those not held locally are read from
+    Firestore in a single batched call.
+
+    Args:
+        zip_codes: Optional additional zip codes to warm
+
+    Returns:
+        Number of zip codes now cached by the warm-up
+    """
+    for zip_code, factors in _LOCATION_FACTORS_CACHE.items():
+        _location_cache.set(zip_code, factors)
+    warmed = set(_LOCATION_FACTORS_CACHE)
+
+    if zip_codes:
+        warmed.update(await get_location_factors_many(zip_codes))
+
+    logger.info("location_cache_warmed", count=len(warmed))
+    return len(warmed)
+
+
 def clear_location_cache() -> None:
     """Clear the location factors cache. Useful for testing."""
     _location_cache.clear()
@@ -2965,9 +3601,10 @@ def clear_location_cache() -> None:
 def get_cache_stats() -> Dict:
     """Get cache statistics for monitoring."""
     return {
-        "size": len(_location_cache._cache),
+        "size": len(_location_cache),
         "maxsize": _location_cache._maxsize,
         "ttl_seconds": _location_cache._ttl,
+        "default_ttl_seconds": _location_cache._default_ttl,
     }
 
 
@@ -2976,6 +3613,25 @@ def get_cache_stats() -> Dict:
 # =============================================================================
 
 
+# Default for every MaterialCost field after item_code, in declaration order,
+# so _build_material_cost can fill the constructor positionally
+_MATERIAL_DEFAULTS: Dict[str, object] = {
+    "description": "",
+    "unit": "",
+    "unit_cost": 0.0,
+    "labor_hours": 0.0,
+    "crew": "",
+    "crew_daily_output": 0.0,
+    "productivity_factor": 1.0,
+    "cost_low": 0.0,
+    "cost_likely": 0.0,
+    "cost_high": 0.0,
+    "csi_division": "",
+    "subdivision": "",
+}
+_material_field_values = operator.itemgetter(*_MATERIAL_DEFAULTS)
+
+
 def _build_material_cost(item_code: str, data: Dict) -> MaterialCost:
     """
     Build MaterialCost dataclass from raw data dict.
@@ -2987,21 +3643,131 @@ def _build_material_cost(item_code: str, data: Dict) -> MaterialCost:
     Returns:
         MaterialCost instance
     """
-    return MaterialCost(
-        item_code=item_code,
-        description=data.get("description", ""),
-        unit=data.get("unit", ""),
-        unit_cost=data.get("unit_cost", 0.0),
-        labor_hours=data.get("labor_hours", 0.0),
-        crew=data.get("crew", ""),
-        crew_daily_output=data.get("crew_daily_output", 0.0),
-        productivity_factor=data.get("productivity_factor", 1.0),
-        cost_low=data.get("cost_low", 0.0),
-        cost_likely=data.get("cost_likely", 0.0),
-        cost_high=data.get("cost_high", 0.0),
-        csi_division=data.get("csi_division", ""),
-        subdivision=data.get("subdivision", ""),
-    )
+    return MaterialCost(item_code, *_material_field_values({**_MATERIAL_DEFAULTS, **data}))
+
+
+# MATERIAL_DATA is static, so its MaterialCost instances are built once at
+# import; _MATERIAL_INDEX maps item code -> position in _MATERIALS_TUPLE.
+_MATERIALS_TUPLE: Tuple[MaterialCost, ...] = tuple(
+    _build_material_cost(item_code, data) for item_code, data in MATERIAL_DATA.items()
+)
+_MATERIAL_INDEX: Dict[str, int] = {
+    material.item_code: i for i, material in enumerate(_MATERIALS_TUPLE)
+}
+
+
+def _material_column(attr: str, dtype=np.float64) -> np.ndarray:
+    """Read-only column of one MaterialCost field across _MATERIALS_TUPLE."""
+    column = np.array([getattr(m, attr) for m in _MATERIALS_TUPLE], dtype=dtype)
+    column.flags.writeable = False
+    return column
+
+
+# Structure-of-arrays view of _MATERIALS_TUPLE, row i == _MATERIALS_TUPLE[i]
+_MAT_ITEM_CODES = _material_column("item_code", dtype=object)
+_MAT_UNIT_COST = _material_column("unit_cost")
+_MAT_LABOR_HOURS = _material_column("labor_hours")
+_MAT_CREW_OUTPUT = _material_column("crew_daily_output")
+_MAT_PRODUCTIVITY = _material_column("productivity_factor")
+_MAT_LOW = _material_column("cost_low")
+_MAT_LIKELY = _material_column("cost_likely")
+_MAT_HIGH = _material_column("cost_high")
+_MAT_CSI_DIVISION = _material_column("csi_division", dtype=np.str_)
+
+_MATERIAL_COLUMNS: Dict[str, np.ndarray] = {
+    "item_code": _MAT_ITEM_CODES,
+    "unit_cost": _MAT_UNIT_COST,
+    "labor_hours": _MAT_LABOR_HOURS,
+    "crew_daily_output": _MAT_CREW_OUTPUT,
+    "productivity_factor": _MAT_PRODUCTIVITY,
+    "cost_low": _MAT_LOW,
+    "cost_likely": _MAT_LIKELY,
+    "cost_high": _MAT_HIGH,
+    "csi_division": _MAT_CSI_DIVISION,
+}
+
+# (item_code, description) lowercased once per material for search_materials,
+# overall and bucketed by CSI division, in _MATERIALS_TUPLE order
+_MaterialSearchRow = Tuple[str, str, MaterialCost]
+_MATERIAL_SEARCH_ROWS: Tuple[_MaterialSearchRow, ...] = tuple(
+    (m.item_code.lower(), m.description.lower(), m) for m in _MATERIALS_TUPLE
+)
+_rows_by_csi: Dict[str, List[_MaterialSearchRow]] = {}
+for _row in _MATERIAL_SEARCH_ROWS:
+    _rows_by_csi.setdefault(_row[2].csi_division, []).append(_row)
+_MATERIAL_SEARCH_ROWS_BY_CSI: Dict[str, Tuple[_MaterialSearchRow, ...]] = {
+    csi: tuple(rows) for csi, rows in _rows_by_csi.items()
+}
+del _rows_by_csi, _row
+
+
+def material_indices(item_codes: List[str]) -> np.ndarray:
+    """
+    Map local material item codes to row indices of the material arrays.
+
+    Args:
+        item_codes: Item codes to look up
+
+    Returns:
+        int array of row indices, in input order
+
+    Raises:
+        ItemNotFoundError: If an item code is not in the local material data
+    """
+    try:
+        return np.fromiter(
+            (_MATERIAL_INDEX[code] for code in item_codes),
+            dtype=np.intp,
+            count=len(item_codes),
+        )
+    except KeyError as e:
+        raise ItemNotFoundError(e.args[0]) from None
+
+
+def materials_by_indices(indices: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Gather material cost columns for a set of rows.
+
+    Lets project-level rollups work on whole columns at once, e.g.
+    ``cols["cost_likely"] * quantities * cols["productivity_factor"]``.
+
+    Args:
+        indices: Row indices from material_indices()
+
+    Returns:
+        Dict of field name -> array with one entry per index
+    """
+    return {name: column[indices] for name, column in _MATERIAL_COLUMNS.items()}
+
+
+def material_indices_where(
+    csi_division: Optional[str] = None,
+    min_unit_cost: Optional[float] = None,
+    max_unit_cost: Optional[float] = None,
+) -> np.ndarray:
+    """
+    Select local material rows by CSI division and unit cost range.
+
+    Evaluated as one boolean mask over the material columns, e.g. all
+    division "09" materials under $5 per unit; feed the result to
+    materials_by_indices() for the matching columns.
+
+    Args:
+        csi_division: Only rows in this CSI division (e.g., "09")
+        min_unit_cost: Only rows with unit_cost >= this value
+        max_unit_cost: Only rows with unit_cost <= this value
+
+    Returns:
+        int array of matching row indices, in _MATERIALS_TUPLE order
+    """
+    mask = np.ones(len(_MATERIALS_TUPLE), dtype=bool)
+    if csi_division is not None:
+        mask &= _MAT_CSI_DIVISION == csi_division
+    if min_unit_cost is not None:
+        mask &= _MAT_UNIT_COST >= min_unit_cost
+    if max_unit_cost is not None:
+        mask &= _MAT_UNIT_COST <= max_unit_cost
+    return np.flatnonzero(mask)
 
 
 async def _lookup_material_firestore(item_code: str) -> Optional[Dict]:
@@ -3015,16 +3781,16 @@ async def _lookup_material_firestore(item_code: str) -> Optional[Dict]:
         Document data dict if found, None otherwise
 
     Note:
-        In production, this connects to Firestore at /costData/materials/{itemCode}.
+        In production, this connects to Firestore at /costData_materials/{itemCode}.
         For unit testing, this function can be mocked.
     """
-    try:
-        from firebase_admin import firestore
+    if not _HAS_FIRESTORE:
+        return MATERIAL_DATA.get(item_code)
 
-        db = firestore.client()
-        doc_ref = db.collection("costData").document("materials").collection(item_code).document("data")
-        loop = asyncio.get_event_loop()
-        doc = await loop.run_in_executor(None, doc_ref.get)
+    try:
+        db = _get_firestore_client()
+        doc_ref = db.collection(MATERIALS_COLLECTION).document(item_code)
+        doc = await _run_in_firestore_pool(doc_ref.get)
 
         if doc.exists:
             return doc.to_dict()
@@ -3070,9 +3836,9 @@ async def get_material_cost(item_code: str) -> MaterialCost:
     start_time = time.perf_counter()
 
     # Try local data first (for development/testing)
-    local_data = MATERIAL_DATA.get(item_code)
-    if local_data:
-        result = _build_material_cost(item_code, local_data)
+    index = _MATERIAL_INDEX.get(item_code)
+    if index is not None:
+        result = _MATERIALS_TUPLE[index]
         latency_ms = (time.perf_counter() - start_time) * 1000
         logger.info(
             "material_lookup",
@@ -3128,16 +3894,59 @@ async def get_labor_rate(trade: str, zip_code: str) -> LaborRate:
     location = await get_location_factors(zip_code)
 
     if trade not in location.labor_rates:
-        raise ValueError(f"Unknown trade: {trade}. Valid trades: {REQUIRED_TRADES}")
+        raise ValueError(f"Unknown trade: {trade}. Valid trades: {list(REQUIRED_TRADES)}")
+
+    return _compute_labor_rate(
+        trade, location.labor_rates[trade], location.is_union, location.union_premium
+    )
+
+
+async def get_labor_rates_bulk(trades: List[str], zip_code: str) -> List[LaborRate]:
+    """
+    Get labor rates for several trades at one location.
+
+    Resolves the location once instead of once per trade.
+
+    Args:
+        trades: Trade names (e.g., ["electrician", "plumber"])
+        zip_code: 5-digit US zip code
+
+    Returns:
+        LaborRate per trade, in input order
 
-    base_rate = location.labor_rates[trade]
+    Raises:
+        ValueError: If any trade is not found or zip code is invalid
+    """
+    location = await get_location_factors(zip_code)
+    rates = location.labor_rates
+
+    unknown = [trade for trade in trades if trade not in rates]
+    if unknown:
+        raise ValueError(f"Unknown trades: {unknown}. Valid trades: {list(REQUIRED_TRADES)}")
+
+    return [
+        _compute_labor_rate(trade, rates[trade], location.is_union, location.union_premium)
+        for trade in trades
+    ]
+
+
+@lru_cache(maxsize=2048)
+def _compute_labor_rate(
+    trade: str, base_rate: float, is_union: bool, union_premium: float
+) -> LaborRate:
+    """
+    Build the (frozen, shared) LaborRate for a trade's base rate.
+
+    Memoized on its inputs, so repeated lookups for the same trade at the
+    same location reuse one instance instead of recomputing.
+    """
     # Standard benefits burden of 35%
     benefits_burden = 0.35
     total_rate = base_rate * (1 + benefits_burden)
 
     # Apply union premium if applicable
-    if location.is_union:
-        total_rate *= location.union_premium
+    if is_union:
+        total_rate *= union_premium
 
     return LaborRate(
         trade=trade,
@@ -3176,16 +3985,19 @@ async def search_materials(
     results = []
     query_lower = query.lower()
 
-    # Search local data
-    for item_code, data in MATERIAL_DATA.items():
+    # Search local data, restricted up front to the CSI division if specified
+    if csi_division is None:
+        rows = _MATERIAL_SEARCH_ROWS
+    else:
+        rows = _MATERIAL_SEARCH_ROWS_BY_CSI.get(csi_division, ())
+
+    for code_lower, description_lower, material in rows:
         # Check if query matches item code or description
-        if query_lower in item_code.lower() or query_lower in data.get("description", "").lower():
-            # Apply CSI division filter if specified
-            if csi_division is None or data.get("csi_division") == csi_division:
-                results.append(_build_material_cost(item_code, data))
+        if query_lower in code_lower or query_lower in description_lower:
+            results.append(material)
 
-                if len(results) >= limit:
-                    break
+            if len(results) >= limit:
+                break
 
     latency_ms = (time.perf_counter() - start_time) * 1000
     logger.info(
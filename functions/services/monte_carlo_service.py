@@ -7,9 +7,9 @@ The simulation uses triangular distributions for cost items and
 aggregates results to calculate percentile values.
 """
 
-import random
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 import structlog
 
 from models.risk_analysis import (
@@ -21,10 +21,33 @@ from models.risk_analysis import (
     RiskCategory,
     RiskFactor,
     RiskImpact,
+    risk_factor_arrays,
 )
 
 logger = structlog.get_logger()
 
+# Number of histogram bins in simulation results
+HISTOGRAM_BINS = 20
+
+
+def histogram_bin_counts(values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """Count values per histogram bin for precomputed edges in O(n).
+    
+    Values outside the edges are clipped into the first/last bin, and the
+    last bin is closed on the right like ``np.histogram``.
+    
+    Args:
+        values: Sample values.
+        edges: Monotonic bin edges (``len(edges) - 1`` bins).
+        
+    Returns:
+        Integer counts per bin.
+    """
+    num_bins = len(edges) - 1
+    idx = np.searchsorted(edges, values, side="right") - 1
+    np.clip(idx, 0, num_bins - 1, out=idx)
+    return np.bincount(idx, minlength=num_bins)
+
 
 # =============================================================================
 # DEFAULT RISK FACTORS BY CATEGORY
@@ -138,24 +161,10 @@ class MonteCarloService:
             seed: Random seed for reproducibility (optional).
         """
         self._seed = seed
-        if seed is not None:
-            random.seed(seed)
+        self._rng = np.random.default_rng(seed)
         
         logger.info("monte_carlo_service_initialized", mock=True, seed=seed)
     
-    def _triangular(self, low: float, mode: float, high: float) -> float:
-        """Generate a random value from triangular distribution.
-        
-        Args:
-            low: Minimum value.
-            mode: Most likely value (peak of distribution).
-            high: Maximum value.
-            
-        Returns:
-            Random value from triangular distribution.
-        """
-        return random.triangular(low, high, mode)
-    
     def _calculate_percentile(self, values: List[float], percentile: float) -> float:
         """Calculate percentile value from sorted list.
         
@@ -235,7 +244,8 @@ class MonteCarloService:
         risk_factors: List[RiskFactor],
         iterations: int = 1000,
         cost_variance_low: float = 0.90,
-        cost_variance_high: float = 1.10
+        cost_variance_high: float = 1.10,
+        bin_edges: Optional[Sequence[float]] = None
     ) -> MonteCarloResult:
         """Run Monte Carlo simulation for cost risk analysis.
         
@@ -245,6 +255,8 @@ class MonteCarloService:
             iterations: Number of simulation iterations.
             cost_variance_low: Base cost variance low multiplier.
             cost_variance_high: Base cost variance high multiplier.
+            bin_edges: Histogram edges to reuse, e.g. a base scenario's
+                ``histogram_bins``, so scenarios share one x-axis.
             
         Returns:
             MonteCarloResult with percentiles and statistics.
@@ -256,40 +268,30 @@ class MonteCarloService:
             risk_factor_count=len(risk_factors)
         )
         
-        results: List[float] = []
-        variance_contributions: Dict[str, List[float]] = {rf.id: [] for rf in risk_factors}
+        # Risk factors as parallel arrays; every draw for every iteration is
+        # made in one vectorized call instead of a Python double loop.
+        probs, lows, highs = risk_factor_arrays(risk_factors)
+        shape = (iterations, len(risk_factors))
         
-        for _ in range(iterations):
-            # Start with base cost variance
-            iteration_cost = self._triangular(
-                base_cost * cost_variance_low,
-                base_cost,
-                base_cost * cost_variance_high
-            )
-            
-            # Apply each risk factor
-            for rf in risk_factors:
-                # Determine if risk occurs this iteration
-                if random.random() < rf.probability:
-                    # Calculate impact using triangular distribution
-                    mode = (rf.cost_impact_low + rf.cost_impact_high) / 2
-                    impact = self._triangular(
-                        rf.cost_impact_low,
-                        mode,
-                        rf.cost_impact_high
-                    )
-                    iteration_cost += impact
-                    variance_contributions[rf.id].append(impact)
-                else:
-                    variance_contributions[rf.id].append(0.0)
-            
-            results.append(iteration_cost)
+        low_cost = base_cost * cost_variance_low
+        high_cost = base_cost * cost_variance_high
+        if low_cost < high_cost:
+            costs = self._rng.triangular(low_cost, base_cost, high_cost, size=iterations)
+        else:
+            costs = np.full(iterations, float(base_cost))
+        
+        # Impact mode is the midpoint, so scale a unit Tri(0, 0.5, 1) draw
+        unit_impacts = self._rng.triangular(0.0, 0.5, 1.0, size=shape)
+        occurred = self._rng.random(shape) < probs
+        impacts = np.where(occurred, lows + (highs - lows) * unit_impacts, 0.0)
+        costs += impacts.sum(axis=1)
         
         # Sort for percentile calculation
-        results.sort()
+        results: List[float] = np.sort(costs).tolist()
         
-        # Calculate percentiles
-        percentiles = PercentileValues(
+        # Calculate percentiles. Percentiles of sorted data are already
+        # ascending, so skip PercentileValues' order validator.
+        percentiles = PercentileValues.model_construct(
             p10=round(self._calculate_percentile(results, 10), 2),
             p25=round(self._calculate_percentile(results, 25), 2),
             p50=round(self._calculate_percentile(results, 50), 2),
@@ -299,20 +301,20 @@ class MonteCarloService:
             p95=round(self._calculate_percentile(results, 95), 2),
         )
         
-        # Calculate statistics
-        mean = sum(results) / len(results)
-        variance = sum((x - mean) ** 2 for x in results) / len(results)
-        std_dev = variance ** 0.5
+        # Calculate statistics (population moments, computed in NumPy)
+        mean = float(costs.mean())
+        deviations = costs - mean
+        std_dev = float(np.sqrt(np.mean(np.square(deviations))))
         
         # Calculate skewness
         if std_dev > 0:
-            skewness = sum((x - mean) ** 3 for x in results) / (len(results) * std_dev ** 3)
+            skewness = float(np.mean(deviations ** 3)) / std_dev ** 3
         else:
             skewness = 0.0
         
-        statistics = DistributionStatistics(
-            min=round(min(results), 2),
-            max=round(max(results), 2),
+        statistics = DistributionStatistics.model_construct(
+            min=round(results[0], 2),
+            max=round(results[-1], 2),
             mean=round(mean, 2),
             std_dev=round(std_dev, 2),
             median=round(self._calculate_percentile(results, 50), 2),
@@ -320,14 +322,11 @@ class MonteCarloService:
         )
         
         # Calculate variance contribution for each risk factor
-        total_variance = sum(
-            sum(v ** 2 for v in contributions)
-            for contributions in variance_contributions.values()
-        )
+        rf_variances = np.square(impacts).sum(axis=0)
+        total_variance = float(rf_variances.sum())
         
         if total_variance > 0:
-            for rf in risk_factors:
-                rf_variance = sum(v ** 2 for v in variance_contributions[rf.id])
+            for rf, rf_variance in zip(risk_factors, rf_variances.tolist()):
                 rf.variance_contribution = round(rf_variance / total_variance, 4)
         
         # Sort risks by variance contribution
@@ -337,15 +336,12 @@ class MonteCarloService:
             reverse=True
         )[:5]
         
-        # Create histogram (20 bins)
-        num_bins = 20
-        bin_width = (max(results) - min(results)) / num_bins
-        histogram_bins = [min(results) + i * bin_width for i in range(num_bins + 1)]
-        histogram_counts = [0] * num_bins
-        
-        for value in results:
-            bin_idx = min(int((value - min(results)) / bin_width), num_bins - 1)
-            histogram_counts[bin_idx] += 1
+        # Create histogram (20 bins), reusing caller-supplied edges if given
+        if bin_edges is None:
+            edges = np.histogram_bin_edges(costs, bins=HISTOGRAM_BINS)
+        else:
+            edges = np.asarray(bin_edges, dtype=np.float64)
+        histogram_counts = histogram_bin_counts(costs, edges)
 
         # Build top risks list (by variance contribution, fallback to expected impact)
         top_risks = sorted(
@@ -368,8 +364,8 @@ class MonteCarloService:
             seed=self._seed,
             percentiles=percentiles,
             statistics=statistics,
-            histogram_bins=[round(b, 2) for b in histogram_bins],
-            histogram_counts=histogram_counts,
+            histogram_bins=[round(b, 2) for b in edges.tolist()],
+            histogram_counts=histogram_counts.tolist(),
             top_risk_contributors=top_risk_contributors,
             top_risks=[
                 {
@@ -452,8 +448,8 @@ class MonteCarloService:
             Tuple of (risk_level, key_findings).
         """
         # Calculate coefficient of variation
-        cv = monte_carlo_result.get_coefficient_of_variation()
-        range_spread = monte_carlo_result.get_range_spread()
+        cv = monte_carlo_result.coefficient_of_variation
+        range_spread = monte_carlo_result.range_spread
         
         # Count high-impact risks
         high_impact_count = sum(
@@ -35,6 +35,7 @@ from services.cost_data_service import (
     get_location_factors,
     clear_location_cache,
     REQUIRED_TRADES,
+    LOCATION_FACTORS_COLLECTION,
 )
 
 
@@ -114,24 +115,14 @@ def seed_test_data(firestore_client):
 
     # Seed data
     for zip_code, data in test_data.items():
-        doc_ref = (
-            firestore_client.collection("costData")
-            .document("locationFactors")
-            .collection(zip_code)
-            .document("data")
-        )
+        doc_ref = firestore_client.collection(LOCATION_FACTORS_COLLECTION).document(zip_code)
         doc_ref.set(data)
 
     yield test_data
 
     # Cleanup
     for zip_code in test_data.keys():
-        doc_ref = (
-            firestore_client.collection("costData")
-            .document("locationFactors")
-            .collection(zip_code)
-            .document("data")
-        )
+        doc_ref = firestore_client.collection(LOCATION_FACTORS_COLLECTION).document(zip_code)
         doc_ref.delete()
 
 
@@ -166,7 +157,7 @@ class TestLocationWithFirestore:
     async def test_firestore_document_structure_matches_schema(self, seed_test_data, firestore_client):
         """AC 4.1.1-4.1.5: Verify Firestore document structure matches expected schema."""
         # Expected schema from tech-spec:
-        # /costData/locationFactors/{zipCode}
+        # /costData_locationFactors/{zipCode}
         #   └── { regionCode, city, state, laborRates: {}, isUnion,
         #         permitCosts: {}, weatherFactors: {} }
 
@@ -208,12 +199,7 @@ class TestLocationWithFirestore:
 
         # Fetch the seeded document from Firestore
         test_zip = "12345"
-        doc_ref = (
-            firestore_client.collection("costData")
-            .document("locationFactors")
-            .collection(test_zip)
-            .document("data")
-        )
+        doc_ref = firestore_client.collection(LOCATION_FACTORS_COLLECTION).document(test_zip)
         doc = doc_ref.get()
 
         assert doc.exists, f"Document for zip {test_zip} not found in Firestore"
@@ -1,5 +1,7 @@
 """Unit tests for A2A client."""
 
+import asyncio
+import json
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
@@ -46,6 +48,16 @@ class TestA2AClient:
         assert request["method"] == "message/send"
         assert request["params"]["key"] == "value"
     
+    def test_request_ids_unique(self):
+        """Test request IDs are unique within and across clients."""
+        from services.a2a_client import A2AClient
+        
+        first, second = A2AClient(), A2AClient()
+        ids = [first._create_request_id() for _ in range(100)]
+        ids.append(second._create_request_id())
+        
+        assert len(set(ids)) == len(ids)
+    
     @pytest.mark.asyncio
     async def test_send_task_success(self, mock_a2a_success_response):
         """Test successful task send."""
@@ -53,10 +65,10 @@ class TestA2AClient:
         
         with patch('httpx.AsyncClient') as mock_client:
             mock_response = MagicMock()
-            mock_response.json.return_value = mock_a2a_success_response
+            mock_response.content = json.dumps(mock_a2a_success_response).encode()
             mock_response.raise_for_status = MagicMock()
             
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
             
@@ -77,7 +89,7 @@ class TestA2AClient:
         from config.errors import A2AError
         
         with patch('httpx.AsyncClient') as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 side_effect=httpx.TimeoutException("Timeout")
             )
             
@@ -91,6 +103,124 @@ class TestA2AClient:
             
             assert exc_info.value.code == "A2A_TIMEOUT"
     
+    @pytest.mark.asyncio
+    async def test_wait_for_completion_backs_off(self, mock_a2a_success_response):
+        """Test poll interval grows geometrically up to the cap."""
+        from services.a2a_client import A2AClient
+        
+        working_response = {"result": {"task_id": "task-123", "status": "working"}}
+        client = A2AClient(base_url="http://localhost:5001")
+        client.get_task_status = AsyncMock(
+            side_effect=[working_response] * 4 + [mock_a2a_success_response]
+        )
+        
+        with patch('asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            result = await client.wait_for_completion(
+                target_agent="location",
+                task_id="task-123",
+                poll_interval=1.0,
+                max_wait=60,
+                backoff=2.0,
+                max_poll_interval=5.0
+            )
+        
+        assert result["result"]["status"] == "completed"
+        assert [c.args[0] for c in mock_sleep.await_args_list] == [1.0, 2.0, 4.0, 5.0]
+    
+    @pytest.mark.asyncio
+    async def test_wait_for_completion_deadline_includes_poll_time(self):
+        """Test a slow status call cannot stretch max_wait."""
+        import asyncio
+        import time
+        from services.a2a_client import A2AClient
+        from config.errors import A2AError
+        
+        async def slow_status(*args, **kwargs):
+            await asyncio.sleep(10)
+        
+        client = A2AClient(base_url="http://localhost:5001")
+        client.get_task_status = slow_status
+        
+        start = time.monotonic()
+        with pytest.raises(A2AError) as exc_info:
+            await client.wait_for_completion(
+                target_agent="location",
+                task_id="task-123",
+                poll_interval=0.1,
+                max_wait=0.2
+            )
+        
+        assert exc_info.value.code == "A2A_TIMEOUT"
+        assert time.monotonic() - start < 1.0
+    
+    @pytest.mark.asyncio
+    async def test_http_client_reused_across_calls(self, mock_a2a_success_response):
+        """Test one pooled httpx client serves multiple requests."""
+        from services.a2a_client import A2AClient
+        
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_response = MagicMock()
+            mock_response.content = json.dumps(mock_a2a_success_response).encode()
+            mock_response.raise_for_status = MagicMock()
+            
+            mock_client.return_value.is_closed = False
+            mock_client.return_value.post = AsyncMock(return_value=mock_response)
+            mock_client.return_value.aclose = AsyncMock()
+            
+            async with A2AClient(base_url="http://localhost:5001") as client:
+                await client.send_task(target_agent="location", message={})
+                await client.get_task_status(target_agent="location", task_id="task-123")
+            
+            assert mock_client.call_count == 1
+            assert mock_client.return_value.post.await_count == 2
+            mock_client.return_value.aclose.assert_awaited_once()
+    
+    def test_http_client_from_closed_loop_is_dropped(self):
+        """Test a client left on a closed event loop is replaced, not reused."""
+        from services.a2a_client import A2AClient
+        
+        client = A2AClient(base_url="http://localhost:5001")
+        
+        async def get_client():
+            return client._get_client()
+        
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+        
+        assert second is not first
+        assert client._client is second
+        asyncio.run(client.aclose())
+    
+    @pytest.mark.asyncio
+    async def test_send_tasks_bulk(self, mock_a2a_success_response):
+        """Test bulk send returns per-call results and errors in order."""
+        from services.a2a_client import A2AClient
+        from config.errors import A2AError
+        
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_response = MagicMock()
+            mock_response.content = json.dumps(mock_a2a_success_response).encode()
+            mock_response.raise_for_status = MagicMock()
+            
+            mock_client.return_value.is_closed = False
+            mock_client.return_value.post = AsyncMock(side_effect=[
+                mock_response,
+                httpx.ConnectError("Connection refused"),
+                mock_response,
+            ])
+            
+            client = A2AClient(base_url="http://localhost:5001")
+            results = await client.send_tasks_bulk([
+                ("location", {"estimate_id": "est-123"}, "est-123"),
+                ("scope", {"estimate_id": "est-123"}, None),
+                ("cost", {"estimate_id": "est-123"}, "est-123"),
+            ])
+            
+            assert results[0] == mock_a2a_success_response
+            assert isinstance(results[1], A2AError)
+            assert results[2] == mock_a2a_success_response
+            assert mock_client.call_count == 1
+    
     @pytest.mark.asyncio
     async def test_send_task_connection_error(self):
         """Test task send connection error handling."""
@@ -98,7 +228,7 @@ class TestA2AClient:
         from config.errors import A2AError
         
         with patch('httpx.AsyncClient') as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 side_effect=httpx.ConnectError("Connection refused")
             )
             
@@ -119,10 +249,10 @@ class TestA2AClient:
         
         with patch('httpx.AsyncClient') as mock_client:
             mock_response = MagicMock()
-            mock_response.json.return_value = mock_a2a_success_response
+            mock_response.content = json.dumps(mock_a2a_success_response).encode()
             mock_response.raise_for_status = MagicMock()
             
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
             
@@ -161,10 +291,10 @@ class TestA2AClient:
         
         with patch('httpx.AsyncClient') as mock_client:
             mock_response = MagicMock()
-            mock_response.json.return_value = mock_a2a_success_response
+            mock_response.content = json.dumps(mock_a2a_success_response).encode()
             mock_response.raise_for_status = MagicMock()
             
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
             
@@ -197,10 +327,10 @@ class TestA2AClient:
         
         with patch('httpx.AsyncClient') as mock_client:
             mock_response = MagicMock()
-            mock_response.json.return_value = working_response
+            mock_response.content = json.dumps(working_response).encode()
             mock_response.raise_for_status = MagicMock()
             
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
             
@@ -17,7 +17,12 @@ from models.cost_estimate import (
     CostConfidenceLevel,
 )
 from models.bill_of_quantities import TradeCategory
-from services.cost_data_service import CostDataService
+from services.cost_data_service import (
+    CostDataService,
+    lookup_cost_codes_by_division,
+    lookup_cost_codes_by_keyword,
+    lookup_cost_codes_by_prefix,
+)
 from agents.primary.cost_agent import CostAgent
 from agents.scorers.cost_scorer import CostScorer
 from agents.critics.cost_critic import CostCritic
@@ -72,7 +77,14 @@ class TestCostRangeModel:
         assert cr.low == 0.0
         assert cr.medium == 0.0
         assert cr.high == 0.0
-    
+
+    def test_cost_range_zero_is_shared_and_frozen(self):
+        """Test zero() returns one immutable instance."""
+        cr = CostRange.zero()
+        assert CostRange.zero() is cr
+        with pytest.raises(ValueError):
+            cr.low = 5.0
+
     def test_cost_range_addition(self):
         """Test adding two cost ranges."""
         cr1 = CostRange(low=100.0, medium=115.0, high=125.0)
@@ -164,6 +176,141 @@ class TestCostDataServiceMaterialCost:
         assert abs(unit_cost.medium / unit_cost.low - 1.15) < 0.01
         assert abs(unit_cost.high / unit_cost.low - 1.25) < 0.01
 
+    @pytest.mark.asyncio
+    async def test_sync_lookups_match_async_api(self):
+        """Test the sync bodies return what the async methods return."""
+        service = CostDataService()
+
+        assert service._get_material_cost_sync("06-4100-0100") == (
+            await service.get_material_cost("06-4100-0100")
+        )
+        assert service._get_cost_code_sync("base cabinets", "06") == (
+            await service.get_cost_code("base cabinets", "06")
+        )
+        assert service._get_equipment_cost_sync("scaffold", 2) == (
+            await service.get_equipment_cost("scaffold", 2)
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_material_cost_secondary_trades_are_enums(self):
+        """Test secondary trades come back as a fresh list of enums."""
+        service = CostDataService()
+        first = await service.get_material_cost("11-3100-0200")
+        first["secondary_trades"].clear()
+        second = await service.get_material_cost("11-3100-0200")
+
+        assert second["secondary_trades"]
+        assert all(isinstance(t, TradeCategory) for t in second["secondary_trades"])
+
+    @pytest.mark.asyncio
+    async def test_get_cost_code_subdivision_returns_first_entry(self):
+        """Test that a shared subdivision resolves to its first cost code."""
+        service = CostDataService()
+        result = await service.get_cost_code(
+            item_description="appliance",
+            division_code="11",
+            subdivision_code="11 31 00"
+        )
+
+        assert result["cost_code"] == "11-3100-0100"
+        assert result["confidence"] == 0.95
+
+    @pytest.mark.asyncio
+    async def test_get_cost_code_generic_fallback(self):
+        """Test unmatched items fall back to the division's generic code."""
+        service = CostDataService()
+        result = await service.get_cost_code("zzz", "22")
+
+        assert result["cost_code"] == "GEN-22-001"
+        assert result["description"] == "General 22 work item"
+        assert result["primary_trade"] == "plumber"
+        assert result["material_cost_per_unit"] == 75.0
+        assert result["source"] == "inferred"
+
+    def test_fuzzy_score_lowercases_keywords_of_adhoc_entries(self):
+        """Test fuzzy scoring of entries without precomputed keywords."""
+        service = CostDataService()
+        code_data = {"keywords": ["Granite", "Countertop", "quartz", "slab"]}
+
+        score = service._calculate_fuzzy_score("granite countertop", code_data)
+
+        assert score == 0.5
+
+    @pytest.mark.asyncio
+    async def test_get_cost_code_matches_keyword_inside_plural(self):
+        """Test that keyword candidates still match as substrings."""
+        service = CostDataService()
+        result = await service.get_cost_code(
+            item_description="Install new base cabinets",
+            division_code="06"
+        )
+
+        assert result["cost_code"].startswith("06-")
+        assert result["source"] == "rsmeans"
+
+
+class TestCostDataServiceEquipmentCost:
+    """Test CostDataService.get_equipment_cost()."""
+
+    @pytest.mark.asyncio
+    async def test_get_equipment_cost_normalizes_type(self):
+        """Test that mixed-case, spaced types match the rate table."""
+        service = CostDataService()
+        result = await service.get_equipment_cost("Dumpster 20yd", duration_days=3)
+
+        assert result["daily_rate"].low == 550.0
+        assert result["total_cost"].low == 1650.0
+
+    @pytest.mark.asyncio
+    async def test_get_equipment_cost_unknown_type_uses_default(self):
+        """Test the default daily rate for unknown equipment."""
+        service = CostDataService()
+        result = await service.get_equipment_cost("excavator")
+
+        assert result["daily_rate"].low == 100.0
+
+
+class TestCostCodeLookups:
+    """Test the keyword and division indexes over the mock cost codes."""
+
+    def test_lookup_by_keyword_matches_words_of_keywords(self):
+        """Test whole keywords and their words match, case-insensitively."""
+        by_phrase = lookup_cost_codes_by_keyword("Floor Protection")
+        by_word = lookup_cost_codes_by_keyword("protection")
+
+        assert [c["code"] for c in by_phrase] == ["01-5600-0100"]
+        assert by_word == by_phrase
+        assert lookup_cost_codes_by_keyword("prot") == []
+
+    def test_lookup_by_keyword_returns_each_code_once(self):
+        """Test a word shared by several keywords of one code is not repeated."""
+        codes = [c["code"] for c in lookup_cost_codes_by_keyword("cabinet")]
+
+        assert codes
+        assert len(codes) == len(set(codes))
+
+    def test_lookup_by_prefix_completes_partial_keywords(self):
+        """Test prefix lookups cover every code with a matching term."""
+        cabinets = lookup_cost_codes_by_prefix("Cabi")
+        codes = [c["code"] for c in cabinets]
+
+        assert len(codes) == len(set(codes))
+        assert {c["code"] for c in lookup_cost_codes_by_keyword("cabinet")} <= set(codes)
+        assert lookup_cost_codes_by_prefix("cabinet") == lookup_cost_codes_by_prefix("CABINET")
+
+    def test_lookup_by_prefix_unknown_or_blank(self):
+        """Test unknown and blank prefixes match nothing."""
+        assert lookup_cost_codes_by_prefix("zzq") == []
+        assert lookup_cost_codes_by_prefix("  ") == []
+
+    def test_lookup_by_division(self):
+        """Test division lookups return only that division, unknown is empty."""
+        cabinets = lookup_cost_codes_by_division("06")
+
+        assert cabinets
+        assert all(c["division"] == "06" for c in cabinets)
+        assert lookup_cost_codes_by_division("99") == []
+
 
 class TestCostDataServiceLaborRate:
     """Test CostDataService.get_labor_rate()."""
@@ -205,6 +352,19 @@ class TestCostDataServiceLaborRate:
         assert abs(rate.medium / rate.low - 1.12) < 0.01
         assert abs(rate.high / rate.low - 1.20) < 0.01
 
+    @pytest.mark.asyncio
+    async def test_trade_rate_maps_to_closest_location_rate(self):
+        """Test related trades reuse location rates, welders at a premium."""
+        service = CostDataService()
+        location = await service.get_location_factors("80202")
+        labor_rates = location.labor_rates
+
+        mason = service._get_trade_rate_from_location(TradeCategory.MASON, location)
+        welder = service._get_trade_rate_from_location(TradeCategory.WELDER, location)
+
+        assert mason == labor_rates.concrete_finisher
+        assert welder == labor_rates.carpenter * 1.2
+
 
 # =============================================================================
 # LINE ITEM COST CALCULATION TESTS
@@ -10,6 +10,7 @@ Tests AC 4.2.1:
 Uses pytest and pytest-asyncio for async testing.
 """
 
+import dataclasses
 import pytest
 import sys
 import os
@@ -23,9 +24,13 @@ from services.cost_data_service import (
     ItemNotFoundError,
     get_material_cost,
     get_labor_rate,
+    get_labor_rates_bulk,
     search_materials,
     MATERIAL_DATA,
     clear_location_cache,
+    material_indices,
+    materials_by_indices,
+    material_indices_where,
 )
 
 
@@ -114,6 +119,48 @@ async def test_get_material_cost_cabinet_specific(cabinet_item_code):
     assert result.labor_hours > 0
 
 
+@pytest.mark.asyncio
+async def test_get_material_cost_returns_shared_frozen_instance(valid_item_code):
+    """Local materials are prebuilt once and cannot be mutated by callers."""
+    first = await get_material_cost(valid_item_code)
+    second = await get_material_cost(valid_item_code)
+
+    assert first is second
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.unit_cost = 0.0
+
+
+def test_materials_by_indices_matches_material_data():
+    """Vectorized material columns line up with MATERIAL_DATA rows."""
+    codes = ["123200", "092900"]
+    cols = materials_by_indices(material_indices(codes))
+
+    assert cols["item_code"].tolist() == codes
+    for field in ("unit_cost", "labor_hours", "cost_low", "cost_likely", "cost_high"):
+        assert cols[field].tolist() == [MATERIAL_DATA[c][field] for c in codes]
+
+
+def test_material_indices_where_filters_division_and_cost():
+    """Range query matches a plain scan of MATERIAL_DATA."""
+    indices = material_indices_where(csi_division="09", max_unit_cost=5.0)
+    codes = materials_by_indices(indices)["item_code"].tolist()
+
+    expected = [
+        code for code, data in MATERIAL_DATA.items()
+        if data["csi_division"] == "09" and data["unit_cost"] <= 5.0
+    ]
+    assert codes == expected
+    assert len(material_indices_where()) == len(MATERIAL_DATA)
+
+
+def test_material_indices_raises_item_not_found(invalid_item_code):
+    """Unknown item codes raise ItemNotFoundError."""
+    with pytest.raises(ItemNotFoundError) as exc_info:
+        material_indices(["092900", invalid_item_code])
+
+    assert exc_info.value.item_code == invalid_item_code
+
+
 # =============================================================================
 # Test: AC 4.2.1 - get_material_cost raises ItemNotFoundError
 # =============================================================================
@@ -170,6 +217,14 @@ async def test_search_materials_with_csi_filter():
     assert all(r.csi_division == "12" for r in results)
 
 
+@pytest.mark.asyncio
+async def test_search_materials_unknown_csi_division():
+    """AC 4.2.1: search_materials returns nothing for an unknown CSI division."""
+    results = await search_materials("", csi_division="99")
+
+    assert results == []
+
+
 @pytest.mark.asyncio
 async def test_search_materials_respects_limit():
     """AC 4.2.1: search_materials respects limit parameter."""
@@ -245,6 +300,35 @@ async def test_get_labor_rate_non_union():
     assert abs(result.total_rate - expected) < 0.01
 
 
+@pytest.mark.asyncio
+async def test_get_labor_rate_reuses_instance():
+    """Repeated lookups for the same trade and zip share one frozen LaborRate."""
+    first = await get_labor_rate("plumber", "60601")
+    second = await get_labor_rate("plumber", "60601")
+
+    assert second is first
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.total_rate = 0.0
+
+
+@pytest.mark.asyncio
+async def test_get_labor_rates_bulk_matches_single_lookups():
+    """Bulk lookup returns the same rates as get_labor_rate, in input order."""
+    trades = ["plumber", "electrician", "roofer"]
+    results = await get_labor_rates_bulk(trades, "60601")
+
+    assert [r.trade for r in results] == trades
+    for result in results:
+        assert result == await get_labor_rate(result.trade, "60601")
+
+
+@pytest.mark.asyncio
+async def test_get_labor_rates_bulk_invalid_trade():
+    """Bulk lookup raises ValueError naming the unknown trades."""
+    with pytest.raises(ValueError, match="unknown_trade"):
+        await get_labor_rates_bulk(["plumber", "unknown_trade"], "80202")
+
+
 @pytest.mark.asyncio
 async def test_get_labor_rate_invalid_trade():
     """get_labor_rate raises ValueError for unknown trade."""
@@ -287,6 +371,20 @@ def test_material_cost_dataclass():
     assert material.cost_low < material.cost_likely < material.cost_high
 
 
+def test_build_material_cost_fills_defaults_in_field_order():
+    """Positional construction lines up with MaterialCost's fields."""
+    from services.cost_data_service import _MATERIAL_DEFAULTS, _build_material_cost
+
+    field_names = [f.name for f in dataclasses.fields(MaterialCost)]
+    assert field_names == ["item_code", *_MATERIAL_DEFAULTS]
+
+    material = _build_material_cost("X1", {"unit": "EA", "cost_high": 9.5})
+    assert material.unit == "EA"
+    assert material.cost_high == 9.5
+    assert material.productivity_factor == 1.0
+    assert material.description == ""
+
+
 def test_item_not_found_error_inheritance():
     """ItemNotFoundError is a proper Exception subclass."""
     error = ItemNotFoundError("TEST123")
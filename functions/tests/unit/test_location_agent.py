@@ -179,7 +179,22 @@ class TestCostDataService:
         # Should return regional estimate with lower confidence
         assert factors.confidence == 0.65
         assert factors.city == "Unknown"
-    
+
+    def test_regional_factors_use_state_flags(self):
+        """Test union and cost-level flags for regional estimates."""
+        service = CostDataService()
+
+        new_york = service._generate_regional_factors("12345")
+        mississippi = service._generate_regional_factors("39201")
+        colorado = service._generate_regional_factors("80500")
+
+        assert new_york.union_status == UnionStatus.UNION
+        assert new_york.location_factor == 1.15
+        assert mississippi.union_status == UnionStatus.NON_UNION
+        assert mississippi.location_factor == 0.90
+        assert colorado.union_status == UnionStatus.NON_UNION
+        assert colorado.location_factor == 1.0
+
     @pytest.mark.asyncio
     async def test_cache_works(self):
         """Test that caching works correctly."""
@@ -192,11 +207,69 @@ class TestCostDataService:
         
         assert factors1.city == factors2.city
         assert factors1.location_factor == factors2.location_factor
+
+    @pytest.mark.asyncio
+    async def test_padded_zip_is_normalized(self):
+        """Test whitespace and ZIP+4 suffixes resolve to the 5-digit entry."""
+        service = CostDataService()
+
+        clean = await service.get_location_factors("80202")
+        padded = await service.get_location_factors(" 80202-1234")
+
+        assert padded is clean
+        assert len(service._cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded_and_expires(self):
+        """Test the service cache evicts beyond maxsize and honours TTL."""
+        service = CostDataService()
+        service._cache = type(service._cache)(maxsize=2, ttl_seconds=-1)
+
+        await service.get_location_factors("80202")
+        await service.get_location_factors("10001")
+        await service.get_location_factors("77001")
+
+        assert len(service._cache) == 2
+        assert service._cache.get("77001") is None  # already expired
+    
+    @pytest.mark.asyncio
+    async def test_nearby_zips_share_metro_factors(self):
+        """Test nearby ZIPs resolve to their metro's single instance."""
+        service = CostDataService()
+        
+        denver = await service.get_location_factors("80202")
+        nearby = await service.get_location_factors("80204")
+        
+        assert nearby is denver
+    
+    def test_estimate_state_from_zip(self):
+        """Test ZIP prefix ranges, gaps between ranges, and bad input."""
+        service = CostDataService()
+        
+        assert service._estimate_state_from_zip("10001") == "NY"
+        assert service._estimate_state_from_zip("14999") == "NY"
+        assert service._estimate_state_from_zip("15000") == "PA"
+        assert service._estimate_state_from_zip("26901") == "XX"  # gap WV/NC
+        assert service._estimate_state_from_zip("99501") == "AK"
+        assert service._estimate_state_from_zip("00501") == "XX"
+        assert service._estimate_state_from_zip("ab123") == "XX"
+        assert service._estimate_state_from_zip("12") == "XX"
+        assert service._estimate_state_from_zip("\u00b2\u00b2\u00b245") == "XX"  # superscript digits
+    
+    def test_regional_weather_is_prebuilt(self):
+        """Test regional weather is shared and unknown regions use national."""
+        service = CostDataService()
+        
+        mountain = service._get_regional_weather(Region.MOUNTAIN)
+        
+        assert service._get_regional_weather(Region.MOUNTAIN) is mountain
+        assert mountain.frost_line_depth_inches == 36
+        assert service._get_regional_weather(None) is service._get_regional_weather(Region.NATIONAL)
     
     def test_clear_cache(self):
         """Test cache clearing."""
         service = CostDataService()
-        service._cache["80202"] = DENVER_LOCATION_FACTORS
+        service._cache.set("80202", DENVER_LOCATION_FACTORS)
         
         service.clear_cache()
         
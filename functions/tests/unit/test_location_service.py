@@ -13,9 +13,11 @@ Tests AC 4.1.1 through AC 4.1.7:
 Uses pytest and pytest-asyncio for async testing.
 """
 
+import math
 import pytest
 import time
 import asyncio
+from collections.abc import Mapping
 from unittest.mock import patch, AsyncMock
 
 # Import the service under test
@@ -31,10 +33,17 @@ from services.cost_data_service import (
     WeatherFactors,
     LaborRate,
     get_location_factors,
+    get_location_factors_many,
+    get_location_factors_sync,
+    warm_location_cache,
     clear_location_cache,
     get_cache_stats,
     _validate_zip_code,
     _get_region_from_zip,
+    _get_regional_default,
+    _build_location_factors,
+    LocationCache,
+    rainy_season_mask,
     REQUIRED_TRADES,
     LOCATION_DATA,
 )
@@ -100,7 +109,7 @@ async def test_valid_zip_returns_all_8_trades(denver_zip):
     result = await get_location_factors(denver_zip)
 
     assert isinstance(result, LocationFactors)
-    assert isinstance(result.labor_rates, dict)
+    assert isinstance(result.labor_rates, Mapping)
     assert len(result.labor_rates) == 8, f"Expected 8 trades, got {len(result.labor_rates)}"
 
     for trade in REQUIRED_TRADES:
@@ -178,8 +187,7 @@ async def test_permit_costs_values_valid(denver_zip):
     assert 0 < pc.base_percentage < 0.1, "base_percentage should be 0-10%"
     assert pc.minimum > 0, "minimum should be positive"
     assert pc.inspection_fee > 0, "inspection_fee should be positive"
-    if pc.maximum is not None:
-        assert pc.maximum > pc.minimum, "maximum should exceed minimum"
+    assert pc.maximum > pc.minimum, "maximum should exceed minimum"
 
 
 @pytest.mark.asyncio
@@ -405,6 +413,8 @@ def test_validate_zip_code_invalid_format():
         "12 34",  # Contains space
         "",  # Empty
         "ABCDE",  # All letters
+        "12345\n",  # Trailing newline
+        "\uff11\uff12\uff13\uff14\uff15",  # Non-ASCII (fullwidth) digits
     ]
     for zip_code in invalid_zips:
         with pytest.raises(ValueError):
@@ -474,7 +484,7 @@ def test_location_factors_dataclass():
         weather_factors=WeatherFactors(
             winter_slowdown=1.15,
             summer_premium=1.0,
-            rainy_season_months=[4, 5],
+            rainy_season_mask=rainy_season_mask([4, 5]),
             outdoor_work_adjustment=1.1,
         ),
         is_default=False,
@@ -487,15 +497,28 @@ def test_location_factors_dataclass():
     assert factors.weather_factors.winter_slowdown == 1.15
 
 
+@pytest.mark.asyncio
+async def test_location_factors_are_frozen(denver_zip):
+    """Shared LocationFactors instances cannot be mutated by a caller."""
+    import dataclasses
+
+    factors = await get_location_factors(denver_zip)
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        factors.city = "Boulder"
+    assert (await get_location_factors(denver_zip)).city == "Denver"
+
+
 def test_permit_costs_dataclass():
-    """PermitCosts dataclass with None maximum."""
+    """PermitCosts with no cap uses math.inf as maximum."""
     pc = PermitCosts(
         base_percentage=0.02,
         minimum=100.0,
-        maximum=None,
+        maximum=math.inf,
         inspection_fee=75.0,
     )
-    assert pc.maximum is None
+    assert pc.maximum == math.inf
+    assert not (1_000_000.0 > pc.maximum)
 
 
 def test_weather_factors_dataclass():
@@ -503,10 +526,25 @@ def test_weather_factors_dataclass():
     wf = WeatherFactors(
         winter_slowdown=1.0,
         summer_premium=1.0,
-        rainy_season_months=[],
+        rainy_season_mask=rainy_season_mask([]),
         outdoor_work_adjustment=1.0,
     )
     assert wf.rainy_season_months == []
+    assert not any(wf.is_rainy(m) for m in range(1, 13))
+
+
+def test_weather_factors_rainy_season_mask():
+    """rainy_season_mask round-trips months and answers is_rainy."""
+    wf = WeatherFactors(
+        winter_slowdown=1.0,
+        summer_premium=1.0,
+        rainy_season_mask=rainy_season_mask([11, 3, 4]),
+        outdoor_work_adjustment=1.0,
+    )
+    assert wf.rainy_season_months == [3, 4, 11]
+    assert wf.is_rainy(1) is False
+    assert wf.is_rainy(3) is True
+    assert wf.is_rainy(12) is False
 
 
 def test_labor_rate_dataclass():
@@ -546,6 +584,177 @@ async def test_multiple_zips_cached():
     assert get_cache_stats()["size"] == len(zips)
 
 
+@pytest.mark.asyncio
+async def test_get_location_factors_many_batches_misses():
+    """Batch lookup dedupes, serves known zips locally, and reads misses in one call."""
+    mock_lookup = AsyncMock(return_value={"12345": None, "00000": None})
+    with patch("services.cost_data_service._lookup_firestore_many", mock_lookup):
+        results = await get_location_factors_many(["80202", "12345", "80202", "00000"])
+
+    mock_lookup.assert_awaited_once_with(["12345", "00000"])
+    assert list(results) == ["80202", "12345", "00000"]
+    assert results["80202"].city == "Denver"
+    assert results["12345"].is_default is True
+    assert get_cache_stats()["size"] == 3
+
+
+@pytest.mark.asyncio
+async def test_get_location_factors_many_invalid_zip():
+    """Batch lookup rejects invalid zips like the single lookup."""
+    with pytest.raises(ValueError):
+        await get_location_factors_many(["80202", "1234"])
+
+
+def test_get_location_factors_sync_reuses_loop(denver_zip):
+    """Sync wrapper returns cached results from one long-lived loop."""
+    import services.cost_data_service as cds
+
+    first = get_location_factors_sync(denver_zip)
+    loop = cds._sync_loop
+    second = get_location_factors_sync(denver_zip)
+
+    assert first.city == "Denver"
+    assert second is first
+    assert cds._sync_loop is loop and loop.is_running()
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_logged_through_stdlib(denver_zip, caplog):
+    """Cache hits are logged through the stdlib logger when INFO is enabled."""
+    await get_location_factors(denver_zip)
+
+    with caplog.at_level("INFO", logger="services.cost_data_service"):
+        await get_location_factors(denver_zip)
+
+    assert "location_lookup zip_code=80202 data_source=cache" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_lookup():
+    """Concurrent lookups of the same cold zip make a single Firestore call."""
+    import services.cost_data_service as cds
+
+    async def slow_lookup(zip_code):
+        await asyncio.sleep(0.01)
+        return None, None
+
+    mock_lookup = AsyncMock(side_effect=slow_lookup)
+    with patch("services.cost_data_service._lookup_firestore", mock_lookup):
+        results = await asyncio.gather(*[get_location_factors("12345") for _ in range(10)])
+
+    mock_lookup.assert_awaited_once_with("12345")
+    assert all(result is results[0] for result in results)
+    assert results[0].is_default is True
+    assert cds._location_inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_fallback_lookup_logs_single_event(unknown_zip):
+    """A fallback lookup emits one location_lookup event carrying the region."""
+    from structlog.testing import capture_logs
+
+    with patch("services.cost_data_service._lookup_firestore", AsyncMock(return_value=(None, None))):
+        with capture_logs() as logs:
+            await get_location_factors(unknown_zip)
+
+    events = [log for log in logs if log["event"].startswith("location_")]
+    assert len(events) == 1
+    assert events[0]["data_source"] == "default"
+    assert events[0]["is_default"] is True
+    assert events[0]["region"] == _get_region_from_zip(unknown_zip)
+
+
+@pytest.mark.asyncio
+async def test_warm_location_cache():
+    """Warm-up caches every bundled zip plus requested extras."""
+    mock_lookup = AsyncMock(return_value={"12345": None})
+    with patch("services.cost_data_service._lookup_firestore_many", mock_lookup):
+        count = await warm_location_cache(["12345", "80202"])
+
+    assert count == len(LOCATION_DATA) + 1
+    assert get_cache_stats()["size"] == count
+    mock_lookup.assert_awaited_once_with(["12345"])
+
+
+def test_location_cache_evicts_oldest_insertion():
+    """Once full, the cache evicts the oldest inserted zip (FIFO)."""
+    cache = LocationCache(maxsize=2)
+    denver = _get_regional_default("80202")
+    cache.set("80202", denver)
+    cache.set("10001", _get_regional_default("10001"))
+
+    # Hits do not refresh position; Denver is still the oldest
+    assert cache.get("80202") is denver
+    cache.set("60601", _get_regional_default("60601"))
+
+    assert cache.get("80202") is None
+    assert cache.get("10001") is not None
+    assert cache.get("60601") is not None
+    assert len(cache) == 2
+
+
+def test_location_cache_update_keeps_slot():
+    """Re-setting a cached zip replaces its data without evicting others."""
+    cache = LocationCache(maxsize=2)
+    cache.set("80202", _get_regional_default("80202"))
+    cache.set("10001", _get_regional_default("10001"))
+    newer = _get_regional_default("80202")
+    cache.set("80202", newer)
+
+    assert cache.get("80202") is newer
+    assert cache.get("10001") is not None
+    assert len(cache) == 2
+
+
+def test_location_cache_expires_entries():
+    """Entries older than the TTL are not returned, but stay for revalidation."""
+    cache = LocationCache(ttl_seconds=0)
+    denver = _get_regional_default("80202")
+    cache.set("80202", denver, version="v1")
+    time.sleep(0.01)
+
+    assert cache.get("80202") is None
+    assert cache.get_stale("80202") == (denver, "v1")
+
+    # Refreshing reuses the zip's slot
+    cache.set("80202", denver, version="v2")
+    cache.set("10001", _get_regional_default("10001"))
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_revalidated_by_update_time():
+    """An unchanged Firestore document reuses the expired entry's object."""
+    import services.cost_data_service as cds
+
+    doc = (dict(LOCATION_DATA["80202"]), "2026-01-01T00:00:00Z")
+    cache = LocationCache(ttl_seconds=0)
+    with patch.object(cds, "_location_cache", cache), \
+            patch.object(cds, "_lookup_firestore", AsyncMock(return_value=doc)):
+        first = await cds._fetch_location_factors("12345", time.perf_counter())
+        time.sleep(0.01)
+        second = await cds._fetch_location_factors("12345", time.perf_counter())
+
+        changed = (dict(LOCATION_DATA["80202"]), "2026-02-01T00:00:00Z")
+        cds._lookup_firestore.return_value = changed
+        time.sleep(0.01)
+        third = await cds._fetch_location_factors("12345", time.perf_counter())
+
+    assert second is first
+    assert third is not first
+
+
+def test_location_cache_expires_defaults_sooner():
+    """Regional-default fallbacks use the shorter default TTL."""
+    cache = LocationCache(ttl_seconds=3600, default_ttl_seconds=0)
+    cache.set("12345", _get_regional_default("12345"))
+    cache.set("80202", _build_location_factors("80202", LOCATION_DATA["80202"]))
+    time.sleep(0.01)
+
+    assert cache.get("12345") is None
+    assert cache.get("80202") is not None
+
+
 # =============================================================================
 # Test: Edge Cases
 # =============================================================================
@@ -563,6 +772,96 @@ async def test_same_zip_multiple_calls():
     assert all(r == results[0] for r in results)
 
 
+@pytest.mark.asyncio
+async def test_static_labor_rates_are_read_only():
+    """Built-in location data cannot be mutated through a lookup result."""
+    result = await get_location_factors("80202")
+    with pytest.raises(TypeError):
+        result.labor_rates["electrician"] = 0.0
+
+    assert LOCATION_DATA["80202"]["labor_rates"]["electrician"] == result.labor_rates["electrician"]
+
+
+@pytest.mark.asyncio
+async def test_labor_rates_array_matches_required_trades():
+    """labor_rates_array holds labor_rates in REQUIRED_TRADES order."""
+    result = await get_location_factors("80202")
+
+    assert result.labor_rates_array.tolist() == [result.labor_rates[t] for t in REQUIRED_TRADES]
+    assert not result.labor_rates_array.flags.writeable
+
+    fallback = await get_location_factors("00001")
+    assert fallback.labor_rates_array.tolist() == [fallback.labor_rates[t] for t in REQUIRED_TRADES]
+
+
+@pytest.mark.asyncio
+async def test_permit_fee_clamps_to_min_and_max(denver_zip):
+    """permit_fee applies the percentage within [minimum, maximum] plus inspection."""
+    result = await get_location_factors(denver_zip)
+    pc = result.permit_costs
+
+    assert result.permit_fee(0.0) == pc.minimum + pc.inspection_fee
+    assert result.permit_fee(1e9) == pc.maximum + pc.inspection_fee
+    mid = (pc.minimum + pc.maximum) / 2 / pc.base_percentage
+    assert result.permit_fee(mid) == pytest.approx(mid * pc.base_percentage + pc.inspection_fee)
+
+
+def test_firestore_client_created_once():
+    """The Firestore client is created on first use and then reused."""
+    import services.cost_data_service as cds
+
+    sentinel = object()
+    with patch.object(cds, "_firestore_client", None), \
+            patch("firebase_admin.firestore.client", return_value=sentinel) as mock_client:
+        assert cds._get_firestore_client() is sentinel
+        assert cds._get_firestore_client() is sentinel
+
+    mock_client.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_lookup_without_firebase_uses_local_data(denver_zip):
+    """Without firebase_admin, lookups return local data without a client."""
+    import services.cost_data_service as cds
+
+    with patch.object(cds, "_HAS_FIRESTORE", False), \
+            patch.object(cds, "_get_firestore_client") as mock_client:
+        data, update_time = await cds._lookup_firestore(denver_zip)
+        assert data is LOCATION_DATA[denver_zip] and update_time is None
+        assert await cds._lookup_firestore("00000") == (None, None)
+
+    mock_client.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_firestore_reads_run_on_dedicated_pool():
+    """Document reads run on the firestore thread pool, not the default executor."""
+    import threading
+    from unittest.mock import MagicMock
+    import services.cost_data_service as cds
+
+    thread_names = []
+
+    def fake_get():
+        thread_names.append(threading.current_thread().name)
+        return MagicMock(exists=True, to_dict=lambda: {"city": "Test City"}, update_time=1)
+
+    db = MagicMock()
+    db.collection.return_value.document.return_value.get = fake_get
+    with patch.object(cds, "_HAS_FIRESTORE", True), \
+            patch.object(cds, "_get_firestore_client", return_value=db):
+        assert await cds._lookup_firestore("12345") == ({"city": "Test City"}, 1)
+
+    assert thread_names[0].startswith("firestore")
+
+
+def test_missing_permit_cap_becomes_inf():
+    """Firestore data without a permit maximum is stored as uncapped (inf)."""
+    factors = _build_location_factors("12345", {"permit_costs": {"minimum": 100.0}})
+    assert factors.permit_costs.maximum == math.inf
+    assert factors.permit_fee(1e9) == 1e9 * 0.02 + 100.0
+
+
 @pytest.mark.asyncio
 async def test_boundary_zip_codes():
     """Test boundary zip codes."""
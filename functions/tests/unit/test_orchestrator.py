@@ -195,6 +195,22 @@ class TestPipelineOrchestrator:
         assert orchestrator.firestore == mock_firestore
         assert orchestrator.a2a == mock_a2a_client
     
+    @pytest.mark.asyncio
+    async def test_aclose_only_closes_owned_a2a_client(self, mock_firestore, mock_a2a_client):
+        """Test aclose leaves an injected A2A client open but closes its own."""
+        mock_a2a_client.aclose = AsyncMock()
+        injected = PipelineOrchestrator(
+            firestore_service=mock_firestore,
+            a2a_client=mock_a2a_client
+        )
+        await injected.aclose()
+        mock_a2a_client.aclose.assert_not_awaited()
+        
+        owned = PipelineOrchestrator(firestore_service=mock_firestore)
+        owned.a2a.aclose = AsyncMock()
+        await owned.aclose()
+        owned.a2a.aclose.assert_awaited_once()
+    
     @pytest.mark.asyncio
     async def test_run_pipeline_success(
         self,
@@ -502,6 +518,7 @@ class TestConvenienceFunction:
                 status="completed",
                 completed_agents=AGENT_SEQUENCE
             ))
+            mock_instance.aclose = AsyncMock()
             mock_class.return_value = mock_instance
             
             result = await run_deep_pipeline(
@@ -511,6 +528,7 @@ class TestConvenienceFunction:
             
             assert result.success is True
             mock_instance.run_pipeline.assert_called_once()
+            mock_instance.aclose.assert_awaited_once()
 
 
 
@@ -10,6 +10,7 @@ Tests cover:
 - Final Agent, Scorer, Critic
 """
 
+import numpy as np
 import pytest
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -19,7 +20,8 @@ from pydantic import ValidationError
 from models.risk_analysis import (
     RiskFactor, MonteCarloResult, PercentileValues, DistributionStatistics,
     ContingencyRecommendation, RiskAnalysis, RiskAnalysisSummary,
-    RiskCategory, RiskImpact, ConfidenceLevel
+    RiskCategory, RiskImpact, ConfidenceLevel, risk_factor_arrays,
+    load_risk_factors
 )
 from models.timeline import (
     TimelineTask, ProjectTimeline, CriticalPath, Milestone,
@@ -33,7 +35,9 @@ from models.final_estimate import (
 )
 
 # Services
-from services.monte_carlo_service import MonteCarloService
+from services.monte_carlo_service import (
+    MonteCarloService, HISTOGRAM_BINS, histogram_bin_counts
+)
 
 # Agents
 from agents.primary.risk_agent import RiskAgent
@@ -122,6 +126,50 @@ class TestRiskFactorModel:
         )
         # Expected = 0.5 * ((200 + 400) / 2) = 0.5 * 300 = 150
         assert rf.expected_impact() == 150
+    
+    def test_load_risk_factors_trusted_matches_validated(self):
+        """Test trusted loading skips validation but builds equal models."""
+        stored = [
+            {
+                "id": "RF001",
+                "name": "Test",
+                "description": "Test",
+                "category": "material_cost",
+                "impact": "high",
+                "probability": 0.5,
+                "cost_impact_low": 200,
+                "cost_impact_high": 400,
+                "variance_contribution": 0.25,
+            }
+        ]
+        trusted = load_risk_factors(stored, trusted=True)
+        validated = load_risk_factors(stored)
+        
+        assert trusted == validated
+        assert trusted[0].category is RiskCategory.MATERIAL_COST
+    
+    def test_load_risk_factors_untrusted_validates(self):
+        """Test untrusted loading still rejects invalid impacts."""
+        with pytest.raises(ValidationError):
+            load_risk_factors([{
+                "id": "RF001",
+                "name": "Test",
+                "description": "Test",
+                "category": "material_cost",
+                "impact": "high",
+                "probability": 0.5,
+                "cost_impact_low": 1000,
+                "cost_impact_high": 500,
+            }])
+    
+    def test_risk_factor_arrays(self):
+        """Test SoA split keeps risk factor order."""
+        factors = MonteCarloService(seed=1).generate_risk_factors(base_cost=10000)
+        probs, lows, highs = risk_factor_arrays(factors)
+        
+        assert probs.tolist() == [f.probability for f in factors]
+        assert lows.tolist() == [f.cost_impact_low for f in factors]
+        assert highs.tolist() == [f.cost_impact_high for f in factors]
 
 
 class TestPercentileValues:
@@ -174,6 +222,43 @@ class TestMonteCarloResult:
         )
         # P90 / P50 = 36000 / 30000 = 1.2
         assert result.get_range_spread() == 1.2
+        assert result.range_spread == 1.2
+    
+    def test_derived_ratios_serialized(self):
+        """Test computed ratios appear in model_dump output."""
+        result = MonteCarloResult(
+            iterations=1000,
+            percentiles=PercentileValues(
+                p10=25000, p25=27000, p50=30000, p75=32000, p80=33000, p90=36000, p95=38000
+            ),
+            statistics=DistributionStatistics(
+                min=24000, max=40000, mean=30000, std_dev=3000, median=30000
+            )
+        )
+        dumped = result.model_dump()
+        assert dumped["range_spread"] == 1.2
+        assert dumped["coefficient_of_variation"] == 0.1
+    
+    def test_derived_ratios_follow_model_copy(self):
+        """Test ratios reflect updated fields and the result cannot be mutated."""
+        result = MonteCarloResult(
+            iterations=1000,
+            percentiles=PercentileValues(
+                p10=25000, p25=27000, p50=30000, p75=32000, p80=33000, p90=36000, p95=38000
+            ),
+            statistics=DistributionStatistics(
+                min=24000, max=40000, mean=30000, std_dev=3000, median=30000
+            )
+        )
+        assert result.range_spread == 1.2
+        
+        updated = result.model_copy(update={
+            "percentiles": result.percentiles.model_copy(update={"p90": 90000})
+        })
+        assert updated.range_spread == 3.0
+        
+        with pytest.raises(ValidationError):
+            result.iterations = 2000
 
 
 # =============================================================================
@@ -214,6 +299,56 @@ class TestMonteCarloService:
         assert result.percentiles.p50 > 0
         assert result.percentiles.p50 <= result.percentiles.p80 <= result.percentiles.p90
     
+    @pytest.mark.asyncio
+    async def test_run_simulation_reproducible_with_seed(self):
+        """Test same seed gives same results and variance contributions."""
+        runs = []
+        for _ in range(2):
+            service = MonteCarloService(seed=7)
+            factors = service.generate_risk_factors(base_cost=30000)
+            result = await service.run_simulation(
+                base_cost=30000, risk_factors=factors, iterations=500
+            )
+            runs.append((result.percentiles, [f.variance_contribution for f in factors]))
+        
+        assert runs[0] == runs[1]
+        assert sum(runs[0][1]) == pytest.approx(1.0, abs=1e-3)
+    
+    @pytest.mark.asyncio
+    async def test_run_simulation_histogram(self, mc_service):
+        """Test histogram has one count per bin and covers every iteration."""
+        factors = mc_service.generate_risk_factors(base_cost=30000)
+        result = await mc_service.run_simulation(
+            base_cost=30000, risk_factors=factors, iterations=500
+        )
+        
+        assert len(result.histogram_bins) == HISTOGRAM_BINS + 1
+        assert len(result.histogram_counts) == HISTOGRAM_BINS
+        assert sum(result.histogram_counts) == 500
+    
+    @pytest.mark.asyncio
+    async def test_run_simulation_shared_bin_edges(self, mc_service):
+        """Test a second scenario can reuse the first scenario's edges."""
+        factors = mc_service.generate_risk_factors(base_cost=30000)
+        base = await mc_service.run_simulation(
+            base_cost=30000, risk_factors=factors, iterations=200
+        )
+        mitigated = await mc_service.run_simulation(
+            base_cost=28000, risk_factors=factors, iterations=200,
+            bin_edges=base.histogram_bins
+        )
+        
+        assert mitigated.histogram_bins == base.histogram_bins
+        assert sum(mitigated.histogram_counts) == 200
+    
+    def test_histogram_bin_counts_matches_numpy(self):
+        """Test O(n) bin counting agrees with np.histogram."""
+        values = np.random.default_rng(0).normal(100, 15, size=1000)
+        edges = np.histogram_bin_edges(values, bins=HISTOGRAM_BINS)
+        expected, _ = np.histogram(values, bins=edges)
+        
+        assert histogram_bin_counts(values, edges).tolist() == expected.tolist()
+    
     def test_calculate_contingency(self, mc_service):
         """Test contingency calculation."""
         # Create mock Monte Carlo result
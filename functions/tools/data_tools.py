@@ -24,6 +24,7 @@ All tools return structured dicts with:
 
 from typing import List, Optional
 import asyncio
+import math
 import threading
 from concurrent.futures import ThreadPoolExecutor
 
@@ -281,7 +282,8 @@ def get_location_factors(zip_code: str) -> dict:
         "permit_costs": {
             "base_percentage": base_data.permit_costs.base_percentage,
             "minimum": base_data.permit_costs.minimum,
-            "maximum": base_data.permit_costs.maximum,
+            # Uncapped permits are stored as inf; JSON has no inf, so emit null
+            "maximum": None if math.isinf(base_data.permit_costs.maximum) else base_data.permit_costs.maximum,
             "inspection_fee": base_data.permit_costs.inspection_fee,
         },
         "combined_adjustment": combined_adjustment,